@@ -13,4 +13,14 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eos_pro.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# 💡 [신규] WebSocket 요청은 실시간 변경 알림 앱으로, 나머지(HTTP)는 Django 로
+# (앱 로딩이 끝난 뒤 import 해야 모델을 쓸 수 있음)
+from main.realtime import websocket_app  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        return await websocket_app(scope, receive, send)
+    return await django_application(scope, receive, send)
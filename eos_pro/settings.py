@@ -41,6 +41,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 💡 [신규] 요청 성능 계측 - 다른 미들웨어 시간까지 포함하도록 맨 앞에 둠
+    'main.instrumentation.PerfMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -55,7 +57,8 @@ ROOT_URLCONF = 'eos_pro.urls'
 # 💡 [핵심 수정 2] TEMPLATES 경로: os.path.join으로 통일하여 Type Error 해결
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # 💡 [신규] DjangoTemplates + 렌더링 시간 계측 (main/instrumentation.py)
+        'BACKEND': 'main.instrumentation.TimedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')], # 💡 Type Error 해결
         'APP_DIRS': True,
         'OPTIONS': {
@@ -73,14 +76,25 @@ WSGI_APPLICATION = 'eos_pro.wsgi.application'
 
 
 # Database
-# 💡 [핵심 수정 3] DATABASES: 키를 소문자 'name'으로, 값은 os.path.join으로 변경
-DATABASES = {
+# 💡 [수정] DB 프로필 계층 (eos_pro/database.py) - 환경변수 EOS_DB_PROFILE 로 sqlite/postgres 선택
+# (기존 소문자 'name' 키는 Django 가 인식하지 못해 NAME 누락 오류가 났으므로 NAME 으로 정정)
+from .database import build_databases
+
+DATABASES = build_databases(BASE_DIR)
+
+
+# Cache
+# 💡 [신규] 상세 페이지 탭 캐시 (main/tabs.py) - 여러 워커 프로세스가 같은 캐시를 보도록 파일 기반 사용
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'name': os.path.join(BASE_DIR, 'db.sqlite3'), # 💡 소문자 'name' 및 os.path.join 사용
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache'),
     }
 }
 
+# 💡 [신규] 테스트는 메모리 캐시 + 임시 PDF 캐시 디렉터리 사용 (eos_pro/test_runner.py)
+TEST_RUNNER = 'eos_pro.test_runner.EosTestRunner'
+
 
 # Password validation
 # ...
@@ -118,6 +132,52 @@ STATIC_URL = '/static/'
 # 💡 [핵심 수정 4] STATIC_ROOT: os.path.join으로 통일하여 Type Error 해결
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# 💡 [신규] 업로드 파일 (견적서 첨부는 내용 해시 기반 중복 제거 저장소 사용)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+QUOTATION_STORAGE_ROOT = os.path.join(MEDIA_ROOT, 'quotations')
+
+# 큰 업로드는 메모리 대신 바로 임시 파일로 받기 (256KB 초과 시)
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
+
+# 웹서버 위임 전송 (nginx: 'X-Accel-Redirect', Apache: 'X-Sendfile') - 미설정 시 Django 가 직접 전송
+SENDFILE_HEADER = None
+SENDFILE_URL_PREFIX = '/protected/quotations/'
+
+# 💡 [신규] 발주서 PDF 디스크 캐시 (내용 해시별 파일) & 렌더링 워커 수
+PO_PDF_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'po_pdf')
+PO_PDF_WORKERS = max(1, min(4, (os.cpu_count() or 1)))
+
+# 💡 [신규] 요청 성능 계측 (main/instrumentation.py)
+# 계측할 요청 비율 (0 이면 끔, 1 이면 전체) - 계측된 요청만 Server-Timing 헤더와 eos.perf 로그가 남음
+PERF_SAMPLE_RATE = float(os.environ.get('EOS_PERF_SAMPLE_RATE', 0.1))
+PERF_STATS_WINDOW = 1000  # 뷰별 백분위 계산에 쓰는 최근 표본 수
+
+# 💡 [신규] 실시간 변경 알림 (main/realtime.py - WebSocket /ws/event/<id>/)
+# 기본 브로커는 같은 프로세스 안에서만 전달 -> ASGI 워커가 여러 개면 프로세스 간 브로커 클래스로 교체
+REALTIME_BROKER = 'main.realtime.InProcessBroker'
+REALTIME_COALESCE_MS = 30   # 이 시간 동안 들어온 변경분을 프레임 1개로 묶어 전송
+REALTIME_QUEUE_SIZE = 256   # 연결당 대기 한도 (넘치면 변경분 대신 전체 새로고침 요청)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        # 메시지가 이미 JSON 한 줄이므로 그대로 출력 (로그 수집기에서 파싱)
+        'json_line': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'perf_console': {'class': 'logging.StreamHandler', 'formatter': 'json_line'},
+    },
+    'loggers': {
+        'eos.perf': {
+            'handlers': ['perf_console'],
+            'level': os.environ.get('EOS_PERF_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # 로그인/로그아웃 후 이동할 경로
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
@@ -0,0 +1,33 @@
+"""
+테스트 실행기 (settings.TEST_RUNNER)
+
+테스트 전체에 대해 캐시 위치를 격리합니다.
+  - CACHES           : 메모리 캐시 (BASE_DIR/cache 의 개발·운영 탭 캐시를 읽거나 남기지 않음)
+  - PO_PDF_CACHE_DIR : 발주서 PDF 캐시를 임시 디렉터리에
+실행이 끝나면 임시 디렉터리는 삭제됩니다.
+"""
+
+import os
+import shutil
+import tempfile
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class EosTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._tmp_dir = tempfile.mkdtemp(prefix='eos-test-')
+        self._isolated = override_settings(
+            CACHES=TEST_CACHES,
+            PO_PDF_CACHE_DIR=os.path.join(self._tmp_dir, 'po_pdf'),
+        )
+        self._isolated.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._isolated.disable()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -1,7 +1,8 @@
 from django.contrib import admin
 # .models에서 필요한 모델들을 임포트합니다.
 # 💡 [필수 수정] Vendor, Quotation, PurchaseOrder 모델 임포트 추가
-from .models import Event, Cue, Task, Vendor, Quotation, PurchaseOrder 
+from .models import Event, Cue, Task, Vendor, Quotation, PurchaseOrder, Equipment, EquipmentReservation, Venue, VenueFeature, Exhibitor
+from .procurement import select_bid
 
 # [설정 1] 행사 상세 페이지에서 '할 일(Task)'을 같이 보여주기
 class TaskInline(admin.TabularInline):
@@ -33,6 +34,23 @@ class TaskAdmin(admin.ModelAdmin):
     list_filter = ('is_external', 'po_status', 'task_category')
     inlines = [QuotationInline] # Task 상세 페이지에서 견적서를 관리
 
+# 💡 [신규] 견적서 목록 - 선정 액션 (경쟁 견적 해제 + Task 조달 상태 자동 갱신)
+@admin.action(description="선택한 견적을 낙찰로 선정")
+def select_quotations(modeladmin, request, queryset):
+    # Task 당 하나만 선정되므로 같은 Task 의 견적이 여러 개 선택되면 최저가를 선정
+    chosen = {}
+    for quotation in queryset.order_by('task_id', 'quoted_amount'):
+        chosen.setdefault(quotation.task_id, quotation)
+    for quotation in chosen.values():
+        select_bid(quotation)
+    modeladmin.message_user(request, f"{len(chosen)}개 Task 의 견적을 선정했습니다.")
+
+class QuotationAdmin(admin.ModelAdmin):
+    list_display = ('task', 'vendor', 'quoted_amount', 'is_selected', 'created_at')
+    list_filter = ('is_selected',)
+    list_select_related = ('task', 'vendor')
+    actions = [select_quotations]
+
 # [최종 등록] 장고에게 "이거 보여줘"라고 명령
 admin.site.register(Event, EventAdmin)
 
@@ -41,5 +59,39 @@ admin.site.register(Task, TaskAdmin)
 
 # ▼▼▼ [필수 추가] Vendor 및 조달 관련 모델 등록 ▼▼▼
 admin.site.register(Vendor)
-admin.site.register(Quotation)
-admin.site.register(PurchaseOrder)
\ No newline at end of file
+admin.site.register(Quotation, QuotationAdmin)
+admin.site.register(PurchaseOrder)
+
+# 💡 [신규] 장비 재고 (보유 수량 관리) / 행사별 예약 (자동 생성 - 조회용)
+class EquipmentAdmin(admin.ModelAdmin):
+    list_display = ('name', 'category', 'owned_qty')
+    list_editable = ('owned_qty',)
+    list_filter = ('category',)
+
+class EquipmentReservationAdmin(admin.ModelAdmin):
+    list_display = ('event', 'equipment', 'quantity', 'start_date', 'end_date')
+    list_filter = ('equipment',)
+    list_select_related = ('event', 'equipment')
+
+admin.site.register(Equipment, EquipmentAdmin)
+admin.site.register(EquipmentReservation, EquipmentReservationAdmin)
+
+# 💡 [신규] 공간 도면 (외곽선 + 기둥/고정 설치물/출입문/리깅 포인트) - 한 번 등록하고 여러 행사에서 선택
+class VenueFeatureInline(admin.TabularInline):
+    model = VenueFeature
+    extra = 1
+
+class VenueAdmin(admin.ModelAdmin):
+    list_display = ('name', 'width', 'depth', 'height', 'updated_at')
+    search_fields = ('name',)
+    inlines = [VenueFeatureInline]
+
+admin.site.register(Venue, VenueAdmin)
+
+# 💡 [신규] 전시 참가사 (부스 배정 우선순위)
+class ExhibitorAdmin(admin.ModelAdmin):
+    list_display = ('name', 'event', 'booth_type', 'priority')
+    list_filter = ('booth_type',)
+    list_select_related = ('event',)
+
+admin.site.register(Exhibitor, ExhibitorAdmin)
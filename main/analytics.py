@@ -0,0 +1,104 @@
+# ==========================================
+# 포트폴리오 재무 분석 (월 / 행사 유형 / 진행 상태 / 클라이언트별 매출·지출·마진)
+# ==========================================
+# - 원본은 EventFinance 롤업 테이블 (행사당 1행, Task/Event 변경 시 시그널로 갱신)
+# - 집계는 DB 의 GROUP BY 한 번으로 처리
+# - 결과는 (작성자 + 롤업 버전 토큰 + 조건) 키로 캐시 -> 데이터가 바뀌기 전까지 쿼리 없이 응답
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from .models import Event, EventFinance, STATUS_CHOICES, TYPE_CHOICES_EVENT
+from .tab_cache import portfolio_version
+
+GROUP_FIELDS = ('month', 'event_type', 'status', 'client_name')
+DEFAULT_GROUP = ('month',)
+CACHE_TIMEOUT = 60 * 60 * 24
+
+TYPE_LABELS = dict(TYPE_CHOICES_EVENT)
+STATUS_LABELS = dict(STATUS_CHOICES)
+
+
+def parse_group(value):
+    """'month,event_type' -> ('month', 'event_type') (허용되지 않은 값은 무시, 순서 유지)"""
+    fields = [f for f in (value or '').split(',') if f in GROUP_FIELDS]
+    return tuple(dict.fromkeys(fields)) or DEFAULT_GROUP
+
+
+def _filtered(author_id, filters):
+    qs = EventFinance.objects.filter(author_id=author_id)
+    if filters.get('start'):
+        qs = qs.filter(month__gte=filters['start'])
+    if filters.get('end'):
+        qs = qs.filter(month__lte=filters['end'])
+    for field in ('event_type', 'status', 'client_name'):
+        if filters.get(field):
+            qs = qs.filter(**{field: filters[field]})
+    return qs
+
+
+def _with_margin(row):
+    revenue = row['revenue'] or 0
+    planned = row['planned_cost'] or 0
+    actual = row['actual_cost'] or 0
+    row.update({
+        'revenue': revenue,
+        'planned_cost': planned,
+        'actual_cost': actual,
+        'planned_margin': revenue - planned,
+        'actual_margin': revenue - actual,
+        'margin_rate': round((revenue - actual) / revenue * 100, 1) if revenue else 0.0,
+        'burn_rate': round(actual / planned * 100, 1) if planned else 0.0,  # 책정 예산 대비 실지출
+    })
+    return row
+
+
+def _compute(author_id, group, filters):
+    qs = _filtered(author_id, filters)
+    sums = {
+        'revenue': Sum('revenue'),
+        'planned_cost': Sum('planned_cost'),
+        'actual_cost': Sum('actual_cost'),
+        'events': Count('event'),
+        'tasks': Sum('task_count'),
+    }
+    rows = []
+    for row in qs.values(*group).annotate(**sums).order_by(*group):
+        if 'month' in row:
+            row['month'] = row['month'].strftime('%Y-%m')
+        if 'event_type' in row:
+            row['event_type_label'] = TYPE_LABELS.get(row['event_type'], row['event_type'])
+        if 'status' in row:
+            row['status_label'] = STATUS_LABELS.get(row['status'], row['status'])
+        rows.append(_with_margin(row))
+
+    totals = _with_margin(qs.aggregate(**sums))
+    totals['tasks'] = totals['tasks'] or 0
+    return {'group': list(group), 'rows': rows, 'totals': totals}
+
+
+def portfolio_summary(author_id, group=DEFAULT_GROUP, filters=None):
+    """작성자의 전체 행사 재무 요약 -> {'group', 'rows', 'totals'} (JSON 직렬화 가능)"""
+    filters = {k: v for k, v in (filters or {}).items() if v}
+    params = json.dumps({'group': group, 'filters': filters}, sort_keys=True, default=str)
+    key = 'eos:portfolio-data:{}:{}:{}'.format(
+        author_id, portfolio_version(author_id), hashlib.md5(params.encode('utf-8')).hexdigest()
+    )
+    data = cache.get(key)
+    if data is None:
+        data = _compute(author_id, group, filters)
+        cache.set(key, data, CACHE_TIMEOUT)
+    return data
+
+
+def rebuild_rollups(event_ids=None):
+    """롤업 전체(또는 일부) 재계산 - 시그널을 거치지 않은 대량 변경 이후 보정용"""
+    ids = event_ids if event_ids is not None else list(Event.objects.values_list('pk', flat=True))
+    count = 0
+    for event_id in ids:
+        EventFinance.refresh(event_id)
+        count += 1
+    return count
@@ -0,0 +1,241 @@
+# ==========================================
+# 엔드투엔드 벤치마크 (데이터 규모별)
+# ==========================================
+# - 규모(size)마다 합성 데이터를 만들고 -> 화면/쓰기/엑셀/계산기/도면을 반복 측정 -> 롤백
+#   (트랜잭션 안에서 실행하므로 DB 에 흔적이 남지 않음 - 대신 on_commit 후처리는 측정에 포함되지 않음)
+# - 캐시는 메모리 캐시로 바꿔 실행 (탭 캐시: cold = 매번 비우고 계산, warm = 캐시 적중)
+# - 결과는 JSON 으로 저장, 기준(baseline) JSON 과 p50 을 비교해 회귀(regression) 표시
+
+import platform
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import django
+import numpy as np
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import Client, override_settings
+
+from .calculators import LightingEngine, calculate_audio, calculate_space, draw_audio, draw_light, draw_space, seat_layout
+from .booths import pack_booths
+from .cloning import clone_event
+from .egress import analyze_egress
+from .illuminance import lux_grid
+from .inventory import shortfall_report
+from .schedule import event_schedule
+from .search import search_documents
+from .rigging import TRUSS_KG_PER_M, build_rig, solve_beam
+from .sightlines import analyze_sightlines
+from .models import Event, Exhibitor, Venue, VenueFeature
+from .synthetic import SyntheticGenerator, SyntheticSize
+from .tabs import TABS
+
+SIZES = {
+    'small': SyntheticSize(users=5, events_per_user=10, tasks_per_event=20, depth=2, cues_per_event=10, vendors=20),
+    'medium': SyntheticSize(users=50, events_per_user=20, tasks_per_event=60, depth=3, cues_per_event=40, vendors=100),
+    'large': SyntheticSize(users=200, events_per_user=25, tasks_per_event=150, depth=4, cues_per_event=100, vendors=300),
+}
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25  # p50 이 기준보다 25% 넘게 느려지면 회귀
+NOISE_FLOOR_MS = 2.0      # 이보다 작은 차이는 측정 오차로 보고 무시
+
+BENCH_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'eos-bench'}}
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _check(response):
+    if response.status_code >= 400:
+        raise RuntimeError(f"벤치마크 요청 실패: {response.status_code} {response.content[:200]!r}")
+    return response
+
+
+# ------------------------------------------
+# 1. 측정 항목
+# ------------------------------------------
+
+def build_cases(client, event):
+    """(이름, 1회 실행 함수) 목록 - event 는 측정 대상 사용자의 행사"""
+    task_id = event.tasks.order_by('id').values_list('id', flat=True).first()
+    detail = f'/event/{event.id}/'
+
+    def tabs():
+        for tab in TABS:
+            _check(client.get(f'{detail}tab/{tab}/'))
+
+    def tabs_cold():
+        cache.clear()
+        tabs()
+
+    def task_add():
+        _check(client.post(f'{detail}task/add/', {
+            'content': '벤치마크 Task', 'deadline': event.date - timedelta(days=3), 'task_category': 'PREPARATION',
+            'task_type': 'GENERAL', 'priority': 'MEDIUM', 'planned_budget': 100000, 'actual_cost': 0,
+            'po_status': 'ready', 'duration_days': 2,
+        }))
+
+    def task_update():
+        _check(client.post(f'/task/{task_id}/update/', {
+            'content': '벤치마크 수정', 'deadline': event.date - timedelta(days=5), 'task_category': 'PLANNING',
+            'task_type': 'GENERAL', 'priority': 'HIGH', 'planned_budget': 200000, 'actual_cost': 0,
+            'po_status': 'ready', 'duration_days': 3,
+        }))
+
+    def lighting():
+        LightingEngine(event).get_patch_data()
+
+    def rigging():
+        # 캐시를 거치지 않고 매번 트러스 풀이
+        for truss in build_rig(event)['trusses']:
+            x, p = zip(*truss['loads'])
+            solve_beam([s['x'] for s in truss['supports']], x, p, TRUSS_KG_PER_M, truss['start'], truss['end'])
+
+    # 등록 공간(기둥 격자 + 옆문) 위 좌석 배치 - 측정용 공간/행사도 롤백됨
+    venue = Venue.objects.create(name='벤치마크 홀', width=33, depth=74, height=8)
+    VenueFeature.objects.bulk_create(
+        [VenueFeature(venue=venue, kind='column', shape='circle', x=x, y=y, width=0.8)
+         for x in (8, 16.5, 25) for y in range(10, 70, 6)]
+        + [VenueFeature(venue=venue, kind='door', x=x, y=40, width=1.8) for x in (0, 33)]
+    )
+    hall = Event(seating_type='theater', venue=venue, venue_width=33, venue_depth=74, venue_height=8)
+
+    # 100m x 100m 전시장에 참가사 384개 (독립 4 / 6x3 80 / 3x3 300)
+    expo = Event(has_booth=True, has_stage=False, venue_width=100, venue_depth=100)
+    exhibitors = [Exhibitor(name=f'참가사{i:03d}', booth_type=kind, priority=i)
+                  for i, kind in enumerate(['island'] * 4 + ['6x3'] * 80 + ['3x3'] * 300)]
+
+    # 대형 리그: 조명 300대 (워시/스팟 반씩, 무대 위 무작위 위치)
+    rng = np.random.default_rng(1)
+    big_rig = [{'type': 'Wash' if k % 2 else 'Spot', 'x': float(x), 'y': float(y)}
+               for k, (x, y) in enumerate(zip(rng.uniform(-6, 6, 300), rng.uniform(-6, 3, 300)))]
+
+    # 40m 트러스 1줄: 집중하중 500개 + 지점 9개
+    truss_x, truss_p = rng.uniform(-20, 20, 500), rng.uniform(5, 30, 500)
+    truss_supports = np.linspace(-19.5, 19.5, 9)
+
+    def draw_lighting():
+        draw_light(event, LightingEngine(event).get_patch_data()[2])
+
+    return [
+        ('index', lambda: _check(client.get('/'))),
+        ('detail.shell', lambda: _check(client.get(detail))),
+        ('detail.tabs_cold', tabs_cold),
+        ('detail.tabs_warm', tabs),
+        ('task.toggle', lambda: _check(client.post(f'/task/{task_id}/toggle/'))),
+        ('task.add', task_add),
+        ('task.update', task_update),
+        ('export_excel', lambda: _check(client.get(f'{detail}export/'))),
+        ('clone', lambda: clone_event(event, event.date + timedelta(days=365))),
+        ('inventory.shortfalls', lambda: shortfall_report(event.date - timedelta(days=180), event.date + timedelta(days=180))),
+        ('search', lambda: search_documents(event.author, '케이터링 셔틀', limit=20)),
+        ('calc.space', lambda: calculate_space(event)),
+        ('calc.audio', lambda: calculate_audio(event)),
+        ('calc.lighting', lighting),
+        ('calc.schedule', lambda: event_schedule(event)),
+        ('calc.egress', lambda: analyze_egress(event)),
+        ('calc.venue_seats', lambda: seat_layout(hall)),
+        ('calc.sightlines', lambda: analyze_sightlines(event)),
+        ('calc.illuminance', lambda: lux_grid(event, LightingEngine(event).get_patch_data()[2])),
+        ('calc.illuminance_large', lambda: lux_grid(event, big_rig)),
+        ('calc.rigging', rigging),
+        ('calc.rigging_large', lambda: solve_beam(truss_supports, truss_x, truss_p, TRUSS_KG_PER_M, -20, 20)),
+        ('calc.booths', lambda: pack_booths(expo, exhibitors)),
+        ('draw.space', lambda: draw_space(event)),
+        ('draw.audio', lambda: draw_audio(event, calculate_audio(event)['specs'])),
+        ('draw.lighting', draw_lighting),
+    ]
+
+
+def measure(func, repeat):
+    """1회 예열 후 repeat 회 측정 -> 통계 (ms)"""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        'n': repeat,
+        'min_ms': round(samples[0], 2),
+        'p50_ms': round(statistics.median(samples), 2),
+        'p95_ms': round(samples[min(repeat - 1, int(repeat * 0.95))], 2),
+        'mean_ms': round(statistics.fmean(samples), 2),
+    }
+
+
+# ------------------------------------------
+# 2. 실행
+# ------------------------------------------
+
+def run_size(size, repeat=DEFAULT_REPEAT, seed=0, log=None):
+    """규모 1개: 데이터 생성 -> 측정 -> 롤백 -> {'data': 건수, 'cases': {이름: 통계}}"""
+    result = {}
+    try:
+        with transaction.atomic():
+            started = time.perf_counter()
+            generator = SyntheticGenerator(size, seed=seed, prefix='bench')
+            result['data'] = generator.run()
+            result['generate_s'] = round(time.perf_counter() - started, 2)
+
+            # 측정 대상: 첫 사용자의 첫 행사 (모든 규모에서 행사당 데이터 양이 규모 설정을 따름)
+            event = Event.objects.select_related('author').get(pk=generator.created['events'][0].pk)
+            client = Client()
+            client.force_login(event.author)
+            result['cases'] = {}
+            for name, func in build_cases(client, event):
+                result['cases'][name] = measure(func, repeat)
+                if log:
+                    log(name, result['cases'][name])
+            raise _Rollback
+    except _Rollback:
+        pass
+    return result
+
+
+def run_suite(sizes, repeat=DEFAULT_REPEAT, seed=0, log=None):
+    """sizes: {이름: SyntheticSize} -> 결과 dict (JSON 으로 저장)"""
+    results = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'sizes': {},
+    }
+    # 계측 미들웨어/파일 캐시의 영향을 빼고, 롤백된 행사 id 의 탭 캐시가 다음 실행에 남지 않도록 분리
+    with override_settings(CACHES=BENCH_CACHES, PERF_SAMPLE_RATE=0):
+        for name, size in sizes.items():
+            cache.clear()
+            results['sizes'][name] = run_size(
+                size, repeat, seed, log=(lambda case, stat, name=name: log(name, case, stat)) if log else None,
+            )
+    return results
+
+
+# ------------------------------------------
+# 3. 기준 비교
+# ------------------------------------------
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, floor_ms=NOISE_FLOOR_MS):
+    """기준보다 p50 이 threshold 비율 이상 (그리고 floor_ms 이상) 느려진 항목 목록"""
+    regressions = []
+    for size, current in results['sizes'].items():
+        base_cases = baseline.get('sizes', {}).get(size, {}).get('cases', {})
+        for case, stat in current.get('cases', {}).items():
+            base = base_cases.get(case)
+            if base is None:
+                continue
+            before, after = base['p50_ms'], stat['p50_ms']
+            if after - before > floor_ms and after > before * (1 + threshold):
+                regressions.append({
+                    'size': size, 'case': case, 'baseline_ms': before, 'current_ms': after,
+                    'ratio': round(after / before, 2) if before else None,
+                })
+    return regressions
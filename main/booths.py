@@ -0,0 +1,197 @@
+# ==========================================
+# 전시 부스 배치 / 참가사 배정 (has_booth 행사)
+# ==========================================
+# - 전시장을 3m 모듈 격자로 나눔 (배치도와 같은 좌표: 좌하단 원점, 입구 쪽 y=0, 무대 쪽 +y)
+#   가로 방향: 중앙 주 통로(MAIN_AISLE) 좌우로 RUN_MODULES 개마다 세로 통로(AISLE)
+#   세로 방향: 2줄 맞붙은 부스 띠(6m) + 통로(AISLE) 반복 / 벽에서 PERIMETER_AISLE 띄움
+#   독립 부스(island, 6x6)는 입구 쪽에 별도 구역 - 사방이 통로
+# - 무대(has_stage)가 있으면 무대 앞 통로까지 제외 / 등록 공간이면 외곽선·기둥·출입문 앞에 걸린 모듈 제외
+# - 배정: 우선순위(작은 숫자) -> 등록 순으로 1개사씩, 남은 자리 중 입구에서 가장 가까운 곳
+#   (부스 타입별 '들어갈 수 있는 자리' 마스크를 배열 연산으로 만들고 argmin - 참가사당 모듈 수만큼의 연산)
+# - 배정 후 남은 모듈은 판매 가능 3x3 부스로 표시 (전시장 최대 수용 부스 수)
+
+import math
+import string
+import time
+
+import numpy as np
+
+from .egress import event_exits
+from .instrumentation import timed
+from .venues import seat_collisions, venue_geometry
+
+MODULE = 3.0
+ISLAND = 6.0
+AISLE = 3.0
+MAIN_AISLE = 5.0
+PERIMETER_AISLE = 3.0
+RUN_MODULES = 8  # 24m 마다 세로 통로 (부스 줄이 너무 길면 돌아가는 거리가 길어짐)
+BOOTH_MODULES = {'3x3': 1, '6x3': 2}
+
+
+def _row_label(index):
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letters = string.ascii_uppercase
+    label = ''
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        label = letters[rest] + label
+    return label
+
+
+def _runs(start, end, size, run_length):
+    """[start, end) 에 size 칸을 run_length 개마다 AISLE 을 두고 채움 -> (시작 좌표, 묶음 번호)"""
+    positions, runs = [], []
+    x, run = start, 0
+    while x + size <= end + 1e-9:
+        n = min(run_length, int((end - x + 1e-9) // size))
+        positions.extend(x + size * np.arange(n))
+        runs.extend([run] * n)
+        x += n * size + AISLE
+        run += 1
+    return np.array(positions, dtype=float), np.array(runs, dtype=int)
+
+
+def _columns(event, size, run_length):
+    """중앙 주 통로 좌우로 나눈 열 위치 (오른쪽 묶음 번호는 왼쪽 다음부터)"""
+    half = event.venue_width / 2
+    left, left_runs = _runs(PERIMETER_AISLE, half - MAIN_AISLE / 2, size, run_length)
+    right, right_runs = _runs(half + MAIN_AISLE / 2, event.venue_width - PERIMETER_AISLE, size, run_length)
+    offset = left_runs.max() + 1 if len(left_runs) else 0
+    return np.concatenate([left, right]), np.concatenate([left_runs, right_runs + offset])
+
+
+def hall_grid(event, island_count=0):
+    """부스를 놓을 수 있는 자리: 모듈 격자 (행 y, 열 x, 열 묶음) + 독립 부스 자리 (x, y)"""
+    top = event.venue_depth - PERIMETER_AISLE
+    if event.has_stage:
+        top = event.venue_depth - event.stage_depth - 1.0 - AISLE  # 무대는 배치도와 같이 뒷벽에서 1m
+    y = PERIMETER_AISLE
+
+    islands = np.zeros((0, 2))
+    if island_count:
+        ix, _ = _columns(event, ISLAND, 1)  # 독립 부스마다 좌우 통로
+        if len(ix):
+            rows = math.ceil(island_count / len(ix))
+            ys = []
+            while len(ys) < rows and y + ISLAND <= top:
+                ys.append(y)
+                y += ISLAND + AISLE
+            grid_y, grid_x = np.meshgrid(ys, ix, indexing='ij')
+            islands = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+    # 2줄 맞붙은 띠 + 통로 반복 (마지막 띠는 1줄일 수 있음)
+    row_y = []
+    while y + MODULE <= top + 1e-9:
+        row_y.append(y)
+        if y + 2 * MODULE <= top + 1e-9:
+            row_y.append(y + MODULE)
+        y = row_y[-1] + MODULE + AISLE
+    col_x, col_run = _columns(event, MODULE, RUN_MODULES)
+    return {
+        'row_y': np.array(row_y, dtype=float), 'col_x': col_x, 'col_run': col_run,
+        'islands': islands,
+    }
+
+
+def _blocked(geometry, x, y, size):
+    """등록 공간 외곽선 / 장애물에 걸리는 자리 (venues.seat_collisions 재사용 - 부스를 사각형 좌석처럼 검사)"""
+    if geometry is None or not len(x):
+        return np.zeros(len(x), dtype=bool)
+    return seat_collisions({'shape': 'rect', 'unit_w': size, 'unit_d': size, 'x': x, 'y': y}, geometry)
+
+
+def _distance_to(points, x, y):
+    """각 자리 중심에서 가장 가까운 입구까지 거리"""
+    px = np.array([p['x'] for p in points])[None, :]
+    py = np.array([p['y'] for p in points])[None, :]
+    return np.hypot(x[:, None] - px, y[:, None] - py).min(axis=1)
+
+
+@timed('calc')
+def pack_booths(event, exhibitors):
+    """exhibitors: 우선순위 순 참가사 목록 -> 부스 배치 dict (booths: 배정 + 판매 가능 부스)"""
+    started = time.perf_counter()
+    exhibitors = list(exhibitors)
+    island_count = sum(1 for e in exhibitors if e.booth_type == 'island')
+    grid = hall_grid(event, island_count)
+    geometry = venue_geometry(event)
+    entrances, _ = event_exits(event, geometry)
+
+    rows, cols = len(grid['row_y']), len(grid['col_x'])
+    my, mx = np.meshgrid(grid['row_y'], grid['col_x'], indexing='ij')
+    free = ~_blocked(geometry, mx.ravel(), my.ravel(), MODULE).reshape(rows, cols)
+    score = _distance_to(entrances, mx.ravel() + MODULE / 2, my.ravel() + MODULE / 2).reshape(rows, cols)
+    # 2칸 부스: 같은 줄, 같은 묶음(통로를 넘지 않음)에 이웃한 두 모듈
+    pair_ok = grid['col_run'][:-1] == grid['col_run'][1:]
+    pair_score = (score[:, :-1] + score[:, 1:]) / 2
+
+    islands = grid['islands']
+    island_free = ~_blocked(geometry, islands[:, 0], islands[:, 1], ISLAND)
+    island_score = _distance_to(entrances, islands[:, 0] + ISLAND / 2, islands[:, 1] + ISLAND / 2) if len(islands) else np.zeros(0)
+
+    booths, unplaced = [], []
+    for exhibitor in exhibitors:
+        size = BOOTH_MODULES.get(exhibitor.booth_type)
+        if size is None:  # 독립 부스
+            candidates = np.where(island_free, island_score, np.inf)
+            best = int(candidates.argmin()) if len(candidates) else None
+            if best is None or not np.isfinite(candidates[best]):
+                unplaced.append(exhibitor)
+                continue
+            island_free[best] = False
+            x, y = islands[best]
+            booths.append({'no': f'I{best + 1:02d}', 'x': x, 'y': y, 'w': ISLAND, 'd': ISLAND,
+                           'type': 'island', 'exhibitor': exhibitor.name, 'exhibitor_id': exhibitor.pk})
+            continue
+
+        if size == 1:
+            candidates = np.where(free, score, np.inf)
+        else:
+            candidates = np.where(free[:, :-1] & free[:, 1:] & pair_ok, pair_score, np.inf)
+        if not candidates.size or not np.isfinite(candidates.min()):
+            unplaced.append(exhibitor)
+            continue
+        r, c = np.unravel_index(candidates.argmin(), candidates.shape)
+        free[r, c:c + size] = False
+        booths.append({
+            'no': f'{_row_label(r)}{c + 1:02d}', 'x': grid['col_x'][c], 'y': grid['row_y'][r],
+            'w': MODULE * size, 'd': MODULE, 'type': exhibitor.booth_type,
+            'exhibitor': exhibitor.name, 'exhibitor_id': exhibitor.pk,
+        })
+
+    # 남은 자리 = 판매 가능 부스
+    for r, c in zip(*np.nonzero(free)):
+        booths.append({'no': f'{_row_label(r)}{c + 1:02d}', 'x': grid['col_x'][c], 'y': grid['row_y'][r],
+                       'w': MODULE, 'd': MODULE, 'type': '3x3', 'exhibitor': None, 'exhibitor_id': None})
+    for i in np.nonzero(island_free)[0]:
+        x, y = islands[i]
+        booths.append({'no': f'I{i + 1:02d}', 'x': x, 'y': y, 'w': ISLAND, 'd': ISLAND,
+                       'type': 'island', 'exhibitor': None, 'exhibitor_id': None})
+
+    assigned = [b for b in booths if b['exhibitor_id'] is not None]
+    hall_area = event.venue_width * event.venue_depth
+    booth_area = sum(b['w'] * b['d'] for b in booths)
+    plan = {
+        'booths': booths,
+        'assigned': len(assigned),
+        'available': len(booths) - len(assigned),
+        'unplaced': [e.name for e in unplaced],
+        'booth_area': round(booth_area),
+        'hall_area': round(hall_area),
+        'ratio': round(booth_area / hall_area * 100, 1) if hall_area else 0,
+        'entrances': entrances,
+        'warnings': [],
+        'infos': [],
+    }
+    plan['infos'].append(
+        f"✅ 부스 {len(booths)}개 (배정 {len(assigned)} / 판매 가능 {plan['available']}) - "
+        f"부스 면적 {plan['booth_area']:,}㎡ / 전시장 {plan['hall_area']:,}㎡ ({plan['ratio']}%)"
+    )
+    if unplaced:
+        plan['warnings'].append(f"자리가 없어 배정하지 못한 참가사 {len(unplaced)}개: " + ', '.join(plan['unplaced'][:10]))
+    if not rows and not len(islands):
+        plan['warnings'].append("전시장이 좁아 부스를 배치할 수 없습니다.")
+    plan['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return plan
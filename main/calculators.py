@@ -1,10 +1,14 @@
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
 import io
 import urllib, base64
 # 💡 [필수 추가] 한글 폰트 설정을 위해 font_manager 임포트
 import matplotlib.font_manager as fm 
+from .instrumentation import timed # 💡 [신규] 요청 성능 계측 (계산 / 도면 단계 시간)
+from .venues import seat_collisions, venue_geometry # 💡 [신규] 등록 공간 도면 (기둥/출입문 등)
 
 # [중요] 서버에서 GUI 에러 방지를 위해 백엔드 설정
 plt.switch_backend('Agg')
@@ -24,6 +28,7 @@ plt.rcParams['axes.unicode_minus'] = False
 # 1. 계산 로직
 # ==========================================
 
+@timed('calc')
 def calculate_space(event):
     v_w = event.venue_width
     v_d = event.venue_depth
@@ -78,6 +83,12 @@ def calculate_space(event):
         raw_count -= rows 
         
     final_count = max(0, int(raw_count))
+    # 💡 [신규] 등록 공간 도면이 있으면 외곽선/기둥/출입문 앞에 걸린 좌석을 뺀 실제 배치 수
+    if event.venue_id:
+        layout = seat_layout(event)
+        final_count = len(layout['x'])
+        if layout['rejected']:
+            report['infos'].append(f"✅ 공간 도면 반영: 기둥/출입문 등으로 {layout['rejected']} {unit_name} 제외")
     pax = final_count * pax_per_unit
     
     report['table_count'] = final_count
@@ -87,6 +98,66 @@ def calculate_space(event):
     
     return report
 
+# 💡 [신규] 배치도(draw_space)와 같은 좌표의 객석 위치 (피난 분석 등 좌석 단위 계산에서 공용)
+# 좌표: 원점 = 공간 왼쪽 아래, y 가 클수록 무대 쪽 / rect 는 왼쪽 아래 꼭짓점, circle 은 중심
+def seat_layout(event):
+    v_w, v_d = event.venue_width, event.venue_depth
+    s_w, s_d = event.stage_width, event.stage_depth
+    mode = getattr(event, 'seating_type', 'banquet')
+
+    stage_y = v_d - s_d - 1.0
+    start_y = stage_y - 4.0
+    end_y = 4.0 if event.has_foh else 2.0
+
+    if mode == 'theater':
+        unit_w, unit_d, gap_w, gap_d, pax_per_unit = 0.5, 0.5, 0.1, 0.5, 1
+    elif mode == 'classroom':
+        unit_w, unit_d, gap_w, gap_d, pax_per_unit = 1.5, 0.6, 0.2, 1.0, 2
+    else:  # Banquet: 원형 테이블 (그림 반지름 0.8m, 의자 포함 점유 반지름 1.25m)
+        unit_w, unit_d, pax_per_unit = 0.9, 0.9, 8
+        gap_w, gap_d = event.table_gap, event.table_gap
+
+    layout = {
+        'mode': mode,
+        'shape': 'circle' if mode == 'banquet' else 'rect',
+        'unit_w': unit_w, 'unit_d': unit_d, 'gap_w': gap_w, 'gap_d': gap_d,
+        'radius': 0.8, 'occupied_radius': 1.25,
+        'pax_per_unit': pax_per_unit,
+        'stage': ((v_w - s_w) / 2, stage_y, s_w, s_d),
+        'foh': ((v_w - 6) / 2, 0.5, 6.0, 2.5) if event.has_foh else None,
+        'x': np.zeros(0), 'y': np.zeros(0),
+        'venue': venue_geometry(event), 'rejected': 0,
+    }
+    if gap_w <= 0 or gap_d <= 0:
+        return layout
+
+    if mode != 'banquet':
+        cols = max(0, int((v_w - 3.0) / (unit_w + gap_w)))
+        rows = max(0, int((start_y - end_y) / (unit_d + gap_d)))
+        total_row_width = cols * (unit_w + gap_w) - gap_w
+        xs = (v_w - total_row_width) / 2 + np.arange(cols) * (unit_w + gap_w)
+        ys = start_y - np.arange(rows) * (unit_d + gap_d)
+    else:
+        cols = max(0, int((v_w - 3.0) // gap_w))
+        rows = max(0, int((start_y - end_y) // gap_d))
+        xs = (v_w - (cols - 1) * gap_w) / 2 + np.arange(cols) * gap_w
+        ys = start_y - np.arange(rows) * gap_d
+
+    # 버진로드: 중앙 2m 폭의 열은 비움
+    if event.has_virgin_road:
+        xs = xs[np.abs(xs + unit_w / 2 - v_w / 2) >= 1.0]
+
+    grid_y, grid_x = np.meshgrid(ys, xs, indexing='ij')  # 앞줄(무대 쪽)부터 행 단위 순서
+    layout['x'], layout['y'] = grid_x.ravel(), grid_y.ravel()
+
+    # 💡 [신규] 등록 공간: 외곽선 밖 / 기둥·설치물·출입문 앞에 걸린 좌석 제외 (격자 해시 색인)
+    blocked = seat_collisions(layout, layout['venue'])
+    if blocked.any():
+        layout['x'], layout['y'] = layout['x'][~blocked], layout['y'][~blocked]
+        layout['rejected'] = int(blocked.sum())
+    return layout
+
+@timed('calc')
 def calculate_audio(event):
     v_d = event.venue_depth
     v_w = event.venue_width
@@ -101,10 +172,12 @@ def calculate_audio(event):
         array_qty = max(4, int(v_d / 5))
         specs['main'] = f"Compact Line Array {array_qty}통 x 2조"
         specs['main_type'] = 'array'
+        specs['main_qty'] = array_qty * 2  # 💡 [신규] 재고 예약용 수량 (통)
     else:
         sys_type = "Point Source System"
         specs['main'] = "12~15 inch Point Source x 2조"
         specs['main_type'] = 'point'
+        specs['main_qty'] = 2
         
     if v_d >= 20:
         delay_pos = v_d * 0.55
@@ -113,14 +186,17 @@ def calculate_audio(event):
         specs['delay_setting'] = f"{delay_ms:.1f} ms"
         specs['has_delay'] = True
         specs['delay_pos'] = delay_pos
+        specs['delay_qty'] = 2
     else:
         specs['delay'] = "불필요"
         specs['delay_setting'] = "-"
         specs['has_delay'] = False
         specs['delay_pos'] = 0
+        specs['delay_qty'] = 0
         
     if is_perf: specs['sub'] = f"18 inch Dual Sub {4 if v_w > 20 else 2}통"
     else: specs['sub'] = "18 inch Single/Dual 2통"
+    specs['sub_qty'] = 4 if is_perf and v_w > 20 else 2
         
     return {'type': sys_type, 'specs': specs}
 
@@ -130,6 +206,7 @@ class LightingEngine:
         self.d = event.stage_depth
         self.is_perf = event.event_type in ['concert', 'festival']
         
+    @timed('calc')
     def get_patch_data(self):
         interval = 1.5 if self.is_perf else 3.0
         num_beams = math.ceil(self.w / interval)
@@ -191,68 +268,156 @@ def get_image():
     plt.close()
     return uri
 
-def draw_space(event):
+# 💡 [신규] 등록 공간 도면 (외곽선 / 기둥·고정 설치물 / 리깅 포인트)
+def _draw_venue(ax, venue):
+    if not venue:
+        return
+    if venue['outline'] is not None:
+        ax.add_patch(patches.Polygon(venue['outline'], closed=True, fill=False, edgecolor='#222', lw=2.5))
+    obs = venue['obstacles']
+    for kind, circle, x, y, w, d in zip(obs['kind'], obs['circle'], obs['x'], obs['y'], obs['w'], obs['d']):
+        if kind == 'door':
+            continue  # 출입문은 피난 분석의 비상구로 표시
+        if circle:
+            ax.add_patch(patches.Circle((x, y), w / 2, facecolor='#555', edgecolor='#222'))
+        else:
+            ax.add_patch(patches.Rectangle((x - w / 2, y - d / 2), w, d, facecolor='#555', edgecolor='#222'))
+    for point in venue['rigging']:
+        ax.plot(point['x'], point['y'], marker='x', color='#6a1b9a', markersize=6)
+
+@timed('draw')
+def draw_space(event, egress=None):
     v_w, v_d = event.venue_width, event.venue_depth
-    s_w, s_d = event.stage_width, event.stage_depth
     
     fig, ax = plt.subplots(figsize=(6, v_d/v_w*6))
     ax.set_xlim(0, v_w)
     ax.set_ylim(0, v_d)
     ax.set_facecolor('#f0f0f0') # 배경색은 밝게 유지하여 객석 구분
     
+    # 💡 [수정] 객석 좌표는 seat_layout 에서 한 번에 계산 (피난 분석과 같은 좌석 순서)
+    layout = seat_layout(event)
+
     # 무대
-    stage_y = v_d - s_d - 1.0
-    ax.add_patch(patches.Rectangle(((v_w-s_w)/2, stage_y), s_w, s_d, color='#333'))
+    stage_x, stage_y, s_w, s_d = layout['stage']
+    ax.add_patch(patches.Rectangle((stage_x, stage_y), s_w, s_d, color='#333'))
     # 💡 [한글 적용]
     ax.text(v_w/2, stage_y + s_d/2, "무대", color='white', ha='center', va='center', fontweight='bold')
     
-    # [업그레이드] 배치 타입별 시각화 분기
-    mode = getattr(event, 'seating_type', 'banquet')
-    start_y = stage_y - 4.0
-    end_y = 4.0 if event.has_foh else 2.0
-    
-    # 그리기 설정 (크기, 모양)
-    if mode == 'theater': # 극장식
-        unit_w, unit_d, gap_w, gap_d = 0.5, 0.5, 0.1, 0.5
-        draw_shape = 'rect'
-    elif mode == 'classroom': # 강의식
-        unit_w, unit_d, gap_w, gap_d = 1.5, 0.6, 0.2, 1.0
-        draw_shape = 'rect'
-    else: # Banquet
-        unit_w, unit_d = 0.9, 0.9 # 반지름 느낌
-        gap_w, gap_d = event.table_gap, event.table_gap
-        draw_shape = 'circle'
+    # 💡 [신규] 피난 분석 결과가 있으면 기준 위반 좌석을 빨간색으로 표시
+    flagged = np.zeros(len(layout['x']), dtype=bool)
+    if egress is not None:
+        flagged[egress['flagged']] = True
 
-    # 중앙 정렬 계산
-    cols = int((v_w - 3.0) / (unit_w + gap_w)) if mode != 'banquet' else int((v_w - 3.0) // gap_w)
-    rows = int((start_y - end_y) / (unit_d + gap_d)) if mode != 'banquet' else int((start_y - end_y) // gap_d)
-    
-    total_row_width = cols * (unit_w + gap_w) - gap_w if mode != 'banquet' else cols * gap_w
-    start_x = (v_w - total_row_width) / 2
-    
-    for r in range(rows):
-        curr_y = start_y - (r * (unit_d + gap_d)) if mode != 'banquet' else start_y - (r * gap_d)
-        for c in range(cols):
-            curr_x = start_x + (c * (unit_w + gap_w)) if mode != 'banquet' else (v_w - (cols-1)*gap_w)/2 + c*gap_w
-            
-            # 버진로드 체크
-            if event.has_virgin_road and abs(curr_x + unit_w/2 - v_w/2) < 1.0: continue
-            
-            if draw_shape == 'rect':
-                color = '#888' if mode == 'theater' else '#8d6e63'
-                ax.add_patch(patches.Rectangle((curr_x, curr_y), unit_w, unit_d, color=color))
-            else:
-                ax.add_patch(patches.Circle((curr_x, curr_y), 0.8, facecolor='white', edgecolor='#555'))
+    # 좌석 수천 개도 도형 1묶음(PatchCollection)으로 한 번에 그림
+    if layout['shape'] == 'rect':
+        color = np.where(flagged, '#e53935', '#888' if layout['mode'] == 'theater' else '#8d6e63')
+        shapes = [patches.Rectangle((x, y), layout['unit_w'], layout['unit_d']) for x, y in zip(layout['x'], layout['y'])]
+        ax.add_collection(PatchCollection(shapes, facecolors=color, edgecolors=color))
+    else:
+        shapes = [patches.Circle((x, y), layout['radius']) for x, y in zip(layout['x'], layout['y'])]
+        ax.add_collection(PatchCollection(
+            shapes, facecolors=np.where(flagged, '#ffcdd2', 'white'), edgecolors=np.where(flagged, '#e53935', '#555'),
+        ))
                 
-    if event.has_foh:
-        ax.add_patch(patches.Rectangle(((v_w-6)/2, 0.5), 6, 2.5, facecolor='#ffcccc', edgecolor='red', linestyle='--'))
-        ax.text(v_w/2, 1.75, "FOH", color='red', ha='center')
+    if layout['foh']:
+        fx, fy, fw, fd = layout['foh']
+        ax.add_patch(patches.Rectangle((fx, fy), fw, fd, facecolor='#ffcccc', edgecolor='red', linestyle='--'))
+        ax.text(v_w/2, fy + fd/2, "FOH", color='red', ha='center')
+
+    _draw_venue(ax, layout['venue'])
+
+    # 💡 [신규] 비상구 (초록 막대 - 폭만큼)
+    if egress is not None:
+        for exit_ in egress['exits']:
+            half = exit_['width'] / 2
+            horizontal = exit_['y'] <= 0.5 or exit_['y'] >= v_d - 0.5
+            xs = [exit_['x'] - half, exit_['x'] + half] if horizontal else [exit_['x']] * 2
+            ys = [exit_['y']] * 2 if horizontal else [exit_['y'] - half, exit_['y'] + half]
+            ax.plot(xs, ys, color='#00c853', lw=6, solid_capstyle='butt')
+            ax.text(exit_['x'], exit_['y'], "EXIT", color='#00a040', fontsize=7, ha='center', va='center', fontweight='bold')
         
     # 💡 [한글 적용]
     ax.set_title(f"레이아웃: {event.get_seating_type_display()}", color='white')
     ax.axis('off')
     return get_image()
 
+# 💡 [신규] 좌석별 시야 점수 히트맵 (main/sightlines.py 결과 - 좌석 순서는 seat_layout 과 같음)
+@timed('draw')
+def draw_sightlines(event, sightlines):
+    v_w, v_d = event.venue_width, event.venue_depth
+    layout = seat_layout(event)
+
+    fig, ax = plt.subplots(figsize=(6, v_d/v_w*6))
+    ax.set_xlim(0, v_w)
+    ax.set_ylim(0, v_d)
+    ax.set_facecolor('#f0f0f0')
+
+    stage_x, stage_y, s_w, s_d = layout['stage']
+    ax.add_patch(patches.Rectangle((stage_x, stage_y), s_w, s_d, color='#333'))
+    ax.text(v_w/2, stage_y + s_d/2, "무대", color='white', ha='center', va='center', fontweight='bold')
+
+    if layout['shape'] == 'rect':
+        shapes = [patches.Rectangle((x, y), layout['unit_w'], layout['unit_d']) for x, y in zip(layout['x'], layout['y'])]
+    else:
+        shapes = [patches.Circle((x, y), layout['radius']) for x, y in zip(layout['x'], layout['y'])]
+    seats = PatchCollection(shapes, cmap='RdYlGn', edgecolors='none')
+    seats.set_array(np.asarray(sightlines['score'], dtype=float))
+    seats.set_clim(0, 100)
+    ax.add_collection(seats)
+
+    _draw_venue(ax, layout['venue'])
+
+    # 스크린 (화면 폭만큼 파란 막대)
+    for screen in sightlines['screens']:
+        half = screen['width'] / 2
+        ax.plot([screen['x'] - half, screen['x'] + half], [screen['y']] * 2, color='#1e88e5', lw=5, solid_capstyle='butt')
+
+    cbar = fig.colorbar(seats, ax=ax, fraction=0.04, pad=0.02)
+    cbar.ax.tick_params(colors='white')
+    ax.set_title(f"시야 점수 (평균 {sightlines.get('avg_score', 0)})", color='white')
+    ax.axis('off')
+    return get_image()
+
+# 💡 [신규] 전시 부스 배치도 (main/booths.py 결과 - 배정 부스는 파랑, 판매 가능 부스는 회색)
+BOOTH_COLORS = {'3x3': '#64b5f6', '6x3': '#1e88e5', 'island': '#3949ab'}
+
+@timed('draw')
+def draw_booths(event, plan):
+    v_w, v_d = event.venue_width, event.venue_depth
+
+    fig, ax = plt.subplots(figsize=(7, v_d/v_w*7))
+    ax.set_xlim(0, v_w)
+    ax.set_ylim(0, v_d)
+    ax.set_facecolor('#f0f0f0')
+
+    if event.has_stage:
+        s_w, s_d = event.stage_width, event.stage_depth
+        stage_y = v_d - s_d - 1.0
+        ax.add_patch(patches.Rectangle(((v_w - s_w) / 2, stage_y), s_w, s_d, color='#333'))
+        ax.text(v_w/2, stage_y + s_d/2, "무대", color='white', ha='center', va='center', fontweight='bold')
+
+    booths = plan['booths']
+    shapes = [patches.Rectangle((b['x'], b['y']), b['w'], b['d']) for b in booths]
+    colors = [BOOTH_COLORS[b['type']] if b['exhibitor_id'] else '#d0d0d0' for b in booths]
+    ax.add_collection(PatchCollection(shapes, facecolors=colors, edgecolors='white', linewidths=0.6))
+
+    # 부스 번호 / 참가사명 (부스가 많으면 글자가 겹쳐 생략)
+    if len(booths) <= 200:
+        for b in booths:
+            label = f"{b['no']}\n{b['exhibitor'][:6]}" if b['exhibitor'] else b['no']
+            ax.text(b['x'] + b['w'] / 2, b['y'] + b['d'] / 2, label, fontsize=4.5, ha='center', va='center',
+                    color='white' if b['exhibitor_id'] else '#555')
+
+    _draw_venue(ax, venue_geometry(event))
+
+    for entrance in plan['entrances']:
+        ax.plot(entrance['x'], entrance['y'], marker='^', color='#00c853', markersize=9)
+
+    ax.set_title(f"부스 배치도 (배정 {plan['assigned']} / 판매 가능 {plan['available']})", color='white')
+    ax.axis('off')
+    return get_image()
+
+@timed('draw')
 def draw_audio(event, audio_specs):
     # (기존 코드 유지)
     v_w, v_d = event.venue_width, event.venue_depth
@@ -285,21 +450,37 @@ def draw_audio(event, audio_specs):
     ax.axis('off')
     return get_image()
 
-def draw_light(event, layout):
+@timed('draw')
+def draw_light(event, layout, illuminance=None, rigging=None):
     # (기존 코드 유지)
     s_w, s_d = event.stage_width, event.stage_depth
     
     fig, ax = plt.subplots(figsize=(8, 6))
     ax.set_facecolor('#f0f0f0')
     
+    # 💡 [신규] 무대 조도 분포 (main/illuminance.py) - 색 면 + 등조도선(lx)
+    if illuminance is not None and illuminance['max'] > 0:
+        xs, ys, lux = illuminance['xs'], illuminance['ys'], illuminance['lux']
+        ax.contourf(xs, ys, lux, levels=12, cmap='inferno', alpha=0.6)
+        lines = ax.contour(xs, ys, lux, levels=6, colors='black', linewidths=0.6, alpha=0.7)
+        ax.clabel(lines, fmt='%d lx', fontsize=7)
+
     ax.add_patch(patches.Rectangle((-s_w/2, -s_d/2), s_w, s_d, fill=False, edgecolor='black', lw=2))
     ax.plot([-s_w/2, s_w/2], [s_d/2-0.5, s_d/2-0.5], 'k--', alpha=0.3)
     ax.plot([-s_w/2, s_w/2], [-s_d/2-3.0, -s_d/2-3.0], 'k--', alpha=0.3)
     
     for item in layout:
         ax.scatter(item['x'], item['y'], c=item['color'], s=100, edgecolors='black', zorder=5)
+
+    # 💡 [신규] 매달 지점 (호이스트 / 라인어레이) - 허용하중 초과는 빨간색
+    if rigging is not None:
+        for point in rigging['points']:
+            ax.scatter(point['x'], point['y'], marker='v', s=90, zorder=6,
+                       c='#e53935' if point['over'] else '#6a1b9a', edgecolors='black')
+            ax.text(point['x'], point['y'] + 0.35, f"{point['load_kg']:.0f}kg", fontsize=7, ha='center',
+                    color='#e53935' if point['over'] else '#333')
     
-    ax.set_xlim(-(s_w/2)-2, (s_w/2)+2)
+    ax.set_xlim(-(s_w/2)-3, (s_w/2)+3)
     ax.set_ylim(-(s_d/2)-5, (s_d/2)+2)
     # 💡 [한글 적용]
     ax.set_title("조명 배치 플롯", color='white') 
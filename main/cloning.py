@@ -0,0 +1,113 @@
+# ==========================================
+# 행사 복제 (Task 계층 / 선후행 / 큐시트 / 업체 배정까지 통째로)
+# ==========================================
+# - 새 행사는 bulk_create 로 만들어 표준 Task 자동 생성 시그널을 건너뜀 (원본 Task 트리를 그대로 복사)
+# - Task 는 계층(depth)별로 bulk_create 1회씩: 부모가 먼저 만들어진 뒤 자식의 parent 를 새 id 로 연결
+# - 마감일은 (새 행사일 - 원본 행사일) 만큼 이동 -> 행사일 기준 D-n 간격 유지
+# - 진행 이력(완료 여부, 실지출, 조달 상태, 견적/발주서)은 복사하지 않음
+
+from django.db import transaction
+
+from .inventory import sync_reservations
+from .models import Cue, Event, EventFinance, Task, TaskDependency
+from .search import reindex_event
+
+BATCH_SIZE = 500
+
+# 복사하지 않는 Event 필드 (새로 정해지거나 자동 관리되는 값)
+EVENT_SKIP_FIELDS = {'id', 'created_at', 'date', 'title', 'status', 'author'}
+
+
+def _task_levels(tasks):
+    """Task 목록 -> [[depth 0], [depth 1], ...] (행사 밖 부모/끊긴 부모는 최상위로 취급)"""
+    by_id = {t.pk: t for t in tasks}
+    depth = {}
+
+    def depth_of(task):
+        path = []
+        node = task
+        while node.pk not in depth:
+            path.append(node)
+            parent = by_id.get(node.parent_id)
+            if parent is None or parent in path:  # 최상위 (또는 잘못 연결된 순환)
+                depth[node.pk] = 0
+                path.pop()
+                break
+            node = parent
+        for n in reversed(path):
+            depth[n.pk] = depth[n.parent_id] + 1
+        return depth[task.pk]
+
+    levels = []
+    for task in tasks:
+        d = depth_of(task)
+        while len(levels) <= d:
+            levels.append([])
+        levels[d].append(task)
+    return levels
+
+
+@transaction.atomic
+def clone_event(event, new_date, title=None, author=None, include_vendors=False):
+    """행사 복제 -> 새 Event (Task 계층 depth 수 + 3 회의 bulk_create)"""
+    delta = new_date - event.date
+
+    fields = {
+        f.attname: getattr(event, f.attname)
+        for f in Event._meta.concrete_fields if f.name not in EVENT_SKIP_FIELDS
+    }
+    clone = Event(
+        **fields,
+        author=author or event.author,
+        title=title or f"{event.title} (복제)",
+        date=new_date,
+        status='inquiry',
+    )
+    # save() 대신 bulk_create: 표준 Task 자동 생성(post_save 시그널)을 건너뜀
+    [clone] = Event.objects.bulk_create([clone])
+
+    # 1) Task - 계층별로 부모 먼저
+    tasks = list(Task.objects.filter(event=event).order_by('id'))
+    id_map = {}
+    for level in _task_levels(tasks):
+        copies = [
+            Task(
+                event=clone,
+                parent_id=id_map.get(task.parent_id),
+                content=task.content,
+                deadline=task.deadline + delta,
+                task_category=task.task_category,
+                task_type=task.task_type,
+                priority=task.priority,
+                planned_budget=task.planned_budget,
+                is_external=task.is_external,
+                vendor_id=task.vendor_id if include_vendors else None,
+                duration_days=task.duration_days,
+                # 선후행 구조가 같으므로 계산된 일정도 그대로 유효
+                early_start=task.early_start,
+                late_start=task.late_start,
+                is_critical=task.is_critical,
+            )
+            for task in level
+        ]
+        for task, copy in zip(level, Task.objects.bulk_create(copies, batch_size=BATCH_SIZE)):
+            id_map[task.pk] = copy.pk
+
+    # 2) 선후행 관계 (행사 안의 Task 끼리만 - 다른 행사 Task 와 잘못 연결된 관계는 복사하지 않음)
+    TaskDependency.objects.bulk_create([
+        TaskDependency(predecessor_id=id_map[p], successor_id=id_map[s], lag_days=lag)
+        for p, s, lag in TaskDependency.objects.filter(successor__event=event, predecessor__event=event)
+        .values_list('predecessor_id', 'successor_id', 'lag_days')
+    ], batch_size=BATCH_SIZE)
+
+    # 3) 큐시트 (순서 값 그대로)
+    Cue.objects.bulk_create([
+        Cue(event=clone, order=cue.order, content=cue.content, duration=cue.duration, bgm=cue.bgm, action=cue.action)
+        for cue in Cue.objects.filter(event=event).order_by('order')
+    ], batch_size=BATCH_SIZE)
+
+    # bulk_create 는 시그널이 없으므로 검색 색인 / 재무 집계 롤업 / 장비 예약을 직접 생성
+    reindex_event(clone.pk)
+    transaction.on_commit(lambda: EventFinance.refresh(clone.pk))
+    transaction.on_commit(lambda: sync_reservations(clone.pk))
+    return clone
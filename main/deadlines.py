@@ -0,0 +1,161 @@
+# ==========================================
+# 마감 스캐너: 전체 행사의 지연(overdue) / 임박(upcoming) Task 조회 + 일일 다이제스트
+# ==========================================
+# - 미완료 Task 부분 인덱스(task_open_deadline_idx)로 deadline 범위 탐색: 미완료 + 기간 안의 Task 만 읽음
+#   (완료된 Task, 먼 미래 Task, OVERDUE_DAYS 보다 오래 지연된 Task 는 아무리 많아도 읽지 않음)
+# - 사용자 단위(내 행사만) 또는 전체(관리자) 조회
+# - 다이제스트는 사용자 batch_size 명씩 묶어 INSERT / 메일 발송
+
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.mail import EmailMessage, get_connection
+
+from .models import DeadlineDigest, Task
+
+DEFAULT_DAYS = 7
+OVERDUE_DAYS = 30  # 지연 조회 범위 (오늘부터 N일 전까지) - 오래 방치된 Task 가 쌓여도 조회 비용 일정
+BOARD_LIMIT = 200  # 화면 목록 최대 건수 (건수 자체는 따로 셈)
+DIGEST_LINES = 20  # 다이제스트 1건에 나열할 최대 Task 수
+
+logger = logging.getLogger('eos.deadlines')
+
+
+def open_tasks(user=None, before=None, start=None):
+    """미완료 Task 중 start <= deadline < before (인덱스 범위 탐색)"""
+    qs = Task.objects.filter(is_done=False)
+    if start is not None:
+        qs = qs.filter(deadline__gte=start)
+    if before is not None:
+        qs = qs.filter(deadline__lt=before)
+    if user is not None:
+        qs = qs.filter(event__author=user)
+    return qs
+
+
+def deadline_board(user=None, days=DEFAULT_DAYS, today=None, limit=BOARD_LIMIT):
+    """최근 OVERDUE_DAYS 일 안에 지연 / 앞으로 days 일 안에 마감되는 Task 목록 (user=None 이면 전체)"""
+    today = today or date.today()
+    horizon = today + timedelta(days=days + 1)  # 오늘 ~ days 일 뒤까지 포함
+
+    overdue = open_tasks(user, start=today - timedelta(days=OVERDUE_DAYS), before=today)
+    upcoming = open_tasks(user, start=today, before=horizon)
+
+    def listing(qs, *order):
+        return list(qs.select_related('event', 'vendor').order_by(*order)[:limit])
+
+    return {
+        'today': today,
+        'days': days,
+        'overdue_days': OVERDUE_DAYS,
+        'overdue': listing(overdue, '-deadline', 'id'),  # 지연은 최근 것부터
+        'upcoming': listing(upcoming, 'deadline', 'id'),
+        'overdue_count': overdue.count(),
+        'upcoming_count': upcoming.count(),
+    }
+
+
+# ------------------------------------------
+# 일일 다이제스트
+# ------------------------------------------
+
+def _scan_by_author(today, days):
+    """최근 지연 + 임박 Task 를 한 번의 범위 탐색으로 읽어 작성자별로 묶음"""
+    horizon = today + timedelta(days=days + 1)
+    rows = (
+        open_tasks(start=today - timedelta(days=OVERDUE_DAYS), before=horizon)
+        .order_by('deadline', 'id')
+        .values('content', 'deadline', 'event_id', 'event__title', 'event__author_id')
+        .iterator(chunk_size=2000)
+    )
+    by_author = defaultdict(lambda: {'overdue': [], 'upcoming': []})
+    for row in rows:
+        bucket = 'overdue' if row['deadline'] < today else 'upcoming'
+        by_author[row['event__author_id']][bucket].append(row)
+    return by_author
+
+
+def _digest_body(today, overdue, upcoming):
+    lines = [f"[EOS PRO] {today:%Y-%m-%d} 마감 알림", f"지연 {len(overdue)}건 / 임박 {len(upcoming)}건", ""]
+    for title, rows in (('⚠️ 지연', overdue), ('⏰ 임박', upcoming)):
+        if not rows:
+            continue
+        lines.append(title)
+        for row in rows[:DIGEST_LINES]:
+            lines.append(f"  - {row['deadline']:%m/%d} [{row['event__title']}] {row['content']}")
+        if len(rows) > DIGEST_LINES:
+            lines.append(f"  ... 외 {len(rows) - DIGEST_LINES}건")
+        lines.append("")
+    return "\n".join(lines).rstrip()
+
+
+def _batches(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def send_digests(today=None, days=DEFAULT_DAYS, batch_size=500, email=False):
+    """작성자별 다이제스트 생성 (오늘 이미 만든 사용자는 건너뜀) -> (생성 수, 메일 발송 수)"""
+    today = today or date.today()
+    by_author = _scan_by_author(today, days)
+    created = emailed = 0
+
+    for author_ids in _batches(sorted(by_author), batch_size):
+        done = dict(
+            DeadlineDigest.objects.filter(digest_date=today, user_id__in=author_ids).values_list('user_id', 'emailed')
+        )
+        digests = [
+            DeadlineDigest(
+                user_id=author_id,
+                digest_date=today,
+                overdue_count=len(by_author[author_id]['overdue']),
+                upcoming_count=len(by_author[author_id]['upcoming']),
+                body=_digest_body(today, by_author[author_id]['overdue'], by_author[author_id]['upcoming']),
+            )
+            for author_id in author_ids if author_id not in done
+        ]
+        # 동시에 다른 프로세스가 만든 건은 유니크 제약으로 무시
+        DeadlineDigest.objects.bulk_create(digests, ignore_conflicts=True)
+        created += len(digests)
+
+        # 💡 이전 실행에서 발송에 실패한 오늘 다이제스트도 다시 발송
+        retry = [user_id for user_id, sent in done.items() if not sent]
+        if email and retry:
+            digests += DeadlineDigest.objects.filter(digest_date=today, user_id__in=retry)
+        if email and digests:
+            emailed += _email_batch(digests)
+    return created, emailed
+
+
+def _email_batch(digests):
+    """메일 주소가 있는 사용자에게 SMTP 연결 1개로 1건씩 발송 -> 발송된 건만 emailed 표시"""
+    addresses = dict(
+        User.objects.filter(pk__in=[d.user_id for d in digests]).exclude(email='').values_list('pk', 'email')
+    )
+    targets = [d for d in digests if d.user_id in addresses]
+    if not targets:
+        return 0
+    sent_ids = []
+    try:
+        with get_connection() as connection:
+            for d in targets:
+                message = EmailMessage(
+                    subject=f"[EOS PRO] 마감 알림 - 지연 {d.overdue_count}건 / 임박 {d.upcoming_count}건",
+                    body=d.body,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[addresses[d.user_id]],
+                )
+                # 💡 한 건 실패(잘못된 주소 등)가 나머지 발송 / 다음 배치를 막지 않음 -> 다음 실행에서 그 건만 재발송
+                try:
+                    if connection.send_messages([message]):
+                        sent_ids.append(d.user_id)
+                except Exception:
+                    logger.exception("다이제스트 메일 발송 실패 (user_id=%s)", d.user_id)
+    except Exception:
+        logger.exception("메일 서버 연결 실패 - 다음 실행에서 재발송")
+    if sent_ids:
+        DeadlineDigest.objects.filter(digest_date=targets[0].digest_date, user_id__in=sent_ids).update(emailed=True)
+    return len(sent_ids)
@@ -0,0 +1,285 @@
+# ==========================================
+# 피난(Egress) 분석 엔진
+# ==========================================
+# - 배치도(seat_layout)와 같은 좌표로 공간을 CELL(0.25m) 격자로 나눔
+#   막힌 칸 = 무대 / FOH / 좌석(테이블은 의자 포함 반지름) / 공간 바깥
+# - 보행거리: 비상구 칸에서 출발해 8방향(대각선 √2) 최단거리를 격자 전체에 한 번에 계산
+#   (NumPy 배열 완화 반복 - 값이 바뀐 영역의 사각형 범위만 다시 계산하므로 빈 공간이 넓어도 빠름)
+# - 통로 폭: 장애물까지 거리가 AISLE_MIN/2 이상인 칸을 중심으로 '주 통로' 영역을 만들고,
+#   좌석에서 주 통로까지 좁은 열 사이(줄 간격)를 걷는 거리가 ROW_WALK_MAX 를 넘으면 위반
+# - 좌석 값 = 좌석 둘레(바로 바깥 칸) 중 가장 가까운 칸의 값
+# - 기준값은 settings 로 조정 (관할 소방서 / 공연장 기준에 맞춤). 격자 해상도만큼(±0.25m) 오차가 있음
+#   EGRESS_MAX_TRAVEL_M    : 보행거리 한도 (건축법 시행령 제34조 - 30m, 주요구조부 내화구조면 50m)
+#   EGRESS_AISLE_MIN_M     : 주 통로 최소 폭
+#   EGRESS_ROW_WALK_MAX_M  : 좌석 열 사이를 걸어 주 통로까지 가는 최대 거리
+#   출구: 개별 출구 유효너비 1.5m 이상, 합계는 바닥면적 100㎡당 0.6m 이상 (피난·방화구조 규칙 제10조)
+
+import math
+import time
+
+import numpy as np
+from matplotlib.path import Path
+from numpy.lib.stride_tricks import sliding_window_view
+from django.conf import settings
+
+from .calculators import seat_layout
+from .instrumentation import timed
+
+CELL = 0.25
+DEFAULT_MAX_TRAVEL_M = 30.0
+DEFAULT_AISLE_MIN_M = 0.9
+DEFAULT_ROW_WALK_MAX_M = 5.0
+EXIT_MIN_WIDTH_M = 1.5
+EXIT_WIDTH_PER_100M2 = 0.6
+DEFAULT_EXIT_WIDTH_M = 1.8  # 출구 입력이 없을 때 가정하는 출입문 폭
+
+_EPS = 1e-6
+_STEPS = [(-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+          (-1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (1, 1, math.sqrt(2))]
+
+
+def _limits():
+    return (
+        getattr(settings, 'EGRESS_MAX_TRAVEL_M', DEFAULT_MAX_TRAVEL_M),
+        getattr(settings, 'EGRESS_AISLE_MIN_M', DEFAULT_AISLE_MIN_M),
+        getattr(settings, 'EGRESS_ROW_WALK_MAX_M', DEFAULT_ROW_WALK_MAX_M),
+    )
+
+
+def event_exits(event, venue=None):
+    """(출구 목록, 가정 여부) - 입력이 없으면 등록 공간(venue_geometry)의 출입문, 그것도 없으면 후면 양쪽 모서리 2개로 가정"""
+    exits = [
+        {'x': float(e['x']), 'y': float(e['y']), 'width': float(e.get('width') or DEFAULT_EXIT_WIDTH_M)}
+        for e in (event.exits or [])
+    ]
+    if not exits and venue:
+        exits = [dict(door) for door in venue['doors']]
+    if exits:
+        return exits, False
+    half = DEFAULT_EXIT_WIDTH_M / 2
+    return [
+        {'x': half + 0.5, 'y': 0.0, 'width': DEFAULT_EXIT_WIDTH_M},
+        {'x': event.venue_width - half - 0.5, 'y': 0.0, 'width': DEFAULT_EXIT_WIDTH_M},
+    ], True
+
+
+# ------------------------------------------
+# 1. 점유 격자
+# ------------------------------------------
+
+def _cell_range(start, length, cell, size):
+    """[start, start+length) 와 겹치는 칸 번호 범위 (배열 연산용)"""
+    lo = np.clip(np.floor((start + _EPS) / cell).astype(int), 0, size)
+    hi = np.clip(np.ceil((start + length - _EPS) / cell).astype(int), 0, size)
+    return lo, hi
+
+
+def _stamp_rects(free, x, y, w, d, cell):
+    """같은 크기 사각형 여러 개를 한 번에 막음 (좌석 N개 -> (N, 행, 열) 인덱스 1회 대입)"""
+    ny, nx = free.shape
+    x, y = np.atleast_1d(x), np.atleast_1d(y)
+    if not len(x):
+        return
+    i0, i1 = _cell_range(y, d, cell, ny)
+    j0, j1 = _cell_range(x, w, cell, nx)
+    kh, kw = int((i1 - i0).max()), int((j1 - j0).max())
+    ii = i0[:, None, None] + np.arange(kh)[None, :, None]
+    jj = j0[:, None, None] + np.arange(kw)[None, None, :]
+    inside = (ii < i1[:, None, None]) & (jj < j1[:, None, None])
+    ii, jj = np.broadcast_arrays(ii, jj)
+    free[ii[inside], jj[inside]] = False
+
+
+def _stamp_circles(free, cx, cy, radius, cell):
+    """원(의자 포함 테이블 / 원형 기둥)과 겹치는 칸을 한 번에 막음 - radius 는 값 1개 또는 원마다"""
+    ny, nx = free.shape
+    if not len(cx):
+        return
+    radius = np.broadcast_to(radius, np.shape(cx))[:, None, None]
+    k = int(math.ceil(radius.max() / cell)) + 1
+    ci, cj = np.floor(cy / cell).astype(int), np.floor(cx / cell).astype(int)
+    offsets = np.arange(-k, k + 1)
+    ii = ci[:, None, None] + offsets[None, :, None]
+    jj = cj[:, None, None] + offsets[None, None, :]
+    # 원 중심에서 칸(사각형)까지의 최단거리 < 반지름 이면 겹침
+    dy = np.maximum(np.abs((ii + 0.5) * cell - cy[:, None, None]) - cell / 2, 0)
+    dx = np.maximum(np.abs((jj + 0.5) * cell - cx[:, None, None]) - cell / 2, 0)
+    hit = (dx ** 2 + dy ** 2 < radius ** 2) & (ii >= 0) & (ii < ny) & (jj >= 0) & (jj < nx)
+    ii, jj = np.broadcast_arrays(ii, jj)
+    free[ii[hit], jj[hit]] = False
+
+
+def occupancy_grid(event, layout, cell=CELL):
+    """True = 걸을 수 있는 칸 / 행 = y, 열 = x"""
+    ny = max(1, int(math.ceil(event.venue_depth / cell)))
+    nx = max(1, int(math.ceil(event.venue_width / cell)))
+    free = np.ones((ny, nx), dtype=bool)
+    for rect in filter(None, [layout['stage'], layout['foh']]):
+        _stamp_rects(free, *rect, cell)
+    if layout['shape'] == 'rect':
+        _stamp_rects(free, layout['x'], layout['y'], layout['unit_w'], layout['unit_d'], cell)
+    else:
+        _stamp_circles(free, layout['x'], layout['y'], layout['occupied_radius'], cell)
+
+    # 등록 공간: 외곽선 밖 칸 / 기둥·고정 설치물 (출입문은 통로이므로 막지 않음)
+    venue = layout['venue']
+    if venue:
+        if venue['outline'] is not None:
+            cy, cx = np.meshgrid((np.arange(ny) + 0.5) * cell, (np.arange(nx) + 0.5) * cell, indexing='ij')
+            inside = Path(venue['outline']).contains_points(np.column_stack([cx.ravel(), cy.ravel()]))
+            free &= inside.reshape(ny, nx)
+        obs = venue['obstacles']
+        solid = np.array([kind != 'door' for kind in obs['kind']], dtype=bool)
+        rect, circle = solid & ~obs['circle'], solid & obs['circle']
+        if rect.any():
+            _stamp_rects(free, obs['x'][rect] - obs['w'][rect] / 2, obs['y'][rect] - obs['d'][rect] / 2,
+                         obs['w'][rect], obs['d'][rect], cell)
+        _stamp_circles(free, obs['x'][circle], obs['y'][circle], obs['w'][circle] / 2, cell)
+    return free
+
+
+def exit_cells(free, exits, cell=CELL):
+    """출구 중심에서 폭/2 안에 있는 걸을 수 있는 칸"""
+    ny, nx = free.shape
+    cy, cx = np.meshgrid((np.arange(ny) + 0.5) * cell, (np.arange(nx) + 0.5) * cell, indexing='ij')
+    sources = np.zeros_like(free)
+    for e in exits:
+        # 벽 위의 출구는 가장 가까운 칸 줄까지 닿도록 칸 반 개만큼 여유
+        sources |= (cx - e['x']) ** 2 + (cy - e['y']) ** 2 <= (e['width'] / 2 + cell / 2) ** 2
+    return sources & free
+
+
+# ------------------------------------------
+# 2. 격자 최단거리
+# ------------------------------------------
+
+def grid_distance(free, sources, cell=CELL, limit=None):
+    """sources 에서 걸을 수 있는 칸(free)만 지나 각 칸까지의 8방향 최단거리 (m, 못 가면 inf)
+
+    반복 1회에 파면(wavefront)이 최소 1칸씩 나아가므로, limit 이 있으면 ceil(limit / cell) 회 후 멈춤
+    -> limit 이하의 값은 정확하고, 그보다 먼 칸은 limit 보다 큰 값(또는 inf)으로 남음
+    """
+    ny, nx = free.shape
+    # 1칸 벽을 둘러 경계 검사 없이 이웃을 참조
+    dist = np.full((ny + 2, nx + 2), np.inf, dtype=np.float32)
+    wall = np.ones((ny + 2, nx + 2), dtype=bool)
+    wall[1:-1, 1:-1] = ~free
+    start = sources & free
+    if not start.any():
+        return dist[1:-1, 1:-1]
+    dist[1:-1, 1:-1][start] = 0
+    # 방향별 이동 비용 (막힌 칸으로 들어가는 비용 = inf)
+    costs = [(di, dj, np.where(wall, np.inf, w * cell).astype(np.float32)) for di, dj, w in _STEPS]
+
+    rows, cols = np.nonzero(start)
+    r0, r1, c0, c1 = rows.min() + 1, rows.max() + 2, cols.min() + 1, cols.max() + 2
+    max_iter = math.ceil(limit / cell) if limit is not None else ny * nx
+    for _ in range(max_iter):
+        # 직전 반복에서 값이 바뀐 범위 + 1칸만 다시 계산
+        r0, r1, c0, c1 = max(r0 - 1, 1), min(r1 + 1, ny + 1), max(c0 - 1, 1), min(c1 + 1, nx + 1)
+        block = dist[r0:r1, c0:c1]
+        before = block.copy()
+        for di, dj, cost in costs:
+            np.minimum(block, dist[r0 + di:r1 + di, c0 + dj:c1 + dj] + cost[r0:r1, c0:c1], out=block)
+        changed = block < before
+        if not changed.any():
+            break
+        rr, cc = np.nonzero(changed.any(axis=1))[0], np.nonzero(changed.any(axis=0))[0]
+        r0, r1, c0, c1 = r0 + rr[0], r0 + rr[-1] + 1, c0 + cc[0], c0 + cc[-1] + 1
+    return dist[1:-1, 1:-1]
+
+
+def wide_aisles(free, width, cell=CELL):
+    """폭 width 이상인 통로(및 열린 공간) 칸 - 장애물 거리로 중심선을 찾고 width/2 만큼 다시 넓힘"""
+    ny, nx = free.shape
+    # 공간 바깥(테두리)과 막힌 칸에서의 거리 = 여유 폭
+    padded = np.zeros((ny + 2, nx + 2), dtype=bool)
+    padded[1:-1, 1:-1] = ~free
+    padded[[0, -1], :] = padded[:, [0, -1]] = True
+    clearance = grid_distance(np.ones_like(padded), padded, cell, limit=width / 2 + cell)[1:-1, 1:-1]
+    core = free & (clearance >= width / 2)
+    return grid_distance(free, core, cell, limit=width / 2) <= width / 2
+
+
+def seat_values(grid, layout, cell=CELL):
+    """좌석마다 둘레(바로 바깥 칸 포함) 중 최소값 -> (좌석 수,) 배열"""
+    if not len(layout['x']):
+        return np.zeros(0, dtype=grid.dtype)
+    if layout['shape'] == 'rect':
+        cx, cy = layout['x'] + layout['unit_w'] / 2, layout['y'] + layout['unit_d'] / 2
+        hi = int(math.ceil(layout['unit_d'] / 2 / cell))
+        hj = int(math.ceil(layout['unit_w'] / 2 / cell))
+    else:
+        cx, cy = layout['x'], layout['y']
+        hi = hj = int(math.ceil(layout['occupied_radius'] / cell))
+    ny, nx = grid.shape
+    ci = np.clip(np.floor(cy / cell).astype(int), 0, ny - 1)
+    cj = np.clip(np.floor(cx / cell).astype(int), 0, nx - 1)
+    padded = np.pad(grid, ((hi + 1, hi + 1), (hj + 1, hj + 1)), constant_values=np.inf)
+    windows = sliding_window_view(padded, (2 * hi + 3, 2 * hj + 3))
+    return windows[ci, cj].min(axis=(-2, -1))
+
+
+# ------------------------------------------
+# 3. 분석
+# ------------------------------------------
+
+@timed('calc')
+def analyze_egress(event, layout=None):
+    """좌석별 보행거리 / 통로 위반 -> 요약 dict (flagged: 위반 좌석 번호, seat_layout 순서)"""
+    started = time.perf_counter()
+    max_travel, aisle_min, row_walk_max = _limits()
+    layout = layout or seat_layout(event)
+    exits, assumed = event_exits(event, layout['venue'])
+    report = {'exits': exits, 'assumed_exits': assumed, 'warnings': [], 'infos': []}
+
+    free = occupancy_grid(event, layout)
+    sources = exit_cells(free, exits)
+    travel = seat_values(grid_distance(free, sources), layout)
+    row_walk = seat_values(grid_distance(free, wide_aisles(free, aisle_min), limit=row_walk_max), layout)
+
+    unreachable = ~np.isfinite(travel)
+    too_far = ~unreachable & (travel > max_travel)
+    narrow = ~unreachable & (row_walk > row_walk_max)
+    flagged = unreachable | too_far | narrow
+
+    reachable = travel[~unreachable]
+    report.update({
+        'seats': len(travel),
+        'pax': len(travel) * layout['pax_per_unit'],
+        'flagged': np.nonzero(flagged)[0].tolist(),
+        'flagged_pax': int(flagged.sum()) * layout['pax_per_unit'],
+        'violations': {'travel': int(too_far.sum()), 'aisle': int(narrow.sum()), 'blocked': int(unreachable.sum())},
+        'max_travel': round(float(reachable.max()), 1) if len(reachable) else None,
+        'avg_travel': round(float(reachable.mean()), 1) if len(reachable) else None,
+        'limits': {'travel': max_travel, 'aisle': aisle_min, 'row_walk': row_walk_max},
+    })
+
+    # 출구 폭 / 개수
+    total_width = sum(e['width'] for e in exits)
+    required_width = event.venue_width * event.venue_depth / 100 * EXIT_WIDTH_PER_100M2
+    report['exit_width'] = {'total': round(total_width, 1), 'required': round(required_width, 1)}
+    if assumed:
+        report['infos'].append(f"ℹ️ 비상구 미입력 - 후면 양쪽 출입문 2개(폭 {DEFAULT_EXIT_WIDTH_M}m)로 가정")
+    if len(exits) < 2:
+        report['warnings'].append("비상구가 1개뿐입니다 (2개 이상 분산 배치 필요)")
+    narrow_exits = [e for e in exits if e['width'] < EXIT_MIN_WIDTH_M]
+    if narrow_exits:
+        report['warnings'].append(f"유효너비 {EXIT_MIN_WIDTH_M}m 미만 출구 {len(narrow_exits)}개")
+    if total_width < required_width:
+        report['warnings'].append(f"출구 폭 합계 부족 ({total_width:.1f}m < 필요 {required_width:.1f}m)")
+    if not sources.any():
+        report['warnings'].append("비상구 위치가 무대/객석에 막혀 있습니다 (좌표 확인)")
+
+    v = report['violations']
+    if v['travel']:
+        report['warnings'].append(f"보행거리 {max_travel:g}m 초과 {v['travel']}석")
+    if v['aisle']:
+        report['warnings'].append(f"주 통로({aisle_min:g}m 이상)까지 {row_walk_max:g}m 초과 {v['aisle']}석")
+    if v['blocked']:
+        report['warnings'].append(f"비상구로 갈 수 없는 좌석 {v['blocked']}석")
+    if report['seats'] and not flagged.any():
+        report['infos'].append(f"✅ 전 좌석 보행거리 {max_travel:g}m 이내 (최대 {report['max_travel']}m)")
+
+    report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return report
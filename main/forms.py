@@ -1,5 +1,5 @@
 from django import forms
-from .models import Cue, Event, Task, Vendor, Quotation, PurchaseOrder 
+from .models import Cue, Event, Exhibitor, Task, Vendor, Quotation, PurchaseOrder 
 
 # 💡 [필수 수정] models.py에서 변경된 상수 이름으로 임포트
 from .models import (
@@ -49,6 +49,12 @@ class EventOverviewForm(forms.ModelForm):
         label='진행 상태',
         widget=forms.Select(attrs={'class': 'form-input', 'style': 'font-weight:bold; color:#00ff00;'})
     )
+    # 💡 [신규] 행사일 변경 시 Task 마감일도 같은 만큼 이동 - 완료된 Task 는 기본적으로 그대로 둠
+    shift_done_tasks = forms.BooleanField(
+        required=False,
+        label='완료된 Task 마감일도 함께 이동',
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
     
     class Meta:
         model = Event
@@ -75,6 +81,30 @@ class EventOverviewForm(forms.ModelForm):
 # ========================================================
 # 3. [Tab 2용] 공간 설계 폼 (Space Design) 
 # ========================================================
+class ExitsField(forms.Field):
+    """💡 [신규] 비상구 입력 - 한 줄에 'x, y, 폭' (m) -> [{x, y, width}]"""
+    widget = forms.Textarea
+
+    def prepare_value(self, value):
+        if isinstance(value, str):
+            return value
+        return '\n'.join(f"{e['x']:g}, {e['y']:g}, {e['width']:g}" for e in (value or []))
+
+    def to_python(self, value):
+        exits = []
+        for no, line in enumerate((value or '').splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                x, y, width = (float(part) for part in line.split(','))
+            except ValueError:
+                raise forms.ValidationError(f"{no}번째 줄: 'x, y, 폭' 형식으로 입력하세요.")
+            if width <= 0:
+                raise forms.ValidationError(f"{no}번째 줄: 폭은 0보다 커야 합니다.")
+            exits.append({'x': x, 'y': y, 'width': width})
+        return exits
+
+
 class EventSpaceForm(forms.ModelForm):
     # seating_type 필드를 명시적으로 models.SEATING_CHOICES를 사용하여 정의
     seating_type = forms.ChoiceField(
@@ -82,6 +112,12 @@ class EventSpaceForm(forms.ModelForm):
         label='객석 배치',
         widget=forms.Select(attrs={'class': 'form-input'})
     )
+    # 💡 [신규] 비상구 위치 (피난 분석용 - 비워두면 후면 출입문 2개로 가정)
+    exits = ExitsField(
+        required=False,
+        label='비상구 (x, y, 폭)',
+        widget=forms.Textarea(attrs={'class': 'form-input', 'rows': 3, 'placeholder': '한 줄에 하나: 1.5, 0, 1.8'})
+    )
     
     class Meta:
         model = Event
@@ -89,7 +125,8 @@ class EventSpaceForm(forms.ModelForm):
             'venue_width', 'venue_depth', 'venue_height', 
             'has_stage', 'stage_width', 'stage_depth', 'stage_height',
             'seating_type', 'table_gap', 'has_virgin_road', 'has_foh', 
-            'has_sound', 'has_lighting', 'has_screen', 'has_booth', 'has_print'
+            'has_sound', 'has_lighting', 'has_screen', 'has_booth', 'has_print',
+            'exits', 'venue',
         ]
         
         labels = {
@@ -112,12 +149,31 @@ class EventSpaceForm(forms.ModelForm):
             'stage_depth': forms.NumberInput(attrs={'class': 'form-input', 'step': '0.1'}),
             'stage_height': forms.NumberInput(attrs={'class': 'form-input', 'step': '0.1'}),
             'table_gap': forms.NumberInput(attrs={'class': 'form-input', 'step': '0.1'}),
+            'venue': forms.Select(attrs={'class': 'form-input'}),
         }
 
+    def clean(self):
+        cleaned_data = super().clean()
+        # 💡 [신규] 등록 공간을 고르면 가로/깊이/천고는 공간 도면 값을 사용
+        venue = cleaned_data.get('venue')
+        if venue:
+            cleaned_data['venue_width'] = venue.width
+            cleaned_data['venue_depth'] = venue.depth
+            cleaned_data['venue_height'] = venue.height
+        return cleaned_data
+
 # ========================================================
 # 4. 큐시트 폼 (기존 유지)
 # ========================================================
 class CueForm(forms.ModelForm):
+    # 💡 [수정] No. 는 삽입할 순번 (비워두면 맨 뒤에 추가) - 실제 정렬 키는 timeline.insert_cue 가 부여
+    order = forms.IntegerField(
+        required=False,
+        min_value=1,
+        label='No.',
+        widget=forms.NumberInput(attrs={'class': 'form-input', 'style': 'width: 50px;', 'placeholder': '끝'})
+    )
+
     class Meta:
         model = Cue
         fields = ['order', 'content', 'duration', 'bgm', 'action']
@@ -167,7 +223,8 @@ class TaskForm(forms.ModelForm):
         fields = [
             'content', 'deadline', 'task_category', 'task_type', 'priority', # 신규 필드 추가
             'is_external', 
-            'planned_budget', 'actual_cost', 'vendor', 'po_status'
+            'planned_budget', 'actual_cost', 'vendor', 'po_status',
+            'duration_days', # 💡 [신규] 선후행 일정 계산용 소요일
         ]
         
         widgets = {
@@ -177,6 +234,7 @@ class TaskForm(forms.ModelForm):
             'planned_budget': forms.NumberInput(attrs={'class': 'form-input', 'placeholder': '책정 예산 (원)'}),
             'actual_cost': forms.NumberInput(attrs={'class': 'form-input', 'placeholder': '실 지출 (원)'}),
             'vendor': forms.Select(attrs={'class': 'form-input'}), # 협력업체 목록 자동 로딩
+            'duration_days': forms.NumberInput(attrs={'class': 'form-input', 'min': '0'}),
         }
         
         labels = {
@@ -190,6 +248,7 @@ class TaskForm(forms.ModelForm):
             'actual_cost': '실 지출',
             'vendor': '담당 업체',
             'po_status': '조달 상태',
+            'duration_days': '소요일',
         }
 
 
@@ -208,4 +267,36 @@ class QuotationForm(forms.ModelForm):
     class Meta:
         model = Quotation
         # task는 views에서 context로 받아서 처리
-        fields = ['vendor', 'quoted_amount', 'file']
\ No newline at end of file
+        fields = ['vendor', 'quoted_amount', 'file']
+
+
+# ========================================================
+# 💡 [신규] 행사 복제 폼 (작년 행사 -> 올해 행사)
+# ========================================================
+class EventCloneForm(forms.Form):
+    title = forms.CharField(
+        max_length=200, label='새 프로젝트 명',
+        widget=forms.TextInput(attrs={'class': 'form-input'})
+    )
+    date = forms.DateField(
+        label='새 행사 날짜',
+        widget=forms.DateInput(attrs={'class': 'form-input', 'type': 'date'})
+    )
+    include_vendors = forms.BooleanField(
+        required=False, label='협력업체 배정도 복사',
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+
+
+# ========================================================
+# 💡 [신규] 전시 참가사 등록 폼 (부스 배치)
+# ========================================================
+class ExhibitorForm(forms.ModelForm):
+    class Meta:
+        model = Exhibitor
+        fields = ['name', 'booth_type', 'priority']
+        widgets = {
+            'name': forms.TextInput(attrs={'class': 'form-input', 'placeholder': '참가사명'}),
+            'booth_type': forms.Select(attrs={'class': 'form-input'}),
+            'priority': forms.NumberInput(attrs={'class': 'form-input', 'style': 'width:80px;'}),
+        }
@@ -0,0 +1,119 @@
+# ==========================================
+# 무대 조도(lux) 분포 계산
+# ==========================================
+# - 조명 위치는 LightingEngine.get_patch_data 의 layout (무대 중심 원점, 객석 쪽 -y)
+# - 모든 조명은 트러스 높이(천고 - TRUSS_BELOW_CEILING)에 걸려 같은 x 의 무대 중앙선(y=0)을 향해 포커스했다고 가정
+# - 무대 바닥(stage_height) 위 GRID_STEP 간격 격자 N점 × 조명 M개를 한 번에 배열 연산
+#   E = I(θ) × cos(입사각) / 거리²   (I(θ): 빔 각도 = 광도 50% 지점인 가우시안 배광, 필드 각도 밖은 0)
+# - Beam(에어 이펙트용 좁은 빔)은 헤이즈 속 공중을 향하므로 무대 조도에서 제외
+# - 결과는 리그(조명 종류·위치) + 무대/천고 값의 해시로 캐시 -> 같은 리그면 행사가 달라도 재사용
+
+import hashlib
+import math
+
+import numpy as np
+from django.core.cache import cache
+
+from .instrumentation import timed
+
+GRID_STEP = 0.25            # 격자 간격 (m)
+TRUSS_BELOW_CEILING = 1.0   # 천장 구조물에서 트러스까지
+MIN_THROW = 3.0             # 트러스는 무대 바닥에서 최소 3m 위
+FIELD_FACTOR = 1.8          # 필드 각도(광도 10%) ≈ 빔 각도 × 1.8
+LUX_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 종류별 배광 (빔 각도 °, 중심 광도 cd) - 대표 제품 사양 기준 근사값
+PHOTOMETRY = {
+    'Wash': {'beam': 25.0, 'candela': 12000.0},
+    'Spot': {'beam': 26.0, 'candela': 45000.0},
+}
+
+TARGET_AVG_LUX = {'perf': 800, 'general': 500}  # 공연(촬영 포함) / 일반 행사 무대 권장 평균 조도
+MIN_UNIFORMITY = 0.5                              # 최소 / 평균
+
+
+def trim_height(event):
+    """트러스(조명 설치) 높이 - 무대 바닥 기준 아닌 객석 바닥 기준 (m)"""
+    return max(event.venue_height - TRUSS_BELOW_CEILING, event.stage_height + MIN_THROW)
+
+
+def _rig_key(event, layout):
+    rig = sorted((item['type'], round(item['x'], 3), round(item['y'], 3)) for item in layout)
+    parts = [repr(rig), repr(event.stage_width), repr(event.stage_depth),
+             repr(event.stage_height), repr(event.venue_height), repr(event.event_type in ['concert', 'festival'])]
+    return 'eos:lux:' + hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _grid(event):
+    """무대 위 격자 중심 좌표 (xs, ys) - 무대 중심 원점"""
+    s_w, s_d = event.stage_width, event.stage_depth
+    nx, ny = max(math.ceil(s_w / GRID_STEP), 2), max(math.ceil(s_d / GRID_STEP), 2)
+    xs = -s_w / 2 + (np.arange(nx) + 0.5) * s_w / nx
+    ys = -s_d / 2 + (np.arange(ny) + 0.5) * s_d / ny
+    return xs, ys
+
+
+def lux_grid(event, layout):
+    """(xs, ys, lux[ny, nx]) - 조명 M개 × 격자 N점 배열 연산"""
+    xs, ys = _grid(event)
+    fixtures = [item for item in layout if item['type'] in PHOTOMETRY]
+    lux = np.zeros((len(ys), len(xs)))
+    if not fixtures:
+        return xs, ys, lux
+
+    fx = np.array([f['x'] for f in fixtures])
+    fy = np.array([f['y'] for f in fixtures])
+    beam = np.radians([PHOTOMETRY[f['type']]['beam'] for f in fixtures])
+    candela = np.array([PHOTOMETRY[f['type']]['candela'] for f in fixtures])
+    height = trim_height(event) - event.stage_height
+
+    # 조명 -> 포커스 지점 (같은 x, 무대 중앙선) 단위 벡터 (M, 3)
+    aim = np.column_stack([np.zeros_like(fx), -fy, np.full_like(fx, -height)])
+    aim /= np.linalg.norm(aim, axis=1, keepdims=True)
+
+    # 조명 -> 격자점 벡터 (N, M)
+    px, py = np.meshgrid(xs, ys)
+    vx = px.ravel()[:, None] - fx[None, :]
+    vy = py.ravel()[:, None] - fy[None, :]
+    dist2 = vx ** 2 + vy ** 2 + height ** 2
+    dist = np.sqrt(dist2)
+    cos_axis = (vx * aim[:, 0] + vy * aim[:, 1] - height * aim[:, 2]) / dist
+    theta = np.arccos(np.clip(cos_axis, -1.0, 1.0))
+    half = beam / 2
+    intensity = candela * np.exp2(-(theta / half) ** 2)
+    intensity = np.where(theta <= half * FIELD_FACTOR, intensity, 0.0)
+    lux = (intensity * (height / dist) / dist2).sum(axis=1).reshape(len(ys), len(xs))
+    return xs, ys, lux
+
+
+@timed('calc')
+def stage_illuminance(event, layout):
+    """무대 조도 분포 + 요약 dict (리그/무대 값이 같으면 캐시)"""
+    key = _rig_key(event, layout)
+    report = cache.get(key)
+    if report is not None:
+        return report
+
+    xs, ys, lux = lux_grid(event, layout)
+    avg = float(lux.mean())
+    report = {
+        'xs': xs, 'ys': ys, 'lux': lux,
+        'min': round(float(lux.min())), 'avg': round(avg), 'max': round(float(lux.max())),
+        'uniformity': round(float(lux.min()) / avg, 2) if avg else 0.0,
+        'trim': round(trim_height(event), 1),
+        'target': TARGET_AVG_LUX['perf' if event.event_type in ['concert', 'festival'] else 'general'],
+        'warnings': [],
+        'infos': [],
+    }
+    report['infos'].append(
+        f"✅ 무대 조도 평균 {report['avg']:,} lx (최소 {report['min']:,} / 최대 {report['max']:,}) - "
+        f"트러스 {report['trim']}m"
+    )
+    if report['avg'] < report['target']:
+        report['warnings'].append(f"평균 조도가 권장 {report['target']} lx 보다 낮음 - 워시/스팟 추가 권장")
+    if report['uniformity'] < MIN_UNIFORMITY:
+        report['warnings'].append(
+            f"조도 균일도(최소/평균) {report['uniformity']} - {MIN_UNIFORMITY} 미만 (무대 가장자리 어두움)"
+        )
+    cache.set(key, report, LUX_CACHE_TIMEOUT)
+    return report
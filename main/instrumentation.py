@@ -0,0 +1,219 @@
+# ==========================================
+# 요청 단위 성능 계측 (Server-Timing 헤더 + 구조화 로그 + 뷰별 백분위)
+# ==========================================
+# - PerfMiddleware 가 요청의 PERF_SAMPLE_RATE 비율만 계측 (나머지 요청은 ContextVar 조회 1회 외 비용 없음)
+# - 단계(phase)
+#   db   : 쿼리 실행 (connection.execute_wrapper 로 건수/시간 집계)
+#   calc : calculate_* / LightingEngine 계산       (@timed('calc'))
+#   draw : matplotlib 도면 렌더링 (draw_*)          (@timed('draw'))
+#   tpl  : 템플릿 렌더링 (TimedDjangoTemplates 백엔드)
+#   단계는 겹칠 수 있음 (예: 템플릿 안에서 실행된 지연 쿼리는 db 와 tpl 양쪽에 포함)
+# - 뷰별 최근 PERF_STATS_WINDOW 건으로 p50/p95/p99 계산 (프로세스 단위 메모리 - 워커별로 따로 집계됨)
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import connection
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger('eos.perf')
+
+PHASES = ('db', 'calc', 'draw', 'tpl')
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_WINDOW = 1000
+
+_current = ContextVar('eos_perf_timing', default=None)
+
+
+# ------------------------------------------
+# 1. 요청 1건의 계측값
+# ------------------------------------------
+
+class RequestTiming:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)  # 단계별 누적 ms
+        self.calls = defaultdict(float)            # 함수별 누적 ms (로그용)
+        self.queries = 0
+
+    def add(self, phase, label, ms):
+        self.phases[phase] += ms
+        if label:
+            self.calls[label] += ms
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.phases['db'] += (time.perf_counter() - started) * 1000
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self, total_ms):
+        """Server-Timing 헤더 값 (브라우저 개발자 도구 Network > Timing 에 표시됨)"""
+        metrics = [f'db;dur={self.phases["db"]:.1f};desc="{self.queries} queries"']
+        metrics += [f'{p};dur={self.phases[p]:.1f}' for p in PHASES[1:] if self.phases[p]]
+        metrics.append(f'total;dur={total_ms:.1f}')
+        return ', '.join(metrics)
+
+
+def current_timing():
+    return _current.get()
+
+
+def timed(phase, label=None):
+    """계측 중인 요청 안에서만 실행 시간을 phase 에 누적하는 데코레이터"""
+    def decorator(func):
+        name = label or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timing = _current.get()
+            if timing is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timing.add(phase, name, (time.perf_counter() - started) * 1000)
+        return wrapper
+    return decorator
+
+
+# ------------------------------------------
+# 2. 템플릿 렌더링 계측 (settings.TEMPLATES BACKEND)
+# ------------------------------------------
+
+class _TimedTemplate:
+    def __init__(self, template):
+        self.template = template
+        self.origin = template.origin
+
+    def render(self, context=None, request=None):
+        timing = _current.get()
+        if timing is None:
+            return self.template.render(context, request)
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            timing.add('tpl', self.origin.template_name, (time.perf_counter() - started) * 1000)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates 와 동일, 렌더링 시간만 tpl 단계로 기록"""
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super().get_template(template_name))
+
+
+# ------------------------------------------
+# 3. 뷰별 백분위 집계
+# ------------------------------------------
+
+def percentile(values, q):
+    """정렬된 목록의 q 백분위 (nearest-rank)"""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * q // 100))  # ceil(n * q / 100)
+    return values[int(rank) - 1]
+
+
+class PerfStats:
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._samples = defaultdict(lambda: deque(maxlen=self.window))
+            self._counts = defaultdict(int)
+
+    def record(self, view, total_ms, timing):
+        sample = (total_ms, timing.queries, *(timing.phases[p] for p in PHASES))
+        with self._lock:
+            self._samples[view].append(sample)
+            self._counts[view] += 1
+
+    def snapshot(self):
+        """{뷰 이름: {count, window, p50, p95, p99, max, avg_queries, avg_<단계>}} (ms)"""
+        with self._lock:
+            samples = {view: list(rows) for view, rows in self._samples.items()}
+            counts = dict(self._counts)
+
+        report = {}
+        for view, rows in sorted(samples.items()):
+            totals = sorted(row[0] for row in rows)
+            n = len(rows)
+            report[view] = {
+                'count': counts[view],
+                'window': n,
+                'p50': round(percentile(totals, 50), 1),
+                'p95': round(percentile(totals, 95), 1),
+                'p99': round(percentile(totals, 99), 1),
+                'max': round(totals[-1], 1),
+                'avg_queries': round(sum(row[1] for row in rows) / n, 1),
+                **{f'avg_{p}': round(sum(row[2 + i] for row in rows) / n, 1) for i, p in enumerate(PHASES)},
+            }
+        return report
+
+
+stats = PerfStats(getattr(settings, 'PERF_STATS_WINDOW', DEFAULT_WINDOW))
+
+
+# ------------------------------------------
+# 4. 미들웨어
+# ------------------------------------------
+
+class PerfMiddleware:
+    """표본 요청만 계측 -> Server-Timing 헤더 / eos.perf 로그 / 뷰별 집계"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = getattr(settings, 'PERF_SAMPLE_RATE', DEFAULT_SAMPLE_RATE)
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return self.get_response(request)
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        try:
+            with connection.execute_wrapper(timing.query_wrapper):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        total_ms = timing.elapsed_ms()
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unresolved'
+        stats.record(view, total_ms, timing)
+        response['Server-Timing'] = timing.server_timing(total_ms)
+        logger.info(json.dumps({
+            'event': 'request',
+            'view': view,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 1),
+            'queries': timing.queries,
+            **{f'{p}_ms': round(timing.phases[p], 1) for p in PHASES},
+            'calls': {name: round(ms, 1) for name, ms in sorted(timing.calls.items(), key=lambda kv: -kv[1])},
+            'pid': os.getpid(),
+        }, ensure_ascii=False))
+        return response
@@ -0,0 +1,182 @@
+# ==========================================
+# 장비 재고 & 예약 충돌 검사
+# ==========================================
+# - 행사별 필요 장비 = 조명(LightingEngine 패치) + 음향(calculate_audio 수량)
+# - 행사일 앞뒤 반입/철수 기간을 포함한 날짜 구간으로 예약 (EquipmentReservation)
+# - 부족 검사: 장비별로 (시작 +수량 / 끝 다음날 -수량) 이벤트를 정렬해 훑는 sweep-line
+#   -> 예약 R 건에 O(R log R), 부족한 날만 결과로 나옴
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+
+from .calculators import LightingEngine, calculate_audio
+from .models import Equipment, EquipmentReservation, Event
+
+LOAD_IN_DAYS = 1   # 행사 전날 반출 (셋업)
+LOAD_OUT_DAYS = 1  # 행사 다음날 반납 (철수)
+
+# 예약 수량에 영향을 주는 Event 필드 (이 중 하나라도 저장되면 예약 재계산)
+REQUIREMENT_FIELDS = {
+    'date', 'event_type', 'has_lighting', 'has_sound',
+    'stage_width', 'stage_depth', 'venue_width', 'venue_depth',
+}
+
+# 음향 계산 결과 -> 재고 장비명
+AUDIO_ITEMS = {
+    'array': 'Compact Line Array',
+    'point': '12~15 inch Point Source',
+    'delay': '10~12 inch Point Source',
+    'sub': '18 inch Subwoofer',
+}
+
+
+# ------------------------------------------
+# 1. 행사별 필요 장비
+# ------------------------------------------
+
+def equipment_requirements(event):
+    """행사 1건의 필요 장비 -> {장비명: (분류, 수량)}"""
+    needs = defaultdict(lambda: [None, 0])
+
+    if event.has_lighting:
+        patch_list, _, _, _ = LightingEngine(event).get_patch_data()
+        for fixture in patch_list:
+            item = needs[fixture['fixture']]
+            item[0] = 'lighting'
+            item[1] += 1
+
+    if event.has_sound:
+        specs = calculate_audio(event)['specs']
+        for key, qty in ((specs['main_type'], specs['main_qty']), ('delay', specs['delay_qty']), ('sub', specs['sub_qty'])):
+            if qty:
+                item = needs[AUDIO_ITEMS[key]]
+                item[0] = 'audio'
+                item[1] += qty
+
+    return {name: tuple(v) for name, v in needs.items()}
+
+
+def reservation_period(event):
+    return event.date - timedelta(days=LOAD_IN_DAYS), event.date + timedelta(days=LOAD_OUT_DAYS)
+
+
+def _replace_reservations(events):
+    """행사들의 장비 예약을 현재 계산 결과로 교체 (DELETE 1회 + INSERT 1회)"""
+    needs = {event.pk: equipment_requirements(event) for event in events}
+    categories = {name: category for need in needs.values() for name, (category, _) in need.items()}
+    # 재고에 없는 장비는 보유 0 으로 등록 -> 부족으로 바로 드러남
+    items = {e.name: e for e in Equipment.objects.filter(name__in=categories)}
+    missing = [Equipment(name=name, category=category) for name, category in categories.items() if name not in items]
+    if missing:
+        Equipment.objects.bulk_create(missing, ignore_conflicts=True)
+        items = {e.name: e for e in Equipment.objects.filter(name__in=categories)}
+
+    EquipmentReservation.objects.filter(event_id__in=needs).delete()
+    reservations = []
+    for event in events:
+        start, end = reservation_period(event)
+        reservations.extend(
+            EquipmentReservation(event=event, equipment=items[name], quantity=qty, start_date=start, end_date=end)
+            for name, (_, qty) in needs[event.pk].items()
+        )
+    return EquipmentReservation.objects.bulk_create(reservations, batch_size=500)
+
+
+@transaction.atomic
+def sync_reservations(event_id):
+    """행사의 장비 예약을 현재 계산 결과로 교체"""
+    event = Event.objects.filter(pk=event_id).first()
+    if event is None:
+        return []
+    return _replace_reservations([event])
+
+
+def rebuild_reservations(event_ids=None, batch_size=500):
+    """시그널을 거치지 않은 행사(대량 생성 / 데이터 이관)의 장비 예약 재생성 -> 처리한 행사 수
+
+    event_ids 가 없으면 전체 행사 / batch_size 개 행사마다 한 트랜잭션
+    """
+    events = Event.objects.order_by('pk')
+    if event_ids is not None:
+        events = events.filter(pk__in=event_ids)
+    count = 0
+    batch = []
+    for event in events.iterator(chunk_size=batch_size):
+        batch.append(event)
+        if len(batch) == batch_size:
+            with transaction.atomic():
+                _replace_reservations(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        with transaction.atomic():
+            _replace_reservations(batch)
+        count += len(batch)
+    return count
+
+
+# ------------------------------------------
+# 2. 부족 검사 (sweep-line)
+# ------------------------------------------
+
+def sweep_shortfalls(reservations, owned):
+    """예약 목록 -> 부족한 (장비, 날짜) 목록
+
+    reservations: [(예약 id, 장비 id, 수량, 시작일, 종료일(포함)), ...]
+    owned: {장비 id: 보유 수량}
+    반환: [{'equipment_id', 'day', 'demand', 'owned', 'shortage', 'reservation_ids'}, ...] (장비, 날짜 순)
+    """
+    points = defaultdict(list)
+    for rid, equipment_id, qty, start, end in reservations:
+        points[equipment_id].append((start, 1, rid, qty))                   # 시작일부터 사용
+        points[equipment_id].append((end + timedelta(days=1), 0, rid, qty))  # 종료 다음날 반납 (같은 날이면 반납 먼저)
+
+    shortfalls = []
+    for equipment_id in sorted(points):
+        have = owned.get(equipment_id, 0)
+        events = sorted(points[equipment_id])
+        active = {}  # 현재 구간에 걸친 예약 {id: 수량}
+        demand = 0
+        for i, (day, is_start, rid, qty) in enumerate(events):
+            if is_start:
+                active[rid] = qty
+                demand += qty
+            else:
+                del active[rid]
+                demand -= qty
+
+            # 같은 날짜의 이벤트를 모두 반영한 뒤, 다음 이벤트 전날까지 수요가 일정
+            next_day = events[i + 1][0] if i + 1 < len(events) else None
+            if next_day == day or demand <= have or next_day is None:
+                continue
+            d = day
+            ids = sorted(active)
+            while d < next_day:
+                shortfalls.append({
+                    'equipment_id': equipment_id, 'day': d, 'demand': demand,
+                    'owned': have, 'shortage': demand - have, 'reservation_ids': ids,
+                })
+                d += timedelta(days=1)
+    return shortfalls
+
+
+def shortfall_report(start, end, event=None):
+    """기간 [start, end] 안의 장비 부족 현황 (event 를 주면 그 행사가 걸린 부족만)"""
+    rows = list(
+        EquipmentReservation.objects.filter(start_date__lte=end, end_date__gte=start)
+        .values_list('id', 'equipment_id', 'quantity', 'start_date', 'end_date', 'event_id')
+    )
+    owned = dict(Equipment.objects.values_list('id', 'owned_qty'))
+    event_of = {r[0]: r[5] for r in rows}
+
+    shortfalls = [
+        s for s in sweep_shortfalls([r[:5] for r in rows], owned)
+        if start <= s['day'] <= end
+    ]
+    for s in shortfalls:
+        s['event_ids'] = sorted({event_of[rid] for rid in s['reservation_ids']})
+    if event is not None:
+        shortfalls = [s for s in shortfalls if event.pk in s['event_ids']]
+    return shortfalls
@@ -0,0 +1,101 @@
+"""
+동시성 벤치마크: 상세 페이지 읽기 + Task 토글 쓰기를 여러 스레드에서 섞어서 실행
+
+    python manage.py bench_concurrency --threads 8 --requests 200 --write-ratio 0.3
+
+벤치마크 전용 사용자/행사를 만들고 끝나면 삭제합니다.
+"""
+
+import random
+import statistics
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, OperationalError
+from django.test import Client
+
+from main.models import Event
+
+
+class Command(BaseCommand):
+    help = "detail / task 엔드포인트에 대한 읽기·쓰기 혼합 동시성 벤치마크"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help="동시 클라이언트 수")
+        parser.add_argument('--requests', type=int, default=200, help="스레드당 요청 수")
+        parser.add_argument('--write-ratio', type=float, default=0.3, help="쓰기(Task 토글) 비율 0~1")
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        per_thread = options['requests']
+        write_ratio = options['write_ratio']
+
+        user = User.objects.create_user(f'bench-{uuid.uuid4().hex[:8]}', password=uuid.uuid4().hex)
+        try:
+            event = Event.objects.create(
+                author=user, title='동시성 벤치마크', date=date.today() + timedelta(days=30), event_type='festival'
+            )
+            task_ids = list(event.tasks.values_list('id', flat=True))
+            self.stdout.write(f"{connection.vendor} / {threads} threads x {per_thread} requests / write {write_ratio:.0%}")
+
+            results = {'read': [], 'write': []}
+            errors = {'locked': 0, 'other': 0}
+            lock = threading.Lock()
+
+            def worker(seed):
+                rng = random.Random(seed)
+                client = Client()
+                client.force_login(user)
+                local = {'read': [], 'write': []}
+                local_errors = {'locked': 0, 'other': 0}
+                for _ in range(per_thread):
+                    is_write = rng.random() < write_ratio
+                    started = time.perf_counter()
+                    try:
+                        if is_write:
+                            response = client.post(f'/task/{rng.choice(task_ids)}/toggle/')
+                        elif rng.random() < 0.5:
+                            response = client.get(f'/event/{event.id}/')
+                        else:
+                            response = client.get(f'/event/{event.id}/tab/tasks/')
+                        if response.status_code >= 400:
+                            local_errors['other'] += 1
+                    except OperationalError as exc:
+                        local_errors['locked' if 'locked' in str(exc) else 'other'] += 1
+                        continue
+                    local['write' if is_write else 'read'].append(time.perf_counter() - started)
+                connection.close()
+                with lock:
+                    for kind in local:
+                        results[kind].extend(local[kind])
+                    for kind in local_errors:
+                        errors[kind] += local_errors[kind]
+
+            wall_started = time.perf_counter()
+            pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+            for t in pool:
+                t.start()
+            for t in pool:
+                t.join()
+            wall = time.perf_counter() - wall_started
+
+            total = sum(len(v) for v in results.values())
+            self.stdout.write(f"총 {total}건 / {wall:.2f}s / {total / wall:.1f} req/s")
+            for kind, samples in results.items():
+                if not samples:
+                    continue
+                samples.sort()
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                self.stdout.write(
+                    f"  {kind:5s} n={len(samples):5d} p50={statistics.median(samples) * 1000:7.1f}ms "
+                    f"p95={p95 * 1000:7.1f}ms max={samples[-1] * 1000:7.1f}ms"
+                )
+            style = self.style.SUCCESS if not any(errors.values()) else self.style.ERROR
+            self.stdout.write(style(f"  database is locked: {errors['locked']}건 / 기타 오류: {errors['other']}건"))
+        finally:
+            # 벤치마크 데이터 정리 (행사/Task 는 CASCADE 로 함께 삭제)
+            user.delete()
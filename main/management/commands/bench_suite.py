@@ -0,0 +1,59 @@
+"""
+엔드투엔드 벤치마크: 데이터 규모별로 화면 / Task 쓰기 / 엑셀 / 계산기 / 도면 측정
+
+    python manage.py bench_suite --sizes small,medium --repeat 5 --output bench.json
+    python manage.py bench_suite --baseline bench_baseline.json --fail-on-regression   # CI
+    python manage.py bench_suite --output bench_baseline.json                          # 기준 갱신
+
+측정 데이터는 트랜잭션 안에서 만들고 끝나면 롤백합니다.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main.benchmarks import DEFAULT_REPEAT, DEFAULT_THRESHOLD, SIZES, compare, run_suite
+
+
+class Command(BaseCommand):
+    help = "데이터 규모별 엔드투엔드 벤치마크 (JSON 결과 + 기준 대비 회귀 표시)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='small,medium', help=f"측정 규모 (쉼표 구분: {', '.join(SIZES)})")
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="항목당 반복 횟수 (예열 1회 별도)")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', default='bench_results.json', help="결과 JSON 경로")
+        parser.add_argument('--baseline', help="비교할 기준 결과 JSON")
+        parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="회귀 판정 비율 (0.25 = p50 25%% 증가)")
+        parser.add_argument('--fail-on-regression', action='store_true', help="회귀가 있으면 오류로 종료")
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options['sizes'].split(',') if name.strip()]
+        unknown = [name for name in names if name not in SIZES]
+        if unknown:
+            raise CommandError(f"알 수 없는 규모: {', '.join(unknown)} (사용 가능: {', '.join(SIZES)})")
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        def log(size, case, stat):
+            self.stdout.write(f"  [{size}] {case:18s} p50={stat['p50_ms']:8.2f}ms p95={stat['p95_ms']:8.2f}ms")
+
+        results = run_suite({name: SIZES[name] for name in names}, options['repeat'], options['seed'], log=log)
+        regressions = compare(results, baseline, options['threshold']) if baseline else []
+        results['regressions'] = regressions
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+        for r in regressions:
+            self.stdout.write(self.style.ERROR(
+                f"  회귀 [{r['size']}] {r['case']}: {r['baseline_ms']}ms -> {r['current_ms']}ms (x{r['ratio']})"
+            ))
+        if regressions and options['fail_on_regression']:
+            raise CommandError(f"성능 회귀 {len(regressions)}건")
+        if baseline and not regressions:
+            self.stdout.write(self.style.SUCCESS("기준 대비 회귀 없음"))
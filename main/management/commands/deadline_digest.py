@@ -0,0 +1,30 @@
+"""
+마감 알림 다이제스트 생성 (cron 등으로 하루 1회 실행)
+
+    python manage.py deadline_digest --days 7 --batch-size 500 --email
+
+최근 30일(OVERDUE_DAYS) 안의 지연 Task + 앞으로 --days 일 안에 마감되는 Task 를 작성자별로 묶어 DeadlineDigest 를 만듭니다.
+같은 날 다시 실행하면 이미 만든 사용자는 건너뜁니다.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from main.deadlines import DEFAULT_DAYS, send_digests
+
+
+class Command(BaseCommand):
+    help = "전체 행사의 지연/임박 Task 다이제스트 생성 (선택: 메일 발송)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help="임박 기준 (오늘부터 N일)")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 번에 처리할 사용자 수")
+        parser.add_argument('--date', type=date.fromisoformat, default=None, help="기준일 (YYYY-MM-DD, 기본: 오늘)")
+        parser.add_argument('--email', action='store_true', help="메일 주소가 있는 사용자에게 발송")
+
+    def handle(self, *args, **options):
+        created, emailed = send_digests(
+            today=options['date'], days=options['days'], batch_size=options['batch_size'], email=options['email'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"다이제스트 {created}건 생성, 메일 {emailed}건 발송"))
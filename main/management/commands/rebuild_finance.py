@@ -0,0 +1,23 @@
+"""
+재무 집계 롤업(EventFinance) 재계산
+
+    python manage.py rebuild_finance            # 전체 행사
+    python manage.py rebuild_finance --event 12 # 특정 행사만
+
+시그널을 거치지 않는 대량 변경(update(), raw SQL, 데이터 이관) 이후에 실행합니다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from main.analytics import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "행사별 재무 집계 롤업 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, action='append', dest='events', help="대상 행사 ID (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        count = rebuild_rollups(options['events'])
+        self.stdout.write(self.style.SUCCESS(f"{count}개 행사의 재무 집계를 갱신했습니다."))
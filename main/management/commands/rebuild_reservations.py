@@ -0,0 +1,23 @@
+"""
+장비 예약(EquipmentReservation) 재생성
+
+    python manage.py rebuild_reservations            # 전체 행사
+    python manage.py rebuild_reservations --event 12 # 특정 행사만
+
+시그널을 거치지 않는 대량 변경(update(), bulk_create, raw SQL, 데이터 이관) 이후에 실행합니다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from main.inventory import rebuild_reservations
+
+
+class Command(BaseCommand):
+    help = "행사별 장비 예약 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, action='append', dest='events', help="대상 행사 ID (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        count = rebuild_reservations(options['events'])
+        self.stdout.write(self.style.SUCCESS(f"{count}개 행사의 장비 예약을 갱신했습니다."))
@@ -0,0 +1,19 @@
+"""
+통합 검색 색인(SearchDocument + 전문 색인) 전체 재생성
+
+    python manage.py rebuild_search
+
+시그널을 거치지 않는 대량 변경(update(), raw SQL, 데이터 이관) 이후에 실행합니다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from main.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "통합 검색 색인 전체 재생성"
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"{count}건의 검색 문서를 색인했습니다."))
@@ -0,0 +1,50 @@
+# Generated by Django 6.0 on 2026-10-19 10:45
+
+from django.db import migrations, models
+
+# 마이그레이션 시점의 값으로 고정 (models.py 의 상수가 바뀌어도 결과가 달라지지 않도록)
+LEGACY_PHASES = {
+    'planning': 'PLANNING',
+    'admin': 'PLANNING',
+    'design': 'DESIGN',
+    'preparation': 'PREPARATION',
+    'execution': 'EXECUTION',
+    'settlement': 'CLOSING',
+}
+PHASE_RANKS = {'PLANNING': 0, 'DESIGN': 1, 'PREPARATION': 2, 'EXECUTION': 3, 'CLOSING': 4}
+PHASE_RANK_OTHER = 99
+
+
+def normalize_phases(apps, schema_editor):
+    Task = apps.get_model('main', 'Task')
+    # 1) 구버전 소문자 단계 값 정규화 (값 종류별 UPDATE 1회)
+    for legacy, phase in LEGACY_PHASES.items():
+        Task.objects.filter(task_category=legacy).update(task_category=phase)
+    # 2) 단계 정렬값 채우기 (기타 값은 맨 뒤)
+    Task.objects.exclude(task_category__in=list(PHASE_RANKS)).update(phase_rank=PHASE_RANK_OTHER)
+    for phase, rank in PHASE_RANKS.items():
+        Task.objects.filter(task_category=phase).update(phase_rank=rank)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_event_task_cue_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_event_phase_dl_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='phase_rank',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='단계 순서'),
+        ),
+        migrations.RunPython(normalize_phases, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['event', 'phase_rank', 'deadline'], name='task_event_rank_dl_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_task_phase_rank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quotation',
+            index=models.Index(fields=['task', 'quoted_amount'], name='quotation_task_amount_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quotation',
+            index=models.Index(fields=['vendor', 'is_selected'], name='quotation_vendor_sel_idx'),
+        ),
+    ]
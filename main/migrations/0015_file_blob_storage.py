@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-19 11:40
+
+import main.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_quotation_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='저장 경로')),
+                ('size', models.BigIntegerField(default=0, verbose_name='크기(byte)')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='참조 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='quotation',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=main.storage.quotation_storage, upload_to='quotations/', verbose_name='견적 파일'),
+        ),
+    ]
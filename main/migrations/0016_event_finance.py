@@ -0,0 +1,67 @@
+# Generated by Django 6.0 on 2026-10-19 10:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def build_rollups(apps, schema_editor):
+    Event = apps.get_model('main', 'Event')
+    Task = apps.get_model('main', 'Task')
+    EventFinance = apps.get_model('main', 'EventFinance')
+
+    # Task 합계는 GROUP BY 한 번으로 계산 후 행사별로 붙임
+    totals = {
+        row['event_id']: row
+        for row in Task.objects.values('event_id').annotate(
+            planned=Sum('planned_budget'), actual=Sum('actual_cost'), count=Count('id'),
+        )
+    }
+    rollups = []
+    for event in Event.objects.all().iterator():
+        t = totals.get(event.pk, {})
+        rollups.append(EventFinance(
+            event_id=event.pk,
+            author_id=event.author_id,
+            month=event.date.replace(day=1),
+            event_type=event.event_type,
+            status=event.status,
+            client_name=event.client_name,
+            revenue=event.budget,
+            planned_cost=t.get('planned') or 0,
+            actual_cost=t.get('actual') or 0,
+            task_count=t.get('count') or 0,
+        ))
+    EventFinance.objects.bulk_create(rollups, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_file_blob_storage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventFinance',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='finance', serialize=False, to='main.event')),
+                ('month', models.DateField(verbose_name='행사 월')),
+                ('event_type', models.CharField(max_length=20, verbose_name='행사 유형')),
+                ('status', models.CharField(max_length=20, verbose_name='진행 상태')),
+                ('client_name', models.CharField(blank=True, max_length=100, verbose_name='클라이언트')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='매출(총 예산)')),
+                ('planned_cost', models.BigIntegerField(default=0, verbose_name='책정 예산 합계')),
+                ('actual_cost', models.BigIntegerField(default=0, verbose_name='실 지출 합계')),
+                ('task_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['author', 'month'], name='finance_author_month_idx')],
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-19 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_event_finance'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeadlineDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest_date', models.DateField(verbose_name='기준일')),
+                ('overdue_count', models.PositiveIntegerField(default=0, verbose_name='지연 Task 수')),
+                ('upcoming_count', models.PositiveIntegerField(default=0, verbose_name='임박 Task 수')),
+                ('body', models.TextField(verbose_name='알림 내용')),
+                ('emailed', models.BooleanField(default=False, verbose_name='메일 발송 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_done', False)), fields=['deadline'], name='task_open_deadline_idx'),
+        ),
+        migrations.AddField(
+            model_name='deadlinedigest',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='deadlinedigest',
+            constraint=models.UniqueConstraint(fields=('user', 'digest_date'), name='digest_user_date_uniq'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-19 11:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_deadline_scanner'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='duration_days',
+            field=models.PositiveSmallIntegerField(default=1, verbose_name='소요일'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='early_start',
+            field=models.IntegerField(blank=True, editable=False, null=True, verbose_name='가장 빠른 시작(일차)'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='is_critical',
+            field=models.BooleanField(default=False, editable=False, verbose_name='주공정(Critical) 여부'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='late_start',
+            field=models.IntegerField(blank=True, editable=False, null=True, verbose_name='가장 늦은 시작(일차)'),
+        ),
+        migrations.CreateModel(
+            name='TaskDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lag_days', models.IntegerField(default=0, verbose_name='지연일(lag)')),
+                ('predecessor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='successor_links', to='main.task', verbose_name='선행 Task')),
+                ('successor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='predecessor_links', to='main.task', verbose_name='후행 Task')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('predecessor', 'successor'), name='taskdep_pair_uniq'), models.CheckConstraint(condition=models.Q(('predecessor', models.F('successor')), _negated=True), name='taskdep_no_self')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-19 12:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0018_task_dependencies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Equipment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='장비명')),
+                ('category', models.CharField(choices=[('lighting', '조명'), ('audio', '음향')], max_length=20, verbose_name='분류')),
+                ('owned_qty', models.PositiveIntegerField(default=0, verbose_name='보유 수량')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EquipmentReservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(verbose_name='수량')),
+                ('start_date', models.DateField(verbose_name='반출일')),
+                ('end_date', models.DateField(verbose_name='반납일')),
+                ('equipment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='main.equipment')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='main.event')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['start_date', 'end_date'], name='reservation_period_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 6.0 on 2026-10-19 13:10
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# 💡 초기 색인용 토큰화 - 이 시점의 main.search.search_terms 사본
+# (마이그레이션은 과거 상태로 고정: 나중에 토크나이저가 바뀌면 rebuild_index 로 다시 색인)
+_CJK = '가-힣ㄱ-ㆎ぀-ヿ一-鿿'
+_RUN = re.compile(rf'[{_CJK}]+|[^\W_{_CJK}]+')
+_CJK_RUN = re.compile(rf'[{_CJK}]')
+
+
+def search_terms(text):
+    terms = []
+    for run in _RUN.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if len(run) > 1 and _CJK_RUN.match(run):
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return ' '.join(terms)
+
+# 💡 SQLite: FTS5 외부 콘텐츠 테이블 + 트리거 (문서 행이 바뀌면 DB 가 색인을 직접 갱신)
+SQLITE_FORWARD = [
+    """CREATE VIRTUAL TABLE main_searchdocument_fts USING fts5(
+        title_terms, body_terms, content='main_searchdocument', content_rowid='id'
+    )""",
+    """CREATE TRIGGER main_searchdocument_fts_ai AFTER INSERT ON main_searchdocument BEGIN
+        INSERT INTO main_searchdocument_fts(rowid, title_terms, body_terms)
+        VALUES (new.id, new.title_terms, new.body_terms);
+    END""",
+    """CREATE TRIGGER main_searchdocument_fts_ad AFTER DELETE ON main_searchdocument BEGIN
+        INSERT INTO main_searchdocument_fts(main_searchdocument_fts, rowid, title_terms, body_terms)
+        VALUES ('delete', old.id, old.title_terms, old.body_terms);
+    END""",
+    """CREATE TRIGGER main_searchdocument_fts_au AFTER UPDATE ON main_searchdocument
+    WHEN old.title_terms IS NOT new.title_terms OR old.body_terms IS NOT new.body_terms BEGIN
+        INSERT INTO main_searchdocument_fts(main_searchdocument_fts, rowid, title_terms, body_terms)
+        VALUES ('delete', old.id, old.title_terms, old.body_terms);
+        INSERT INTO main_searchdocument_fts(rowid, title_terms, body_terms)
+        VALUES (new.id, new.title_terms, new.body_terms);
+    END""",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS main_searchdocument_fts_au",
+    "DROP TRIGGER IF EXISTS main_searchdocument_fts_ad",
+    "DROP TRIGGER IF EXISTS main_searchdocument_fts_ai",
+    "DROP TABLE IF EXISTS main_searchdocument_fts",
+]
+
+# 💡 PostgreSQL: 검색 쿼리(main/search.py _PG_VECTOR)와 같은 식의 GIN 인덱스
+POSTGRES_FORWARD = [
+    """CREATE INDEX search_document_tsv_idx ON main_searchdocument USING GIN ((
+        setweight(to_tsvector('simple', title_terms), 'A') ||
+        setweight(to_tsvector('simple', body_terms), 'B')
+    ))""",
+]
+POSTGRES_BACKWARD = ["DROP INDEX IF EXISTS search_document_tsv_idx"]
+
+
+def _run(schema_editor, statements):
+    vendor = schema_editor.connection.vendor
+    for sql in statements.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_fulltext_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD})
+
+
+def build_documents(apps, schema_editor):
+    Event = apps.get_model('main', 'Event')
+    SearchDocument = apps.get_model('main', 'SearchDocument')
+    authors = dict(Event.objects.values_list('id', 'author_id'))
+
+    def document(kind, pk, title, body, event_id=None, author_id=None):
+        return SearchDocument(
+            kind=kind, object_id=pk, event_id=event_id, author_id=author_id,
+            title=title[:500], body=body[:500],
+            title_terms=search_terms(title), body_terms=search_terms(body),
+        )
+
+    docs = [
+        document('event', pk, title, ' · '.join(filter(None, [client, venue])), pk, author_id)
+        for pk, title, client, venue, author_id in Event.objects.values_list('id', 'title', 'client_name', 'venue_name', 'author_id')
+    ]
+    for kind, model in (('task', 'Task'), ('cue', 'Cue')):
+        docs += [
+            document(kind, pk, content, '', event_id, authors[event_id])
+            for pk, content, event_id in apps.get_model('main', model).objects.values_list('id', 'content', 'event_id')
+        ]
+    docs += [
+        document('vendor', pk, name, contact)
+        for pk, name, contact in apps.get_model('main', 'Vendor').objects.values_list('id', 'name', 'contact_person')
+    ]
+    SearchDocument.objects.bulk_create(docs, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0019_equipment_inventory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('event', '행사'), ('task', 'Task'), ('vendor', '업체'), ('cue', '큐시트')], max_length=10)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=500)),
+                ('body', models.CharField(blank=True, max_length=500)),
+                ('title_terms', models.TextField()),
+                ('body_terms', models.TextField(blank=True)),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.event')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_kind_object_uniq')],
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-19 14:05
+
+import django.db.models.deletion
+import main.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0020_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShowRun',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='show_run', serialize=False, to='main.event')),
+                ('cue_started_at', models.DateTimeField(blank=True, null=True, verbose_name='현재 큐 시작 시각')),
+                ('is_running', models.BooleanField(default=False, verbose_name='진행 중')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('viewer_token', models.CharField(default=main.models.new_viewer_token, max_length=32, unique=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('current_cue', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='main.cue', verbose_name='현재 큐')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_show_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='exits',
+            field=models.JSONField(blank=True, default=list, verbose_name='비상구'),
+        ),
+    ]
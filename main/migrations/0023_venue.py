@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-19 14:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0022_event_exits'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Venue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='공간명')),
+                ('width', models.FloatField(verbose_name='가로(m)')),
+                ('depth', models.FloatField(verbose_name='깊이(m)')),
+                ('height', models.FloatField(default=5.0, verbose_name='천고(m)')),
+                ('outline', models.JSONField(blank=True, default=list, verbose_name='외곽선')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='venue',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='events', to='main.venue', verbose_name='등록 공간'),
+        ),
+        migrations.CreateModel(
+            name='VenueFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('column', '기둥'), ('fixed', '고정 설치물'), ('door', '출입문'), ('rigging', '리깅 포인트')], max_length=10, verbose_name='종류')),
+                ('shape', models.CharField(choices=[('rect', '사각형'), ('circle', '원형')], default='rect', max_length=10, verbose_name='모양')),
+                ('x', models.FloatField(verbose_name='중심 x(m)')),
+                ('y', models.FloatField(verbose_name='중심 y(m)')),
+                ('width', models.FloatField(default=0.0, verbose_name='가로/지름/문 폭(m)')),
+                ('depth', models.FloatField(default=0.0, verbose_name='깊이(m)')),
+                ('capacity_kg', models.FloatField(default=0.0, verbose_name='허용 하중(kg)')),
+                ('label', models.CharField(blank=True, max_length=50, verbose_name='표시명')),
+                ('venue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='features', to='main.venue')),
+            ],
+        ),
+    ]
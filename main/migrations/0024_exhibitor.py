@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-19 15:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0023_venue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Exhibitor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='참가사명')),
+                ('booth_type', models.CharField(choices=[('3x3', '기본 부스 (3x3m)'), ('6x3', '2칸 부스 (6x3m)'), ('island', '독립 부스 (6x6m, 사방 통로)')], default='3x3', max_length=10, verbose_name='부스 타입')),
+                ('priority', models.PositiveIntegerField(default=100, verbose_name='배정 우선순위')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exhibitors', to='main.event')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['event', 'priority'], name='exhibitor_event_priority_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 6.0 on 2026-10-19 16:00
+
+import hashlib
+import os
+import shutil
+
+from django.conf import settings
+from django.db import migrations
+
+# 💡 0015 이전 업로드(quotations/<파일명>, 기본 저장소 MEDIA_ROOT 기준)를 내용 주소 저장소로 이관
+#    마이그레이션은 당시 규칙으로 고정 -> main.storage 를 import 하지 않고 경로 규칙/해시를 여기에 둠
+PREFIX = 'blobs'
+CHUNK_SIZE = 64 * 1024
+
+
+def _digest(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def migrate_legacy_files(apps, schema_editor):
+    Quotation = apps.get_model('main', 'Quotation')
+    FileBlob = apps.get_model('main', 'FileBlob')
+    root = settings.QUOTATION_STORAGE_ROOT
+
+    moved = {}  # 예전 이름 -> 새 blob 이름 (같은 파일을 여러 견적이 가리키는 경우)
+    legacy = (Quotation.objects.exclude(file__isnull=True).exclude(file='')
+              .exclude(file__startswith=PREFIX + '/').values_list('pk', 'file'))
+    for pk, name in legacy.iterator():
+        if name not in moved:
+            src = next((p for p in (os.path.join(settings.MEDIA_ROOT, name), os.path.join(root, name))
+                        if os.path.isfile(p)), None)
+            if src is None:
+                continue  # 파일이 이미 없음 -> 다운로드는 404
+            digest = _digest(src)
+            blob = FileBlob.objects.filter(digest=digest).first()
+            if blob is None:
+                ext = os.path.splitext(name)[1].lower()[:10]
+                blob = FileBlob.objects.create(digest=digest, name=f"{PREFIX}/{digest[:2]}/{digest}{ext}",
+                                               size=os.path.getsize(src), ref_count=0)
+            dest = os.path.join(root, blob.name)
+            if os.path.exists(dest):
+                os.remove(src)
+            else:
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.move(src, dest)
+            moved[name] = blob
+        blob = moved[name]
+        Quotation.objects.filter(pk=pk).update(file=blob.name)
+        blob.ref_count += 1
+        FileBlob.objects.filter(pk=blob.pk).update(ref_count=blob.ref_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0024_exhibitor'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrate_legacy_files, migrations.RunPython.noop),
+    ]
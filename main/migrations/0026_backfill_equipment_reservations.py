@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 16:10
+
+from django.db import migrations
+
+
+def backfill_reservations(apps, schema_editor):
+    # 0019 이전에 만든 행사는 예약이 없어 부족 검사에 잡히지 않음 -> 행사마다 예약 생성
+    # 필요 장비 계산(조명 패치 / 음향)은 마이그레이션에 고정할 수 없으므로 현재 코드 사용 (행사가 있을 때만)
+    Event = apps.get_model('main', 'Event')
+    event_ids = list(Event.objects.values_list('pk', flat=True))
+    if not event_ids:
+        return
+    from main.inventory import rebuild_reservations
+    rebuild_reservations(event_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_migrate_legacy_quotation_files'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_reservations, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,15 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.core.exceptions import ValidationError
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
+from django.db import transaction
 from datetime import timedelta
+import secrets
 import locale # 재무 계산을 위해 locale 모듈 임포트 (views.py에서도 사용됨)
 from django.db.models import Sum # Task 재무 연동에 필요하므로 명시적으로 추가
+from .tab_cache import SOURCE_TASKS, SOURCE_CUES, SOURCE_VENUE, touch_sources, touch_portfolio
+from .storage import quotation_storage
 
 # =======================================================
 # 💡 [필수 수정] 모든 CHOICES 상수를 모델 정의보다 위로 이동
@@ -45,6 +50,20 @@ PHASE_CHOICES = [
     ('CLOSING', '정산/마감'),
 ]
 
+# 4-1. Task 단계 정렬 순서 (DB에 phase_rank 로 저장되어 인덱스 정렬에 사용)
+PHASE_RANKS = {code: rank for rank, (code, _) in enumerate(PHASE_CHOICES)}
+PHASE_RANK_OTHER = 99 # 기타 -> 맨 뒤
+
+# 💡 구버전(소문자) 단계 값 -> 신규 단계 코드
+LEGACY_PHASES = {
+    'planning': 'PLANNING',
+    'admin': 'PLANNING',
+    'design': 'DESIGN',
+    'preparation': 'PREPARATION',
+    'execution': 'EXECUTION',
+    'settlement': 'CLOSING',
+}
+
 # 5. Task TYPE CHOICES (업무 유형 - 연동 기능 기준)
 TYPE_CHOICES_TASK = [
     ('GENERAL', '일반 업무'),
@@ -121,6 +140,18 @@ class Event(models.Model):
     has_booth = models.BooleanField(default=False, verbose_name="[시설] 전시 부스")
     has_print = models.BooleanField(default=False, verbose_name="[제작] 인쇄물")
 
+    # 💡 [신규] 등록된 공간(기둥/출입문/리깅 포인트 포함)을 고르면 가로/깊이/천고를 공간 값으로 맞춤
+    venue = models.ForeignKey('Venue', on_delete=models.SET_NULL, null=True, blank=True, related_name='events', verbose_name="등록 공간")
+
+    # 💡 [신규] 비상구 [{x, y, width}] (m, 배치도 좌표 - 좌하단 원점, y 는 무대 방향) -> main/egress.py
+    exits = models.JSONField(default=list, blank=True, verbose_name="비상구")
+
+    class Meta:
+        indexes = [
+            # 대시보드(index): Event.objects.filter(author=...).order_by('-created_at')
+            models.Index(fields=['author', '-created_at'], name='event_author_created_idx'),
+        ]
+
     def __str__(self):
         return f"[{self.get_event_type_display()}] {self.title}"
 
@@ -133,10 +164,25 @@ class Cue(models.Model):
     bgm = models.CharField(max_length=200, blank=True)
     action = models.CharField(max_length=50, default='Play')
 
+    class Meta:
+        indexes = [
+            # 큐시트: event.cue_set.order_by('order')
+            models.Index(fields=['event', 'order'], name='cue_event_order_idx'),
+        ]
+
     def __str__(self):
         return f"[{self.order}] {self.content}"
 
 # 3. 할 일 (Task) - E.O.S 및 PMS+ 확장
+class TaskQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        # 💡 bulk_create 는 save() 를 거치지 않으므로 여기서 단계 정렬값을 채움
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_phase()
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class Task(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='tasks')
     content = models.CharField(max_length=200, verbose_name="할 일 내용")
@@ -163,6 +209,9 @@ class Task(models.Model):
         verbose_name="Task 단계"
     )
     
+    # 1-1. 단계 정렬값 (task_category 에서 자동 계산, 직접 수정하지 않음)
+    phase_rank = models.PositiveSmallIntegerField(default=0, editable=False, verbose_name="단계 순서")
+
     # 2. Task 유형 (신규 추가) - TYPE_CHOICES_TASK 사용
     task_type = models.CharField(
         max_length=20, 
@@ -190,6 +239,41 @@ class Task(models.Model):
     # 6. 발주/계약 상태
     po_status = models.CharField(max_length=20, choices=PO_CHOICES, default='ready', verbose_name="조달 상태")
 
+    # 7. 💡 [신규] 선후행 일정 (Critical Path) - 값은 main/schedule.py 가 계산해서 저장
+    duration_days = models.PositiveSmallIntegerField(default=1, verbose_name="소요일")
+    early_start = models.IntegerField(null=True, blank=True, editable=False, verbose_name="가장 빠른 시작(일차)")
+    late_start = models.IntegerField(null=True, blank=True, editable=False, verbose_name="가장 늦은 시작(일차)")
+    is_critical = models.BooleanField(default=False, editable=False, verbose_name="주공정(Critical) 여부")
+
+    class Meta:
+        indexes = [
+            # 진척률: event.tasks.filter(is_done=True).count()
+            models.Index(fields=['event', 'is_done'], name='task_event_done_idx'),
+            # 일정 탭: 단계 순서 -> 마감일 순 정렬 (인덱스 순서 그대로 읽음)
+            models.Index(fields=['event', 'phase_rank', 'deadline'], name='task_event_rank_dl_idx'),
+            # 관리자 필터 (TaskAdmin.list_filter)
+            models.Index(fields=['po_status'], name='task_po_status_idx'),
+            models.Index(fields=['task_category'], name='task_category_idx'),
+            # 마감 스캐너: 미완료 Task 만 담은 부분 인덱스로 deadline 범위 탐색 (행사 무관)
+            # 💡 (is_done, deadline) 복합 인덱스 대신 부분 인덱스 사용 - Django 가 is_done=False 를
+            #    'NOT is_done' 으로 만들어 SQLite 가 복합 인덱스 첫 컬럼을 쓰지 못하고, 완료 Task 는 인덱스에 들어갈 필요도 없음
+            models.Index(fields=['deadline'], condition=models.Q(is_done=False), name='task_open_deadline_idx'),
+        ]
+
+    objects = TaskQuerySet.as_manager()
+
+    def sync_phase(self):
+        """구버전 단계 값을 정규화하고 phase_rank 를 task_category 에 맞춤"""
+        self.task_category = LEGACY_PHASES.get(self.task_category, self.task_category)
+        self.phase_rank = PHASE_RANKS.get(self.task_category, PHASE_RANK_OTHER)
+
+    def save(self, *args, **kwargs):
+        self.sync_phase()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'task_category' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'phase_rank'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         # Task에 parent가 있으면 계층을 표시
         if self.parent:
@@ -197,15 +281,51 @@ class Task(models.Model):
         return f"[{self.get_task_category_display()}] {self.content}"
 
 
+# A-1. Task 선후행 관계 (predecessor 가 끝나야 successor 시작) - [신규]
+class TaskDependency(models.Model):
+    predecessor = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='successor_links', verbose_name="선행 Task")
+    successor = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='predecessor_links', verbose_name="후행 Task")
+    lag_days = models.IntegerField(default=0, verbose_name="지연일(lag)")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['predecessor', 'successor'], name='taskdep_pair_uniq'),
+            models.CheckConstraint(condition=~models.Q(predecessor=models.F('successor')), name='taskdep_no_self'),
+        ]
+
+    def __str__(self):
+        return f"{self.predecessor_id} -> {self.successor_id} (+{self.lag_days}일)"
+
+
+# B-0. 첨부파일 원본 (내용 해시별 1개 저장) - [신규]
+class FileBlob(models.Model):
+    digest = models.CharField(max_length=64, unique=True, verbose_name="SHA-256")
+    name = models.CharField(max_length=255, unique=True, verbose_name="저장 경로")
+    size = models.BigIntegerField(default=0, verbose_name="크기(byte)")
+    ref_count = models.PositiveIntegerField(default=0, verbose_name="참조 수")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
+
 # B. 견적서/입찰 (Quotation) - [신규]
 class Quotation(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE, verbose_name="관련 Task") 
     vendor = models.ForeignKey(Vendor, on_delete=models.SET_NULL, null=True, verbose_name="제출 업체")
     quoted_amount = models.IntegerField(verbose_name="견적 금액(원)")
     is_selected = models.BooleanField(default=False, verbose_name="선정 여부")
-    file = models.FileField(upload_to='quotations/', verbose_name="견적 파일", blank=True, null=True)
+    # 💡 [수정] 같은 견적 PDF 는 한 번만 저장 (main/storage.py)
+    file = models.FileField(upload_to='quotations/', storage=quotation_storage, verbose_name="견적 파일", blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 견적 비교: Task 별 금액 오름차순
+            models.Index(fields=['task', 'quoted_amount'], name='quotation_task_amount_idx'),
+            # 업체 낙찰률 집계
+            models.Index(fields=['vendor', 'is_selected'], name='quotation_vendor_sel_idx'),
+        ]
+
     def __str__(self):
         return f"{self.task.content} - {self.vendor.name}"
 
@@ -220,6 +340,225 @@ class PurchaseOrder(models.Model):
     def __str__(self):
         return f"PO-{self.id}: {self.task.content}"
 
+# D. 재무 집계 롤업 (행사당 1행) - [신규]
+# 💡 포트폴리오 분석은 Task 전체가 아니라 이 테이블(행사 수만큼의 행)만 GROUP BY 함
+#    Task/Event 가 바뀔 때 해당 행사 1행만 다시 계산 (models.py 하단 시그널)
+class EventFinance(models.Model):
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name='finance')
+    author = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 집계 기준 (Event 값을 복사해 둠 -> 조인 없이 그룹핑)
+    month = models.DateField(verbose_name="행사 월")  # 행사일이 속한 달의 1일
+    event_type = models.CharField(max_length=20, verbose_name="행사 유형")
+    status = models.CharField(max_length=20, verbose_name="진행 상태")
+    client_name = models.CharField(max_length=100, blank=True, verbose_name="클라이언트")
+    # 금액 (원)
+    revenue = models.BigIntegerField(default=0, verbose_name="매출(총 예산)")
+    planned_cost = models.BigIntegerField(default=0, verbose_name="책정 예산 합계")
+    actual_cost = models.BigIntegerField(default=0, verbose_name="실 지출 합계")
+    task_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # 포트폴리오 분석: 작성자별 기간 범위 조회
+            models.Index(fields=['author', 'month'], name='finance_author_month_idx'),
+        ]
+
+    @classmethod
+    def refresh(cls, event_id):
+        """행사 1건의 롤업 재계산 (Task 합계 쿼리 1회 + UPSERT)"""
+        event = Event.objects.filter(pk=event_id).first()
+        if event is None:
+            cls.objects.filter(event_id=event_id).delete()
+            return None
+        totals = Task.objects.filter(event_id=event_id).aggregate(
+            planned=Sum('planned_budget'), actual=Sum('actual_cost'), count=models.Count('id'),
+        )
+        finance, _ = cls.objects.update_or_create(event_id=event_id, defaults={
+            'author_id': event.author_id,
+            'month': event.date.replace(day=1),
+            'event_type': event.event_type,
+            'status': event.status,
+            'client_name': event.client_name,
+            'revenue': event.budget,
+            'planned_cost': totals['planned'] or 0,
+            'actual_cost': totals['actual'] or 0,
+            'task_count': totals['count'],
+        })
+        touch_portfolio(event.author_id)
+        return finance
+
+    def __str__(self):
+        return f"{self.event_id} {self.month:%Y-%m}"
+
+# E. 마감 알림 다이제스트 (사용자 x 날짜당 1건) - [신규]
+class DeadlineDigest(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    digest_date = models.DateField(verbose_name="기준일")
+    overdue_count = models.PositiveIntegerField(default=0, verbose_name="지연 Task 수")
+    upcoming_count = models.PositiveIntegerField(default=0, verbose_name="임박 Task 수")
+    body = models.TextField(verbose_name="알림 내용")
+    emailed = models.BooleanField(default=False, verbose_name="메일 발송 여부")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # 같은 날 두 번 실행해도 중복 알림이 생기지 않음
+            models.UniqueConstraint(fields=['user', 'digest_date'], name='digest_user_date_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.digest_date} (지연 {self.overdue_count} / 임박 {self.upcoming_count})"
+
+# F. 장비 재고 / 행사별 장비 예약 - [신규]
+EQUIPMENT_CATEGORIES = [
+    ('lighting', '조명'),
+    ('audio', '음향'),
+]
+
+class Equipment(models.Model):
+    name = models.CharField(max_length=100, unique=True, verbose_name="장비명")  # 계산기 출력 이름과 동일
+    category = models.CharField(max_length=20, choices=EQUIPMENT_CATEGORIES, verbose_name="분류")
+    owned_qty = models.PositiveIntegerField(default=0, verbose_name="보유 수량")
+
+    def __str__(self):
+        return f"{self.name} ({self.owned_qty})"
+
+class EquipmentReservation(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='reservations')
+    equipment = models.ForeignKey(Equipment, on_delete=models.CASCADE, related_name='reservations')
+    quantity = models.PositiveIntegerField(verbose_name="수량")
+    start_date = models.DateField(verbose_name="반출일")
+    end_date = models.DateField(verbose_name="반납일")  # 이 날까지 사용 (포함)
+
+    class Meta:
+        indexes = [
+            # 기간 겹침 조회: start_date <= 기간 끝 AND end_date >= 기간 시작
+            models.Index(fields=['start_date', 'end_date'], name='reservation_period_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} {self.equipment.name} x{self.quantity} ({self.start_date}~{self.end_date})"
+
+# G. 통합 검색 문서 (행사 / Task / 업체 / 큐 1건당 1행) - [신규]
+# 💡 전문 검색 색인(SQLite FTS5 / PostgreSQL tsvector)은 이 테이블의 *_terms 컬럼을 색인함 (main/search.py)
+SEARCH_KINDS = [
+    ('event', '행사'),
+    ('task', 'Task'),
+    ('vendor', '업체'),
+    ('cue', '큐시트'),
+]
+
+class SearchDocument(models.Model):
+    kind = models.CharField(max_length=10, choices=SEARCH_KINDS)
+    object_id = models.PositiveIntegerField()
+    # 권한 필터용 (업체는 공용이라 둘 다 비어 있음)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    author = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    # 화면 표시용 원문
+    title = models.CharField(max_length=500)
+    body = models.CharField(max_length=500, blank=True)
+    # 색인용 토큰 (한글은 2글자씩 끊은 bigram)
+    title_terms = models.TextField()
+    body_terms = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='search_kind_object_uniq'),
+        ]
+
+    def __str__(self):
+        return f"[{self.kind}] {self.title}"
+
+# H. 라이브 큐 진행 상태 (행사당 1행) - [신규]
+# 💡 운영자가 큐를 넘기면 이 행을 갱신하고 커밋 후 WebSocket 으로 전체 화면에 알림 (main/showcall.py)
+def new_viewer_token():
+    return secrets.token_urlsafe(16)
+
+class ShowRun(models.Model):
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name='show_run')
+    current_cue = models.ForeignKey(Cue, on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name="현재 큐")
+    cue_started_at = models.DateTimeField(null=True, blank=True, verbose_name="현재 큐 시작 시각")  # 서버 시계 기준
+    is_running = models.BooleanField(default=False, verbose_name="진행 중")
+    version = models.PositiveIntegerField(default=0)  # 넘길 때마다 +1 (클라이언트가 늦게 온 이전 상태를 버림)
+    # 로그인 없이 보는 스태프 화면(무대감독 / FOH / 조명 콘솔) 링크용
+    viewer_token = models.CharField(max_length=32, unique=True, default=new_viewer_token)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.event_id} v{self.version} ({'진행 중' if self.is_running else '대기'})"
+
+# I. 공간(Venue) 도면 - 여러 행사에서 재사용 - [신규]
+# 💡 외곽선(다각형)과 기둥/고정 설치물/출입문/리깅 포인트를 한 번 등록해 두고 행사에서 선택
+#    좌표는 배치도와 같음 (좌하단 원점, 무대 쪽이 +y) -> 좌석 충돌 검사는 main/venues.py
+VENUE_FEATURE_CHOICES = [
+    ('column', '기둥'),
+    ('fixed', '고정 설치물'),
+    ('door', '출입문'),
+    ('rigging', '리깅 포인트'),
+]
+FEATURE_SHAPE_CHOICES = [
+    ('rect', '사각형'),
+    ('circle', '원형'),
+]
+
+class Venue(models.Model):
+    name = models.CharField(max_length=100, verbose_name="공간명")
+    width = models.FloatField(verbose_name="가로(m)")
+    depth = models.FloatField(verbose_name="깊이(m)")
+    height = models.FloatField(default=5.0, verbose_name="천고(m)")
+    # [[x, y], ...] 꼭짓점 순서대로 - 비워두면 가로 x 깊이 사각형
+    outline = models.JSONField(default=list, blank=True, verbose_name="외곽선")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def clean(self):
+        points = self.outline or []
+        if points and (len(points) < 3 or any(
+            len(p) != 2 or not (0 <= p[0] <= self.width and 0 <= p[1] <= self.depth) for p in points
+        )):
+            raise ValidationError({'outline': "외곽선은 가로 x 깊이 안의 [x, y] 꼭짓점 3개 이상이어야 합니다."})
+
+    def __str__(self):
+        return f"{self.name} ({self.width:g}x{self.depth:g}m)"
+
+class VenueFeature(models.Model):
+    venue = models.ForeignKey(Venue, on_delete=models.CASCADE, related_name='features')
+    kind = models.CharField(max_length=10, choices=VENUE_FEATURE_CHOICES, verbose_name="종류")
+    shape = models.CharField(max_length=10, choices=FEATURE_SHAPE_CHOICES, default='rect', verbose_name="모양")
+    x = models.FloatField(verbose_name="중심 x(m)")
+    y = models.FloatField(verbose_name="중심 y(m)")
+    width = models.FloatField(default=0.0, verbose_name="가로/지름/문 폭(m)")
+    depth = models.FloatField(default=0.0, verbose_name="깊이(m)")
+    capacity_kg = models.FloatField(default=0.0, verbose_name="허용 하중(kg)")  # 리깅 포인트 WLL
+    label = models.CharField(max_length=50, blank=True, verbose_name="표시명")
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.label or ''}({self.x:g}, {self.y:g})"
+
+# J. 전시 참가사 (부스 배정 대상) - [신규]
+# 💡 우선순위가 높은(숫자가 작은) 참가사부터 입구에 가까운 자리를 배정 (main/booths.py)
+BOOTH_TYPE_CHOICES = [
+    ('3x3', '기본 부스 (3x3m)'),
+    ('6x3', '2칸 부스 (6x3m)'),
+    ('island', '독립 부스 (6x6m, 사방 통로)'),
+]
+
+class Exhibitor(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='exhibitors')
+    name = models.CharField(max_length=100, verbose_name="참가사명")
+    booth_type = models.CharField(max_length=10, choices=BOOTH_TYPE_CHOICES, default='3x3', verbose_name="부스 타입")
+    priority = models.PositiveIntegerField(default=100, verbose_name="배정 우선순위")  # 작을수록 먼저
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 부스 배정: event.exhibitors.order_by('priority', 'id')
+            models.Index(fields=['event', 'priority'], name='exhibitor_event_priority_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.booth_type})"
+
 # 4. 자동 생성 엔진 (Signal)
 @receiver(post_save, sender=Event)
 def create_default_tasks(sender, instance, created, **kwargs):
@@ -294,6 +633,9 @@ def create_default_tasks(sender, instance, created, **kwargs):
             )
             
         Task.objects.bulk_create(tasks)
+        # 💡 [신규] bulk_create 는 시그널이 없으므로 검색 색인에 직접 추가
+        from .search import index_objects
+        index_objects('task', tasks)
         
         # 💡 [재무 연동 로직] Task의 초기 예산을 Event 예상 지출에 합산
         total_planned_budget = sum(task.planned_budget for task in tasks)
@@ -302,4 +644,153 @@ def create_default_tasks(sender, instance, created, **kwargs):
         instance.expected_cost = total_planned_budget 
         
         # DB에 반영 (시그널이 무한 루프에 빠지지 않도록 update_fields 지정)
-        instance.save(update_fields=['expected_cost'])
\ No newline at end of file
+        instance.save(update_fields=['expected_cost'])
+
+
+# 5. 상세 페이지 탭 캐시 무효화 (Signal)
+# 💡 Task/Cue 가 바뀌면 그 데이터를 읽는 탭(상황실/일정, 큐시트)만 다시 계산되도록 버전 갱신
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def touch_task_tabs(sender, instance, **kwargs):
+    touch_sources(instance.event_id, SOURCE_TASKS)
+
+@receiver(post_save, sender=Cue)
+@receiver(post_delete, sender=Cue)
+def touch_cue_tabs(sender, instance, **kwargs):
+    touch_sources(instance.event_id, SOURCE_CUES)
+
+# 💡 [신규] 공간 도면이 바뀌면 그 공간을 쓰는 행사의 공간 탭만 다시 계산 (가로/깊이/천고는 행사에도 반영)
+VENUE_DIMENSIONS = {'width': 'venue_width', 'depth': 'venue_depth', 'height': 'venue_height'}
+
+@receiver(post_save, sender=Venue)
+def sync_venue_events(sender, instance, created, **kwargs):
+    if created:
+        return
+    for event in instance.events.all():
+        changed = []
+        for attr, field in VENUE_DIMENSIONS.items():
+            if getattr(event, field) != getattr(instance, attr):
+                setattr(event, field, getattr(instance, attr))
+                changed.append(field)
+        if changed:
+            event.save(update_fields=changed)
+        touch_sources(event.pk, SOURCE_VENUE)
+
+@receiver(post_save, sender=VenueFeature)
+@receiver(post_delete, sender=VenueFeature)
+def touch_venue_tabs(sender, instance, **kwargs):
+    for event_id in Event.objects.filter(venue_id=instance.venue_id).values_list('pk', flat=True):
+        touch_sources(event_id, SOURCE_VENUE)
+
+@receiver(post_save, sender=Vendor)
+def touch_vendor_tabs(sender, instance, created, **kwargs):
+    # 업체명은 일정 탭의 외주 표시에 사용됨
+    if not created:
+        event_ids = Task.objects.filter(vendor=instance).values_list('event_id', flat=True).distinct()
+        for event_id in event_ids:
+            touch_sources(event_id, SOURCE_TASKS)
+
+
+# 6. 견적 첨부파일 참조 해제 (Signal)
+# 💡 같은 파일을 다른 견적이 쓰고 있으면 참조 수만 줄이고, 마지막 참조일 때 실제 파일 삭제
+@receiver(pre_save, sender=Quotation)
+def release_replaced_quotation_file(sender, instance, **kwargs):
+    if not instance.pk:
+        return
+    old_name = Quotation.objects.filter(pk=instance.pk).values_list('file', flat=True).first()
+    if old_name and old_name != instance.file.name:
+        storage = instance.file.storage
+        transaction.on_commit(lambda: storage.release(old_name))
+
+@receiver(post_delete, sender=Quotation)
+def release_quotation_file(sender, instance, **kwargs):
+    if instance.file:
+        storage = instance.file.storage
+        name = instance.file.name
+        transaction.on_commit(lambda: storage.release(name))
+
+
+# 7. 재무 집계 롤업 갱신 (Signal)
+# 💡 커밋 후에 계산 -> 행사 삭제(CASCADE) 중간에 롤업 행이 다시 생기지 않고, 롤백되면 계산하지 않음
+def _schedule_finance_refresh(event_id):
+    transaction.on_commit(lambda: EventFinance.refresh(event_id))
+
+@receiver(post_save, sender=Event)
+def refresh_event_finance(sender, instance, **kwargs):
+    _schedule_finance_refresh(instance.pk)
+
+@receiver(post_delete, sender=Event)
+def drop_event_finance(sender, instance, **kwargs):
+    author_id = instance.author_id
+    transaction.on_commit(lambda: touch_portfolio(author_id))
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def refresh_task_finance(sender, instance, **kwargs):
+    _schedule_finance_refresh(instance.event_id)
+
+
+# 8. 장비 예약 갱신 (Signal)
+# 💡 공간/장비/날짜가 바뀌면 조명·음향 계산 결과로 장비 예약을 다시 만듦 (커밋 후)
+@receiver(post_save, sender=Event)
+def sync_event_reservations(sender, instance, update_fields=None, **kwargs):
+    from .inventory import REQUIREMENT_FIELDS, sync_reservations  # inventory -> models 순환 참조 방지
+    if update_fields is not None and not REQUIREMENT_FIELDS & set(update_fields):
+        return  # 예: expected_cost 만 저장한 경우
+    event_id = instance.pk
+    transaction.on_commit(lambda: sync_reservations(event_id))
+
+
+# 9. 통합 검색 색인 갱신 (Signal)
+# 💡 원본 행과 같은 트랜잭션에서 검색 문서를 교체 -> 롤백되면 색인도 함께 롤백 (FTS 색인은 DB 트리거가 갱신)
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Vendor)
+@receiver(post_save, sender=Cue)
+def index_search_document(sender, instance, update_fields=None, **kwargs):
+    from .search import INDEXED_FIELDS, KIND_OF_MODEL, index_objects  # search -> models 순환 참조 방지
+    kind = KIND_OF_MODEL[sender]
+    if update_fields is not None and not INDEXED_FIELDS[kind] & set(update_fields):
+        return  # 예: Task 완료 토글, expected_cost 만 저장
+    index_objects(kind, [instance])
+
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Vendor)
+@receiver(post_delete, sender=Cue)
+def remove_search_document(sender, instance, **kwargs):
+    from .search import KIND_OF_MODEL, remove_object
+    remove_object(KIND_OF_MODEL[sender], instance.pk)
+
+
+# 10. 실시간 변경 알림 (Signal)
+# 💡 커밋 후 행사 채널로 변경분 발행 -> 상세 페이지를 열어 둔 사용자에게 WebSocket 으로 전달 (main/realtime.py)
+#    bulk_create / update() 경로(timeline.py 재정렬 등)는 해당 함수에서 직접 발행
+BUDGET_FIELDS = {'budget', 'expected_cost'}
+
+@receiver(post_save, sender=Task)
+def publish_task_saved(sender, instance, **kwargs):
+    from .realtime import task_delta  # realtime -> models 순환 참조 방지
+    task_delta(instance)
+
+@receiver(post_delete, sender=Task)
+def publish_task_deleted(sender, instance, **kwargs):
+    from .realtime import task_delta
+    task_delta(instance, deleted=True)
+
+@receiver(post_save, sender=Cue)
+def publish_cue_saved(sender, instance, **kwargs):
+    from .realtime import cue_delta
+    cue_delta(instance)
+
+@receiver(post_delete, sender=Cue)
+def publish_cue_deleted(sender, instance, **kwargs):
+    from .realtime import cue_delta
+    cue_delta(instance, deleted=True)
+
+@receiver(post_save, sender=Event)
+def publish_budget_changed(sender, instance, created, update_fields=None, **kwargs):
+    from .realtime import budget_delta
+    if created or (update_fields is not None and not BUDGET_FIELDS & set(update_fields)):
+        return  # 새 행사는 구독자가 없음 / 예: 상태만 저장
+    budget_delta(instance)
@@ -0,0 +1,57 @@
+# ==========================================
+# 발주서 PDF 렌더러 (reportlab)
+# ==========================================
+# 프로세스 풀 워커에서 실행됩니다. Windows(spawn) 에서도 Django 설정 없이
+# import 될 수 있도록 이 모듈은 Django/모델을 import 하지 않습니다.
+
+import io
+
+PDF_FONT = 'HYSMyeongJo-Medium'  # reportlab 내장 한글 CID 폰트 (별도 폰트 파일 불필요)
+
+
+def render_po_pdf(doc):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.pdfgen import canvas
+
+    if PDF_FONT not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(PDF_FONT))
+
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    width, height = A4
+
+    pdf.setFont(PDF_FONT, 22)
+    pdf.drawCentredString(width / 2, height - 70, "발 주 서 (Purchase Order)")
+
+    pdf.setFont(PDF_FONT, 11)
+    lines = [
+        ("발주 번호", f"PO-{doc['po_id']}"),
+        ("발주 일자", doc['po_date']),
+        ("프로젝트", doc['event_title']),
+        ("행사일", doc['event_date']),
+        ("클라이언트", doc['client_name'] or '-'),
+        ("", ""),
+        ("계약 업체", doc['vendor_name']),
+        ("사업자등록번호", doc['business_number']),
+        ("담당자 / 연락처", f"{doc['contact_person']} / {doc['phone_number']}"),
+        ("주소", doc['address'] or '-'),
+        ("", ""),
+        ("발주 내용", doc['task']),
+        ("계약 금액", f"₩ {doc['contract_amount']:,} (VAT 별도)"),
+        ("전자 계약", "완료" if doc['is_signed'] else "미완료"),
+    ]
+    y = height - 130
+    for label, value in lines:
+        if label:
+            pdf.drawString(60, y, label)
+            pdf.drawString(190, y, str(value))
+        y -= 24
+
+    pdf.line(60, 120, width - 60, 120)
+    pdf.drawString(60, 100, "위와 같이 발주합니다.")
+    pdf.drawRightString(width - 60, 100, "(인)")
+    pdf.showPage()
+    pdf.save()
+    return buf.getvalue()
@@ -0,0 +1,87 @@
+# ==========================================
+# 조달 엔진: 견적 비교 / 입찰 순위 / 업체 낙찰률 / 견적 선정
+# ==========================================
+
+from itertools import groupby
+from statistics import median
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import Quotation, Task, Vendor
+
+OUTLIER_RATIO = 0.3  # 중앙값 대비 ±30% 를 벗어나면 이상치로 표시
+OUTLIER_MIN_BIDS = 3  # 견적이 3건 이상일 때만 이상치 판단
+
+
+def _task_summary(bids):
+    """한 Task 의 견적 목록(금액 오름차순) -> 최저/중앙값/편차/순위"""
+    amounts = [b['quoted_amount'] for b in bids]
+    low, high = amounts[0], amounts[-1]
+    mid = median(amounts)
+
+    ranked = []
+    for rank, bid in enumerate(bids, start=1):
+        deviation = (bid['quoted_amount'] - mid) / mid if mid else 0.0
+        ranked.append({
+            **bid,
+            'rank': rank,
+            'deviation': round(deviation * 100, 1),
+            'is_outlier': len(bids) >= OUTLIER_MIN_BIDS and abs(deviation) > OUTLIER_RATIO,
+        })
+
+    return {
+        'count': len(amounts),
+        'lowest': low,
+        'median': mid,
+        'highest': high,
+        'spread': high - low,
+        'spread_rate': round((high - low) / low * 100, 1) if low else 0.0,
+        'bids': ranked,
+    }
+
+
+def bid_summary(event):
+    """행사 전체 견적 비교 (쿼리 1회: (task, quoted_amount) 인덱스 순서로 읽음)"""
+    rows = (
+        Quotation.objects.filter(task__event=event)
+        .order_by('task_id', 'quoted_amount', 'id')
+        .values('id', 'task_id', 'vendor_id', 'vendor__name', 'quoted_amount', 'is_selected', 'file')
+    )
+    return {task_id: _task_summary(list(bids)) for task_id, bids in groupby(rows, key=lambda r: r['task_id'])}
+
+
+def vendor_win_rates(event):
+    """이 행사에 견적을 낸 업체들의 전체 기간 낙찰률 (집계 쿼리 1회)"""
+    bidders = Quotation.objects.filter(task__event=event).values('vendor_id')
+    stats = (
+        Vendor.objects.filter(pk__in=bidders)
+        .annotate(
+            bids=Count('quotation'),
+            wins=Count('quotation', filter=Q(quotation__is_selected=True)),
+        )
+        .values('id', 'name', 'bids', 'wins')
+    )
+    return {
+        s['id']: {**s, 'win_rate': round(s['wins'] / s['bids'] * 100, 1) if s['bids'] else 0.0}
+        for s in stats
+    }
+
+
+@transaction.atomic
+def select_bid(quotation):
+    """견적 선정: 경쟁 견적 일괄 해제 + Task 업체/실지출/조달상태 갱신 (한 트랜잭션)"""
+    task = Task.objects.select_for_update().get(pk=quotation.task_id)
+
+    Quotation.objects.filter(task=task, is_selected=True).exclude(pk=quotation.pk).update(is_selected=False)
+    Quotation.objects.filter(pk=quotation.pk).update(is_selected=True)
+    quotation.is_selected = True
+
+    task.vendor_id = quotation.vendor_id
+    task.actual_cost = quotation.quoted_amount
+    task.is_external = True
+    if task.po_status in ('ready', 'bidding'):
+        task.po_status = 'contracted'
+    # save() 로 저장해야 일정 탭 캐시 시그널이 동작함
+    task.save(update_fields=['vendor', 'actual_cost', 'is_external', 'po_status'])
+    return task
@@ -0,0 +1,166 @@
+# ==========================================
+# 발주서(PO) 일괄 생성 & PDF 렌더링
+# ==========================================
+# - 계약 완료된 외주 Task 의 발주서를 bulk_create 로 한 번에 생성
+# - PDF 는 발주 내용 해시를 키로 디스크에 캐시 (내용이 같으면 다시 그리지 않음)
+# - 새로 그려야 할 PDF 가 여러 개면 프로세스 풀에서 병렬 렌더링
+# - 일괄 다운로드는 ZIP 을 조각 단위로 스트리밍 (전체를 메모리에 올리지 않음)
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import PurchaseOrder, Task
+from .po_pdf import render_po_pdf
+from .realtime import tasks_changed
+from .tab_cache import SOURCE_TASKS, touch_sources
+
+STREAM_CHUNK = 64 * 1024
+
+
+# ------------------------------------------
+# 1. 발주서 일괄 생성
+# ------------------------------------------
+
+@transaction.atomic
+def generate_purchase_orders(event):
+    """계약 완료 + 업체 지정된 외주 Task 중 발주서가 없는 건을 일괄 발주 (INSERT 1회 + UPDATE 1회)"""
+    tasks = list(
+        Task.objects.select_for_update()
+        .filter(event=event, is_external=True, po_status='contracted', vendor__isnull=False)
+        .exclude(purchaseorder__isnull=False)
+    )
+    if not tasks:
+        return []
+
+    orders = PurchaseOrder.objects.bulk_create([
+        PurchaseOrder(task=task, vendor_id=task.vendor_id, contract_amount=task.actual_cost or task.planned_budget)
+        for task in tasks
+    ])
+    Task.objects.filter(pk__in=[task.pk for task in tasks]).update(po_status='po_issued')
+    # update() 는 시그널이 없으므로 일정 탭 캐시 / 실시간 알림을 직접 갱신
+    touch_sources(event.id, SOURCE_TASKS)
+    tasks_changed(event.id, 'po_issued')
+    return orders
+
+
+# ------------------------------------------
+# 2. PDF 내용 (렌더링은 po_pdf.render_po_pdf - 프로세스 풀에서 dict 만 주고받음)
+# ------------------------------------------
+
+def po_document(po):
+    """PDF 에 들어가는 내용만 추린 dict (이 값의 해시가 캐시 키)"""
+    task, vendor, event = po.task, po.vendor, po.task.event
+    return {
+        'po_id': po.id,
+        'po_date': po.po_date.isoformat() if po.po_date else '',
+        'is_signed': po.is_signed,
+        'contract_amount': po.contract_amount,
+        'event_title': event.title,
+        'event_date': event.date.isoformat(),
+        'client_name': event.client_name,
+        'task': task.content,
+        'vendor_name': vendor.name,
+        'business_number': vendor.business_number,
+        'contact_person': vendor.contact_person,
+        'phone_number': vendor.phone_number,
+        'address': vendor.address,
+    }
+
+
+def content_hash(doc):
+    return hashlib.sha256(json.dumps(doc, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+# ------------------------------------------
+# 3. 디스크 캐시
+# ------------------------------------------
+
+def _cache_path(digest):
+    return os.path.join(settings.PO_PDF_CACHE_DIR, digest[:2], f"{digest}.pdf")
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)  # 동시에 같은 PDF 를 만들어도 반쯤 쓰인 파일이 보이지 않음
+
+
+def ensure_pdfs(orders):
+    """발주서 목록 -> [(po, 캐시된 PDF 경로)] (캐시에 없는 것만 렌더링)"""
+    docs = [(po, po_document(po)) for po in orders]
+    paths = [(po, _cache_path(content_hash(doc))) for po, doc in docs]
+    missing = [(path, doc) for (po, path), (_, doc) in zip(paths, docs) if not os.path.exists(path)]
+
+    if len(missing) == 1:
+        path, doc = missing[0]
+        _write_atomic(path, render_po_pdf(doc))
+    elif missing:
+        workers = min(settings.PO_PDF_WORKERS, len(missing))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = pool.map(render_po_pdf, [doc for _, doc in missing], chunksize=8)
+            for (path, _), data in zip(missing, rendered):
+                _write_atomic(path, data)
+    return paths
+
+
+def po_filename(po):
+    return f"PO-{po.id}_{po.vendor.name}.pdf"
+
+
+# ------------------------------------------
+# 4. ZIP 스트리밍
+# ------------------------------------------
+
+class _ChunkBuffer(io.RawIOBase):
+    """zipfile 이 쓴 바이트를 모았다가 조각 단위로 꺼내가는 쓰기 전용 버퍼"""
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        self._offset += len(b)
+        return len(b)
+
+    def tell(self):
+        return self._offset
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(entries):
+    """[(zip 안 파일명, 디스크 경로)] -> ZIP 바이트 조각 generator"""
+    buf = _ChunkBuffer()
+    # PDF 는 이미 압축되어 있으므로 STORED (CPU 절약)
+    with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for name, path in entries:
+            with open(path, 'rb') as src, zf.open(name, 'w', force_zip64=True) as dest:
+                while True:
+                    block = src.read(STREAM_CHUNK)
+                    if not block:
+                        break
+                    dest.write(block)
+                    chunk = buf.drain()
+                    if chunk:
+                        yield chunk
+            chunk = buf.drain()
+            if chunk:
+                yield chunk
+    yield buf.drain()  # 중앙 디렉터리(central directory)
@@ -0,0 +1,271 @@
+# ==========================================
+# 실시간 변경 알림 (WebSocket 푸시)
+# ==========================================
+# - 경로: /ws/event/<행사 id>/ (eos_pro/asgi.py 가 websocket 요청만 이 앱으로 보냄)
+# - 행사 단위 채널('event:<id>')에 변경분(delta)을 발행 -> 구독 중인 연결로 전달
+#   task:<id> : Task 추가/수정/완료 토글/삭제,  tasks : 여러 Task 일괄 변경 (마감일 이동, 일괄 발주)
+#   cue:<id>  : 큐 추가/수정/삭제,  cues : 재번호/전체 재정렬 (id, order 목록)
+#   budget    : 예산 / 예상 비용 변경
+#   show      : 라이브 큐 진행 상태 (main/showcall.py - immediate: 묶음 대기 없이 바로 전송)
+# - 발행은 커밋 후 (롤백된 변경은 알리지 않음) / 요청 스레드에서 호출해도 안전 (call_soon_threadsafe)
+# - 연결마다 REALTIME_COALESCE_MS 동안 모아 1개 프레임으로 전송, 같은 key 는 마지막 값만 남김
+#   (예: Task 50개 일괄 수정 -> 프레임 1개)
+# - 접속 권한: 행사 작성자(세션 쿠키) 또는 라이브 진행 화면 링크(?show=<viewer_token>)
+#   링크로 접속한 화면에는 큐/진행 상태 변경분만 전달
+# - 브로커는 settings.REALTIME_BROKER 로 교체 가능 (기본 InProcessBroker 는 같은 프로세스의 연결에만 전달
+#   -> 워커가 여러 개면 Redis pub/sub 등 프로세스 간 브로커를 같은 인터페이스로 구현해 지정)
+
+import asyncio
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from importlib import import_module
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.db import close_old_connections, transaction
+from django.http.cookie import parse_cookie
+from django.utils.module_loading import import_string
+
+DEFAULT_BROKER = 'main.realtime.InProcessBroker'
+DEFAULT_COALESCE_MS = 30
+DEFAULT_QUEUE_SIZE = 256
+
+PATH_PATTERN = re.compile(r'^/ws/event/(\d+)/$')
+CLOSE_FORBIDDEN = 4403
+CLOSE_NOT_FOUND = 4404
+
+_RESYNC = {'type': 'resync', 'key': 'resync'}
+VIEWER_KINDS = frozenset({'show', 'cue', 'cues', 'resync'})
+
+
+def channel_name(event_id):
+    return f'event:{event_id}'
+
+
+# ------------------------------------------
+# 1. 브로커 (구독 / 발행)
+# ------------------------------------------
+
+class Subscription:
+    """연결 1개의 수신 대기열 (연결의 이벤트 루프에서만 읽음)"""
+
+    def __init__(self, loop=None, maxsize=DEFAULT_QUEUE_SIZE):
+        self.loop = loop or asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, message):
+        # 다른 스레드(동기 뷰)에서 호출될 수 있으므로 루프 스레드로 넘겨서 넣음
+        self.loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 느린 연결: 쌓인 변경분을 버리고 전체 새로고침(resync) 1건으로 대체
+            self.overflowed = True
+
+    def drain(self):
+        """대기 중인 메시지 전부 (없으면 빈 목록)"""
+        messages = []
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        return messages
+
+
+class InProcessBroker:
+    """같은 프로세스 안의 구독자에게만 전달하는 기본 브로커"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, channel, maxsize=DEFAULT_QUEUE_SIZE, loop=None):
+        """loop: 메시지를 읽을 이벤트 루프 (기본: 지금 실행 중인 루프)"""
+        subscription = Subscription(loop, maxsize)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, channel, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(message)
+        return len(subscribers)
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, 'REALTIME_BROKER', DEFAULT_BROKER))()
+    return _broker
+
+
+# ------------------------------------------
+# 2. 변경분 발행 (models.py 시그널 / 시그널 없는 일괄 변경 경로에서 호출)
+# ------------------------------------------
+
+def publish_delta(event_id, key, kind, **data):
+    """커밋 후 행사 채널에 변경분 1건 발행 (같은 key 는 묶음 안에서 마지막 값만 전달됨)"""
+    message = {'type': kind, 'key': key, **data}
+    transaction.on_commit(lambda: get_broker().publish(channel_name(event_id), message))
+
+
+def task_delta(task, deleted=False):
+    publish_delta(
+        task.event_id, f'task:{task.pk}', 'task', id=task.pk, deleted=deleted,
+        content=task.content, is_done=task.is_done,
+        deadline=task.deadline.isoformat() if task.deadline else None,
+    )
+
+
+def tasks_changed(event_id, reason):
+    """update() 처럼 시그널 없이 여러 Task 를 바꾼 경우 - 클라이언트는 Task 목록 전체를 다시 읽음"""
+    publish_delta(event_id, 'tasks', 'tasks', reason=reason)
+
+
+def cue_delta(cue, deleted=False):
+    publish_delta(
+        cue.event_id, f'cue:{cue.pk}', 'cue', id=cue.pk, deleted=deleted,
+        order=cue.order, content=cue.content, duration=cue.duration,
+    )
+
+
+def cues_reordered(event_id, orders):
+    """orders: [(큐 id, order)] - 재번호/재정렬처럼 여러 행을 한 번에 바꾼 경우"""
+    publish_delta(event_id, 'cues', 'cues', orders=[list(pair) for pair in orders])
+
+
+def budget_delta(event):
+    publish_delta(event.pk, 'budget', 'budget', budget=event.budget, expected_cost=event.expected_cost)
+
+
+def coalesce(messages):
+    """같은 key 는 마지막 값만 (처음 나온 순서 유지) -> 전송할 변경분 목록"""
+    latest = {}
+    for message in messages:
+        latest[message['key']] = message
+    return list(latest.values())
+
+
+# ------------------------------------------
+# 3. WebSocket ASGI 앱
+# ------------------------------------------
+
+def _same_origin(headers):
+    """다른 사이트 페이지가 사용자 쿠키로 연결하는 것(CSWSH) 차단 - Origin 호스트가 Host 와 같아야 함"""
+    origin = headers.get(b'origin')
+    if origin is None:
+        return True  # 브라우저가 아닌 클라이언트
+    host = origin.decode('latin-1').split('://', 1)[-1]
+    return host == headers.get(b'host', b'').decode('latin-1')
+
+
+def _authorize(cookie_header, event_id, token=None):
+    """접속 권한 -> 받을 변경분 종류 (None: 전부 / VIEWER_KINDS: 진행 화면 링크) / 권한 없으면 False (동기 - DB 조회)"""
+    from .models import Event, ShowRun  # models -> realtime 순환 참조 방지
+    close_old_connections()
+    try:
+        if token:
+            return VIEWER_KINDS if ShowRun.objects.filter(pk=event_id, viewer_token=token).exists() else False
+        key = parse_cookie(cookie_header).get(settings.SESSION_COOKIE_NAME)
+        if not key:
+            return False
+        session = import_module(settings.SESSION_ENGINE).SessionStore(key)
+        user = get_user(SimpleNamespace(session=session))
+        if not user.is_authenticated or not Event.objects.filter(pk=event_id, author=user).exists():
+            return False
+        return None
+    finally:
+        close_old_connections()
+
+
+async def _send_json(send, payload):
+    await send({'type': 'websocket.send', 'text': json.dumps(payload, ensure_ascii=False)})
+
+
+async def _sender(send, subscription, window, kinds=None):
+    """변경분을 window(초) 동안 모아 'batch' 프레임 1개로 전송 (immediate 변경분은 기다리지 않음)"""
+    while True:
+        first = await subscription.queue.get()
+        if window and not first.get('immediate'):
+            await asyncio.sleep(window)
+        messages = [first, *subscription.drain()]
+        if subscription.overflowed:
+            subscription.overflowed = False
+            messages = [_RESYNC]
+        if kinds is not None:
+            messages = [m for m in messages if m['type'] in kinds]
+        if messages:
+            await _send_json(send, {'type': 'batch', 'deltas': coalesce(messages)})
+
+
+async def websocket_app(scope, receive, send):
+    match = PATH_PATTERN.match(scope.get('path', ''))
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    if match is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    event_id = int(match.group(1))
+    headers = dict(scope.get('headers') or [])
+    kinds = False
+    if _same_origin(headers):
+        cookie = headers.get(b'cookie', b'').decode('latin-1')
+        token = parse_qs(scope.get('query_string', b'').decode('latin-1')).get('show', [None])[0]
+        kinds = await sync_to_async(_authorize)(cookie, event_id, token)
+    if kinds is False:
+        await send({'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+        return
+
+    broker = get_broker()
+    channel = channel_name(event_id)
+    subscription = broker.subscribe(channel, getattr(settings, 'REALTIME_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+    await send({'type': 'websocket.accept'})
+    await _send_json(send, {'type': 'hello', 'event': event_id, 'server_time': time.time() * 1000})
+
+    window = getattr(settings, 'REALTIME_COALESCE_MS', DEFAULT_COALESCE_MS) / 1000
+    sender = asyncio.ensure_future(_sender(send, subscription, window, kinds))
+    try:
+        while True:
+            message = await receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+            if message['type'] == 'websocket.receive' and message.get('text'):
+                # 연결 유지 / 시계 오차 측정용 ping (클라이언트가 보낸 시각과 서버 시각을 되돌려 줌)
+                try:
+                    payload = json.loads(message['text'])
+                except ValueError:
+                    continue
+                if isinstance(payload, dict) and payload.get('type') == 'ping':
+                    await _send_json(send, {'type': 'pong', 't0': payload.get('t0'), 'server_time': time.time() * 1000})
+    finally:
+        sender.cancel()
+        broker.unsubscribe(channel, subscription)
@@ -0,0 +1,247 @@
+# ==========================================
+# 트러스 / 리깅 포인트 하중 계산
+# ==========================================
+# - 좌표는 조명 플롯(LightingEngine layout)과 같음: 무대 중심 원점, 객석 쪽 -y
+# - 트러스: 조명 layout 의 y 가 비슷한(TRUSS_MERGE_M 이내) 조명끼리 한 줄 (업스테이지 빔+워시 / FOH 스팟)
+#   하중 = 조명 무게(+케이블) 집중하중 + 트러스 자중 등분포하중 / 호이스트 자중은 포인트에 직접
+# - 매달 지점: 등록 공간(venue_geometry)의 리깅 포인트 중 트러스 선 아래(RIGGING_SNAP_M 이내)에 있는 것
+#   2개 미만이면 호이스트를 HOIST_SPACING_M 간격으로 둔다고 가정 (포인트 허용하중은 settings 기본값)
+# - 지점 반력: 연속보 3모멘트 방정식 (지점 n개 -> 내부 지점 모멘트 n-2개의 3중 대각 연립방정식 1회 풀이)
+#   지점 2개면 단순보 / 양 끝 돌출부(캔틸레버) 하중 포함 / 하중 수백 개도 bincount 로 한 번에 합산
+# - 라인어레이(calculate_audio 의 array)는 무대 좌우 1점 매달기 - 가장 가까운 리깅 포인트 허용하중과 비교
+# - 결과는 입력(트러스 하중 / 지점 / 허용하중) 해시로 캐시 -> 도면·리그가 같으면 다시 풀지 않음
+#   RIGGING_POINT_KG        : 등록 포인트가 없을 때 가정하는 포인트 허용하중
+#   RIGGING_TRUSS_MOMENT_KGM: 트러스 허용 휨모멘트 (30cm 박스 트러스 제조사 표 기준 근사)
+
+import hashlib
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from .calculators import LightingEngine, calculate_audio
+from .instrumentation import timed
+from .venues import venue_geometry
+
+FIXTURE_KG = {'Beam': 20.0, 'Wash': 12.0, 'Spot': 9.0}
+CABLE_KG = 1.5              # 조명 1대당 전원/신호 케이블
+TRUSS_KG_PER_M = 7.0        # 30cm 박스 트러스 자중
+HOIST_KG = 55.0             # 1t 체인 호이스트 자중 (포인트에 직접)
+CABINET_KG = 30.0           # 라인어레이 1통
+ARRAY_FRAME_KG = 25.0       # 라인어레이 플라잉 프레임
+TRUSS_MERGE_M = 0.5
+TRUSS_OVERHANG_M = 0.5      # 양 끝 호이스트 안쪽 여유
+HOIST_SPACING_M = 6.0
+RIGGING_SNAP_M = 1.0
+SUPPORT_MERGE_M = 0.3       # 이보다 가까운 리깅 포인트는 같은 매달 지점 (트러스 선에 가장 가까운 것 사용)
+DEFAULT_POINT_KG = 500.0
+DEFAULT_TRUSS_MOMENT_KGM = 1000.0
+RIGGING_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _limits():
+    return (
+        getattr(settings, 'RIGGING_POINT_KG', DEFAULT_POINT_KG),
+        getattr(settings, 'RIGGING_TRUSS_MOMENT_KGM', DEFAULT_TRUSS_MOMENT_KGM),
+    )
+
+
+# ------------------------------------------
+# 1. 연속보 풀이 (3모멘트 방정식)
+# ------------------------------------------
+
+def solve_beam(supports, x, p, udl, start, end):
+    """지점 좌표 / 집중하중 (x, p kg) / 등분포 udl kg/m / 보 양 끝 -> (지점 반력, 지점 모멘트, 최대 |모멘트| kg·m)
+
+    같은 위치(SUPPORT_MERGE_M 이내)의 지점은 1개로 풀고 반력을 똑같이 나눔 (길이 0 경간 방지)
+    """
+    supports = np.asarray(supports, dtype=float)
+    order = np.argsort(supports, kind='stable')
+    group = np.concatenate([[0], np.cumsum(np.diff(supports[order]) > SUPPORT_MERGE_M)])
+    if group[-1] + 1 < len(supports):
+        s = np.array([supports[order][group == g].mean() for g in range(group[-1] + 1)])
+        if len(s) < 2:
+            raise ValueError("트러스를 매달 지점이 2개 이상 필요합니다.")
+        reactions, M, peak = solve_beam(s, x, p, udl, start, end)
+        owner = np.empty(len(supports), dtype=int)
+        owner[order] = group
+        share = np.bincount(owner)
+        return reactions[owner] / share[owner], M[owner], peak
+    s = supports
+    x, p = np.asarray(x, dtype=float), np.asarray(p, dtype=float)
+    n = len(s)
+    L = np.diff(s)
+
+    # 양 끝 돌출부(캔틸레버) -> 끝 지점 모멘트는 정해진 값 (아래로 처지는 쪽 +)
+    left, right = x < s[0], x > s[-1]
+    M = np.zeros(n)
+    M[0] = -(p[left] * (s[0] - x[left])).sum() - udl * (s[0] - start) ** 2 / 2
+    M[-1] = -(p[right] * (x[right] - s[-1])).sum() - udl * (end - s[-1]) ** 2 / 2
+
+    inside = ~left & ~right
+    span = np.clip(np.searchsorted(s, x[inside], 'right') - 1, 0, n - 2)
+    P, a = p[inside], x[inside] - s[span]
+    b = L[span] - a
+
+    if n > 2:
+        # 지점 i: M(i-1)·L(i-1) + 2·M(i)·(L(i-1)+L(i)) + M(i+1)·L(i) = -(왼쪽 경간 항 + 오른쪽 경간 항)
+        to_right = np.bincount(span, P * a * (L[span] ** 2 - a ** 2) / L[span], minlength=n - 1) + udl * L ** 3 / 4
+        to_left = np.bincount(span, P * b * (L[span] ** 2 - b ** 2) / L[span], minlength=n - 1) + udl * L ** 3 / 4
+        rhs = -(to_right[:-1] + to_left[1:])
+        rhs[0] -= L[0] * M[0]
+        rhs[-1] -= L[-1] * M[-1]
+        A = np.diag(2 * (L[:-1] + L[1:])) + np.diag(L[1:-1], 1) + np.diag(L[1:-1], -1)
+        M[1:-1] = np.linalg.solve(A, rhs)
+
+    # 경간별 왼쪽 끝 전단력 -> 지점 반력
+    span_load = np.bincount(span, P, minlength=n - 1) + udl * L
+    v_left = (M[1:] - M[:-1] + np.bincount(span, P * b, minlength=n - 1) + udl * L ** 2 / 2) / L
+    reactions = np.zeros(n)
+    reactions[:-1] += v_left
+    reactions[1:] += span_load - v_left
+    reactions[0] += p[left].sum() + udl * (s[0] - start)
+    reactions[-1] += p[right].sum() + udl * (end - s[-1])
+
+    # 휨모멘트: 하중점 / 지점 / 보 전체 0.1m 간격에서 왼쪽 끝부터 힘의 모멘트 합
+    probe = np.unique(np.concatenate([x, s, np.arange(start, end, 0.1), [end]]))
+    d_s = np.maximum(probe[:, None] - s[None, :], 0)
+    d_p = np.maximum(probe[:, None] - x[None, :], 0)
+    moment = d_s @ reactions - d_p @ p - udl * (probe - start) ** 2 / 2
+    return reactions, M, float(np.abs(moment).max()) if len(probe) else 0.0
+
+
+# ------------------------------------------
+# 2. 리그 구성 (트러스 / 매달 지점 / 라인어레이)
+# ------------------------------------------
+
+def _venue_points(event):
+    """등록 리깅 포인트 -> 조명 플롯 좌표 [(x, y, 허용하중, 이름)]"""
+    geometry = venue_geometry(event)
+    if not geometry:
+        return []
+    centre_y = event.venue_depth - event.stage_depth / 2 - 1.0  # 무대는 배치도와 같이 뒷벽에서 1m
+    point_kg, _ = _limits()
+    return [(p['x'] - event.venue_width / 2, p['y'] - centre_y, p['capacity_kg'] or point_kg, p['label'])
+            for p in geometry['rigging']]
+
+
+def _trusses(layout):
+    """y 가 비슷한 조명끼리 한 줄 -> [(y, [조명...])]"""
+    lines = []
+    for item in sorted((i for i in layout if i['type'] in FIXTURE_KG), key=lambda i: i['y']):
+        if lines and item['y'] - lines[-1][1][-1]['y'] <= TRUSS_MERGE_M:
+            lines[-1][1].append(item)
+        else:
+            lines.append([item['y'], [item]])
+    return [(float(np.mean([i['y'] for i in items])), items) for _, items in lines]
+
+
+def build_rig(event, layout=None):
+    """트러스 / 라인어레이 매달기 입력 (풀이 전) - 캐시 키도 이 값으로 만듦"""
+    if layout is None:
+        layout = LightingEngine(event).get_patch_data()[2]
+    point_kg, _ = _limits()
+    venue_points = _venue_points(event)
+    trusses, stage_trusses = [], 0
+    for y, items in _trusses(layout):
+        reach = max(abs(i['x']) for i in items) + TRUSS_OVERHANG_M + 0.5
+        half = max(event.stage_width / 2, reach)
+        # 트러스 선에 가까운 포인트부터 -> x 가 SUPPORT_MERGE_M 이내로 겹치면 먼저 고른 것만 (격자형 리깅 포인트)
+        snapped = []
+        for px, py, cap, label in sorted((pt for pt in venue_points if abs(pt[1] - y) <= RIGGING_SNAP_M
+                                          and abs(pt[0]) <= half), key=lambda pt: (abs(pt[1] - y), pt[0])):
+            if all(abs(px - other[0]) > SUPPORT_MERGE_M for other in snapped):
+                snapped.append((round(px, 3), cap, label))
+        snapped.sort()
+        if len(snapped) >= 2:
+            supports = [{'x': px, 'capacity_kg': cap, 'label': label or f'P{k + 1}', 'assumed': False}
+                        for k, (px, cap, label) in enumerate(snapped)]
+        else:
+            inner = half - TRUSS_OVERHANG_M
+            count = int(np.ceil(2 * inner / HOIST_SPACING_M)) + 1
+            supports = [{'x': round(float(px), 3), 'capacity_kg': point_kg, 'label': f'H{k + 1}', 'assumed': True}
+                        for k, px in enumerate(np.linspace(-inner, inner, count))]
+        foh = y < -event.stage_depth / 2
+        stage_trusses += not foh
+        trusses.append({
+            'name': 'FOH 트러스' if foh else f'무대 트러스 {stage_trusses}',
+            'y': round(y, 3), 'start': -half, 'end': half,
+            'loads': [(round(i['x'], 3), FIXTURE_KG[i['type']] + CABLE_KG) for i in items],
+            'supports': supports,
+        })
+
+    hangs = []
+    audio = calculate_audio(event)['specs']
+    if audio['main_type'] == 'array':
+        weight = audio['main_qty'] / 2 * CABINET_KG + ARRAY_FRAME_KG + HOIST_KG
+        for side, x in (('L', -(event.stage_width / 2 + 1.5)), ('R', event.stage_width / 2 + 1.5)):
+            y = -event.stage_depth / 2
+            near = [(np.hypot(px - x, py - y), cap, label) for px, py, cap, label in venue_points]
+            near = min(near) if near else None
+            assumed = near is None or near[0] > RIGGING_SNAP_M * 1.5
+            hangs.append({
+                'label': f'PA {side}' if assumed else (near[2] or f'PA {side}'),
+                'x': x, 'y': y, 'load_kg': round(weight, 1),
+                'capacity_kg': point_kg if assumed else near[1], 'assumed': assumed,
+            })
+    return {'trusses': trusses, 'hangs': hangs}
+
+
+# ------------------------------------------
+# 3. 하중 계산 / 과하중 판정
+# ------------------------------------------
+
+def _rig_key(rig):
+    return 'eos:rigging:' + hashlib.sha1(repr((rig, _limits())).encode('utf-8')).hexdigest()
+
+
+@timed('calc')
+def rigging_loads(event, layout=None):
+    """트러스별 지점 하중 / 최대 휨모멘트 / 과하중 표시 dict (입력이 같으면 캐시)"""
+    rig = build_rig(event, layout)
+    key = _rig_key(rig)
+    report = cache.get(key)
+    if report is not None:
+        return report
+
+    _, moment_limit = _limits()
+    report = {'trusses': [], 'hangs': rig['hangs'], 'points': [], 'warnings': [], 'infos': []}
+    for truss in rig['trusses']:
+        x, p = zip(*truss['loads'])
+        supports = [s['x'] for s in truss['supports']]
+        reactions, _, max_moment = solve_beam(supports, x, p, TRUSS_KG_PER_M, truss['start'], truss['end'])
+        points = []
+        for support, reaction in zip(truss['supports'], reactions):
+            load = round(float(reaction) + HOIST_KG, 1)
+            points.append({**support, 'y': truss['y'], 'load_kg': load, 'over': load > support['capacity_kg']})
+        report['trusses'].append({
+            'name': truss['name'], 'y': truss['y'], 'length': round(truss['end'] - truss['start'], 1),
+            'fixtures': len(truss['loads']), 'points': points,
+            'total_kg': round(sum(pt['load_kg'] for pt in points), 1),
+            'max_moment': round(max_moment, 1), 'over': max_moment > moment_limit,
+        })
+        report['points'].extend(points)
+    for hang in rig['hangs']:
+        hang['over'] = hang['load_kg'] > hang['capacity_kg']
+        report['points'].append(hang)
+
+    overloaded = [pt for pt in report['points'] if pt['over']]
+    report['total_kg'] = round(sum(pt['load_kg'] for pt in report['points']), 1)
+    report['overloaded'] = len(overloaded)
+    report['infos'].append(
+        f"✅ 리깅 총 하중 {report['total_kg']:,}kg (트러스 {len(report['trusses'])}줄 / 매달 지점 {len(report['points'])}개)"
+    )
+    if overloaded:
+        report['warnings'].append(
+            f"허용하중 초과 포인트 {len(overloaded)}개: "
+            + ', '.join(f"{pt['label']} {pt['load_kg']:.0f}/{pt['capacity_kg']:.0f}kg" for pt in overloaded[:6])
+        )
+    for truss in report['trusses']:
+        if truss['over']:
+            report['warnings'].append(
+                f"{truss['name']} 휨모멘트 {truss['max_moment']:.0f}kg·m - 허용 {moment_limit:.0f}kg·m 초과 (호이스트 추가 권장)"
+            )
+    if any(pt['assumed'] for pt in report['points']):
+        report['infos'].append("✅ 등록 리깅 포인트가 없는 곳은 호이스트 위치 / 허용하중을 가정 (현장 도면 확인 필요)")
+    cache.set(key, report, RIGGING_CACHE_TIMEOUT)
+    return report
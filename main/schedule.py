@@ -0,0 +1,261 @@
+# ==========================================
+# 선후행 일정 엔진 (CPM: Critical Path Method)
+# ==========================================
+# - 그래프: Task = 노드(소요일 duration_days), TaskDependency = 간선(선행 -> 후행, lag_days)
+# - 위상 정렬(Kahn) 1회 + 전진/후진 계산 1회씩 -> O(V+E)
+#   ES(가장 빠른 시작) = max(선행 ES + 선행 소요일 + lag), 선행이 없으면 0일차
+#   LS(가장 늦은 시작) = min(후행 LS - lag) - 소요일, 후행이 없으면 프로젝트 종료일 기준
+#   여유(slack) = LS - ES, 여유 0 = 주공정(critical)
+# - 순환(A -> B -> A)은 위상 정렬에서 남는 노드로 감지해 ScheduleCycleError
+# - 한 Task 가 바뀌면: ES 는 그 Task 의 하류(downstream)만, LS 는 그 Task 의 상류만 다시 계산
+#   (프로젝트 전체 기간이 바뀌었거나 기존 종료일을 알 수 없으면 전체 후진 계산)
+# - 행사일 변경 시 마감일 일괄 이동 (shift_deadlines: UPDATE 1회)
+
+from collections import defaultdict, deque
+
+from django.db import transaction
+from django.db.models import DateField, ExpressionWrapper, F
+
+from .models import Task, TaskDependency
+from .realtime import tasks_changed
+from .tab_cache import SOURCE_TASKS, touch_sources
+
+
+class ScheduleCycleError(ValueError):
+    """선후행 관계에 순환이 있음 (task_ids: 순환에 걸린 Task)"""
+
+    def __init__(self, task_ids):
+        self.task_ids = list(task_ids)
+        super().__init__(f"선후행 관계에 순환이 있습니다: Task {self.task_ids}")
+
+
+# ------------------------------------------
+# 1. 순수 계산 (DB 없음 - dict 만 다룸)
+# ------------------------------------------
+
+def topo_order(nodes, succs, preds):
+    """nodes(집합) 안의 간선만 보고 위상 정렬 (Kahn) - 순환이면 ScheduleCycleError"""
+    indegree = {n: 0 for n in nodes}
+    for n in nodes:
+        for p, _ in preds[n]:
+            if p in indegree:
+                indegree[n] += 1
+
+    queue = deque(sorted(n for n, d in indegree.items() if d == 0))
+    order = []
+    while queue:
+        n = queue.popleft()
+        order.append(n)
+        for s, _ in succs[n]:
+            if s in indegree:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    queue.append(s)
+
+    if len(order) < len(indegree):
+        raise ScheduleCycleError(sorted(n for n, d in indegree.items() if d > 0))
+    return order
+
+
+def forward_pass(order, duration, preds, es):
+    """order 순서대로 ES 계산 (order 밖의 선행은 es 에 있는 기존 값 사용)"""
+    for n in order:
+        es[n] = max([0] + [es[p] + duration[p] + lag for p, lag in preds[n]])
+
+
+def backward_pass(order, duration, succs, ls, finish):
+    """order 역순으로 LS 계산 (order 밖의 후행은 ls 에 있는 기존 값 사용)"""
+    for n in reversed(order):
+        late_finish = min([ls[s] - lag for s, lag in succs[n]], default=finish)
+        ls[n] = late_finish - duration[n]
+
+
+def project_finish(duration, es):
+    return max((es[n] + duration[n] for n in duration), default=0)
+
+
+def compute_schedule(duration, succs, preds):
+    """전체 계산 -> (order, es, ls, finish)"""
+    order = topo_order(duration.keys(), succs, preds)
+    es, ls = {}, {}
+    forward_pass(order, duration, preds, es)
+    finish = project_finish(duration, es)
+    backward_pass(order, duration, succs, ls, finish)
+    return order, es, ls, finish
+
+
+def reachable(starts, edges):
+    """starts 에서 edges(succs 또는 preds) 방향으로 닿는 노드 전체 (starts 포함)"""
+    seen = set(starts)
+    stack = list(starts)
+    while stack:
+        n = stack.pop()
+        for m, _ in edges[n]:
+            if m not in seen:
+                seen.add(m)
+                stack.append(m)
+    return seen
+
+
+def critical_chain(order, duration, succs, es, ls):
+    """주공정 경로: 여유 0 인 Task 를 '딱 맞물린' 간선(선행 종료 + lag = 후행 시작)으로 연결"""
+    critical = {n for n in order if ls[n] == es[n]}
+    chain = []
+    current = next((n for n in order if n in critical and es[n] == 0), None)
+    while current is not None:
+        chain.append(current)
+        end = es[current] + duration[current]
+        current = next(
+            (s for s, lag in sorted(succs[current]) if s in critical and es[s] == end + lag), None
+        )
+    return chain
+
+
+# ------------------------------------------
+# 2. DB 연동
+# ------------------------------------------
+
+def load_graph(event):
+    """행사의 Task/선후행 관계 로딩 (쿼리 2회)"""
+    tasks = {
+        t['id']: t for t in Task.objects.filter(event=event).values(
+            'id', 'content', 'duration_days', 'early_start', 'late_start', 'is_critical',
+            'deadline', 'is_done', 'task_category',
+        )
+    }
+    succs, preds = defaultdict(list), defaultdict(list)
+    edges = TaskDependency.objects.filter(successor__event=event).values_list('predecessor_id', 'successor_id', 'lag_days')
+    for p, s, lag in edges:
+        succs[p].append((s, lag))
+        preds[s].append((p, lag))
+    return tasks, succs, preds
+
+
+def _save(event, tasks, es, ls, nodes):
+    """계산 결과가 바뀐 Task 만 bulk_update"""
+    changed = []
+    for n in nodes:
+        t = tasks[n]
+        critical = es[n] == ls[n]
+        if (t['early_start'], t['late_start'], t['is_critical']) != (es[n], ls[n], critical):
+            changed.append(Task(pk=n, early_start=es[n], late_start=ls[n], is_critical=critical))
+    if changed:
+        Task.objects.bulk_update(changed, ['early_start', 'late_start', 'is_critical'], batch_size=500)
+        touch_sources(event.id, SOURCE_TASKS)  # bulk_update 는 시그널이 없음
+    return len(changed)
+
+
+@transaction.atomic
+def reschedule(event, changed_ids=None):
+    """일정 재계산 후 저장 -> 값이 바뀐 Task 수
+
+    changed_ids: 소요일/선후행이 바뀐 Task (간선 추가·삭제 시 양 끝 모두).
+                 None 이거나 아직 계산된 적 없는 Task 가 있으면 전체 계산.
+    """
+    tasks, succs, preds = load_graph(event)
+    duration = {n: t['duration_days'] for n, t in tasks.items()}
+    changed_ids = [n for n in (changed_ids or []) if n in tasks]
+    fresh = any(t['early_start'] is None or t['late_start'] is None for t in tasks.values())
+
+    if changed_ids and not fresh:
+        es = {n: t['early_start'] for n, t in tasks.items()}
+        ls = {n: t['late_start'] for n, t in tasks.items()}
+        # 기존 종료일: 바뀌지 않은 마지막 Task(후행 없음)는 LS + 소요일 = 종료일 (바뀐 Task 의 소요일은 이미 새 값)
+        unchanged = set(tasks) - set(changed_ids)
+        sink = next((n for n in unchanged if not succs[n]), None)
+        old_finish = ls[sink] + duration[sink] if sink is not None else None
+
+        # 전진: 바뀐 Task 의 하류만
+        downstream = reachable(changed_ids, succs)
+        forward_pass(topo_order(downstream, succs, preds), duration, preds, es)
+        finish = project_finish(duration, es)
+
+        if finish == old_finish:
+            # 후진: 바뀐 Task 의 상류만 (하류 Task 의 LS 는 후행이 그대로라 변하지 않음)
+            upstream = reachable(changed_ids, preds)
+            backward_pass(topo_order(upstream, succs, preds), duration, succs, ls, finish)
+            return _save(event, tasks, es, ls, downstream | upstream)
+
+    _, es, ls, _ = compute_schedule(duration, succs, preds)
+    return _save(event, tasks, es, ls, tasks.keys())
+
+
+def event_schedule(event):
+    """화면용 일정표: 위상 순서의 Task 행 + 주공정 경로 + 전체 기간"""
+    tasks, succs, preds = load_graph(event)
+    duration = {n: t['duration_days'] for n, t in tasks.items()}
+    order, es, ls, finish = compute_schedule(duration, succs, preds)
+    chain = critical_chain(order, duration, succs, es, ls)
+
+    rows = []
+    for n in order:
+        rows.append({
+            **tasks[n],
+            'es': es[n],
+            'ef': es[n] + duration[n],
+            'ls': ls[n],
+            'lf': ls[n] + duration[n],
+            'slack': ls[n] - es[n],
+            'window': ls[n] + duration[n] - es[n],  # ES ~ LF (간트 막대의 여유 구간)
+            'critical': ls[n] == es[n],
+            'preds': [(p, lag, tasks[p]['content']) for p, lag in preds[n]],
+        })
+    return {
+        'rows': rows,
+        'finish': finish,
+        'chain': [tasks[n] for n in chain],
+        'edge_count': sum(len(v) for v in succs.values()),
+    }
+
+
+# ------------------------------------------
+# 3. 선후행 관계 추가 / 삭제
+# ------------------------------------------
+
+@transaction.atomic
+def add_dependency(predecessor, successor, lag_days=0):
+    """선후행 추가 - 같은 행사만, 순환이 생기면 ScheduleCycleError"""
+    if predecessor.event_id != successor.event_id:
+        raise ValueError("같은 행사의 Task 끼리만 연결할 수 있습니다.")
+    if predecessor.pk == successor.pk:
+        raise ScheduleCycleError([predecessor.pk])
+
+    _, succs, _ = load_graph(successor.event)
+    # successor 에서 출발해 predecessor 에 닿으면 새 간선이 순환을 만듦
+    if predecessor.pk in reachable([successor.pk], succs):
+        raise ScheduleCycleError([predecessor.pk, successor.pk])
+
+    dependency, _ = TaskDependency.objects.update_or_create(
+        predecessor=predecessor, successor=successor, defaults={'lag_days': lag_days},
+    )
+    reschedule(successor.event, [predecessor.pk, successor.pk])
+    return dependency
+
+
+@transaction.atomic
+def remove_dependency(dependency):
+    event = dependency.successor.event
+    ends = [dependency.predecessor_id, dependency.successor_id]
+    dependency.delete()
+    reschedule(event, ends)
+
+
+# ------------------------------------------
+# 4. 행사일 변경 -> 마감일 일괄 이동
+# ------------------------------------------
+
+def shift_deadlines(event, delta, include_done=False):
+    """모든 Task 마감일을 delta 만큼 이동 (UPDATE 1회) -> 이동한 Task 수
+
+    행사일 기준 D-n 간격이 Task 마다 그대로 유지됨. include_done=False 면 완료된 Task 는 그대로 둠.
+    """
+    if not delta:
+        return 0
+    tasks = Task.objects.filter(event=event)
+    if not include_done:
+        tasks = tasks.filter(is_done=False)
+    count = tasks.update(deadline=ExpressionWrapper(F('deadline') + delta, output_field=DateField()))
+    if count:
+        touch_sources(event.id, SOURCE_TASKS)  # update() 는 시그널이 없음
+        tasks_changed(event.id, 'deadlines_shifted')
+    return count
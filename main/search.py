@@ -0,0 +1,233 @@
+# ==========================================
+# 통합 검색 (행사 / Task / 업체 / 큐시트)
+# ==========================================
+# - 검색 대상 1건 = SearchDocument 1행 (모델 시그널로 저장/삭제 시 같은 트랜잭션에서 갱신)
+# - 전문 색인은 DB 가 관리
+#   SQLite     : FTS5 외부 콘텐츠 테이블(main_searchdocument_fts) + 트리거 -> bm25 순위
+#   PostgreSQL : tsvector 식 GIN 인덱스(search_document_tsv_idx) -> ts_rank 순위
+#   (두 색인 모두 0020 마이그레이션에서 생성)
+# - 한글은 형태소 분석 없이 2글자씩 겹쳐 끊어(bigram) 색인: "코엑스홀" -> "코엑 엑스 스홀"
+#   검색어도 같은 방식으로 끊어 연속 구문(phrase)으로 찾으므로 조사가 붙은 단어 중간도 검색됨
+# - 영문/숫자는 단어 단위 + 접두어 검색 ("led" -> "LED wall", "ledwall")
+
+import re
+import unicodedata
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+
+from .models import Cue, Event, SearchDocument, Task, Vendor
+
+FTS_TABLE = 'main_searchdocument_fts'
+TITLE_WEIGHT = 10.0  # 제목(행사명, 할 일, 업체명, 큐 내용) 일치를 본문보다 우선
+BODY_WEIGHT = 1.0
+DEFAULT_LIMIT = 50
+BATCH_SIZE = 500
+
+# 한글/한자/가나 연속 구간 | 그 밖의 글자·숫자 연속 구간
+_CJK = '가-힣ㄱ-ㆎ぀-ヿ一-鿿'
+_RUN = re.compile(rf'[{_CJK}]+|[^\W_{_CJK}]+')
+_CJK_RUN = re.compile(rf'[{_CJK}]')
+
+# 색인 대상 필드 (이 필드가 저장될 때만 문서 갱신)
+INDEXED_FIELDS = {
+    'event': {'title', 'client_name', 'venue_name'},
+    'task': {'content'},
+    'vendor': {'name', 'contact_person'},
+    'cue': {'content'},
+}
+KIND_OF_MODEL = {Event: 'event', Task: 'task', Vendor: 'vendor', Cue: 'cue'}
+MODEL_OF_KIND = {kind: model for model, kind in KIND_OF_MODEL.items()}
+
+
+# ------------------------------------------
+# 1. 토큰화 (순수 함수 - 0020 마이그레이션에 사본이 있음)
+# ------------------------------------------
+
+def _runs(text):
+    return _RUN.findall(unicodedata.normalize('NFKC', text or '').lower())
+
+
+def search_terms(text):
+    """색인용 토큰 문자열: 한글 구간은 bigram, 나머지는 단어 그대로"""
+    terms = []
+    for run in _runs(text):
+        if len(run) > 1 and _CJK_RUN.match(run):
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return ' '.join(terms)
+
+
+def _query_parts(query):
+    """검색어 -> [(토큰 목록, 접두어 여부)] - 모든 부분이 일치해야 함 (AND)"""
+    parts = []
+    for run in _runs(query):
+        if len(run) > 1 and _CJK_RUN.match(run):
+            parts.append(([run[i:i + 2] for i in range(len(run) - 1)], False))
+        else:
+            # 한 글자 한글 / 영문·숫자 단어는 접두어 검색
+            parts.append(([run], True))
+    return parts
+
+
+def fts5_query(query):
+    """SQLite FTS5 MATCH 식: "코엑 엑스" "led"*"""
+    return ' '.join(
+        '"{}"{}'.format(' '.join(tokens), '*' if prefix else '') for tokens, prefix in _query_parts(query)
+    )
+
+
+def tsquery(query):
+    """PostgreSQL to_tsquery 식: '코엑' <-> '엑스' & 'led':*"""
+    return ' & '.join(
+        f"'{tokens[0]}':*" if prefix else '({})'.format(' <-> '.join(f"'{t}'" for t in tokens))
+        for tokens, prefix in _query_parts(query)
+    )
+
+
+# ------------------------------------------
+# 2. 색인 갱신
+# ------------------------------------------
+
+def _texts(kind, obj):
+    """모델 객체 -> (제목, 본문)"""
+    if kind == 'event':
+        return obj.title, ' · '.join(filter(None, [obj.client_name, obj.venue_name]))
+    if kind == 'vendor':
+        return obj.name, obj.contact_person
+    return obj.content, ''
+
+
+def build_documents(kind, objs, authors=None):
+    """모델 객체 목록 -> 저장 전 SearchDocument 목록 (authors: {행사 id: 작성자 id})"""
+    docs = []
+    for obj in objs:
+        title, body = _texts(kind, obj)
+        if kind == 'event':
+            event_id, author_id = obj.pk, obj.author_id
+        elif kind == 'vendor':
+            event_id = author_id = None
+        else:
+            event_id, author_id = obj.event_id, authors[obj.event_id]
+        docs.append(SearchDocument(
+            kind=kind, object_id=obj.pk, event_id=event_id, author_id=author_id,
+            title=title[:500], body=body[:500],
+            title_terms=search_terms(title), body_terms=search_terms(body),
+        ))
+    return docs
+
+
+@transaction.atomic
+def index_objects(kind, objs):
+    """objs 의 검색 문서 교체 (DELETE 1회 + INSERT 1회) - bulk_create 처럼 시그널이 없는 경로에서 직접 호출"""
+    objs = list(objs)
+    if not objs:
+        return []
+    authors = None
+    if kind in ('task', 'cue'):
+        authors = dict(Event.objects.filter(pk__in={o.event_id for o in objs}).values_list('id', 'author_id'))
+    SearchDocument.objects.filter(kind=kind, object_id__in=[o.pk for o in objs]).delete()
+    return SearchDocument.objects.bulk_create(build_documents(kind, objs, authors), batch_size=BATCH_SIZE)
+
+
+def remove_object(kind, object_id):
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def reindex_event(event_id):
+    """행사 1건과 그 Task / 큐 전체 재색인 (복제처럼 시그널 없이 만든 행사용)"""
+    index_objects('event', Event.objects.filter(pk=event_id))
+    index_objects('task', Task.objects.filter(event_id=event_id).only('id', 'event_id', 'content'))
+    index_objects('cue', Cue.objects.filter(event_id=event_id).only('id', 'event_id', 'content'))
+
+
+def _chunks(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@transaction.atomic
+def rebuild_index():
+    """전체 재색인 -> 문서 수 (update() / raw SQL / 데이터 이관 이후 실행)"""
+    SearchDocument.objects.all().delete()
+    authors = dict(Event.objects.values_list('id', 'author_id'))
+    count = 0
+    for kind, model in MODEL_OF_KIND.items():
+        objs = model.objects.order_by('pk').iterator(chunk_size=2000)
+        for batch in _chunks(objs, 2000):
+            docs = build_documents(kind, batch, authors)
+            count += len(SearchDocument.objects.bulk_create(docs, batch_size=BATCH_SIZE))
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")  # 세그먼트 병합
+    return count
+
+
+# ------------------------------------------
+# 3. 검색
+# ------------------------------------------
+
+_COLUMNS = "d.id, d.kind, d.object_id, d.event_id, d.author_id, d.title, d.body, e.title AS event_title"
+
+_SQLITE_SEARCH = f"""
+    SELECT {_COLUMNS}, bm25({FTS_TABLE}, %s, %s) AS score
+    FROM {FTS_TABLE} f
+    JOIN main_searchdocument d ON d.id = f.rowid
+    LEFT JOIN main_event e ON e.id = d.event_id
+    WHERE {FTS_TABLE} MATCH %s AND (d.author_id = %s OR d.author_id IS NULL){{kinds}}
+    ORDER BY score
+    LIMIT %s
+"""
+
+# 마이그레이션의 GIN 인덱스와 같은 식이어야 인덱스를 사용함
+_PG_VECTOR = (
+    "(setweight(to_tsvector('simple', d.title_terms), 'A') || "
+    "setweight(to_tsvector('simple', d.body_terms), 'B'))"
+)
+_PG_SEARCH = f"""
+    SELECT {_COLUMNS}, ts_rank({_PG_VECTOR}, q) AS score
+    FROM main_searchdocument d
+    CROSS JOIN to_tsquery('simple', %s) q
+    LEFT JOIN main_event e ON e.id = d.event_id
+    WHERE {_PG_VECTOR} @@ q AND (d.author_id = %s OR d.author_id IS NULL){{kinds}}
+    ORDER BY score DESC
+    LIMIT %s
+"""
+
+
+def search_documents(user, query, kinds=None, limit=DEFAULT_LIMIT):
+    """내 행사(+ 공용 업체)에서 검색 -> 순위순 SearchDocument 목록 (score, event_title 포함)"""
+    if not _query_parts(query):
+        return []
+    kinds = [k for k in (kinds or []) if k in INDEXED_FIELDS]
+    kind_sql = ''
+    if kinds:
+        kind_sql = ' AND d.kind IN ({})'.format(', '.join(['%s'] * len(kinds)))
+
+    if connection.vendor == 'sqlite':
+        sql = _SQLITE_SEARCH.format(kinds=kind_sql)
+        params = [TITLE_WEIGHT, BODY_WEIGHT, fts5_query(query), user.pk, *kinds, limit]
+    elif connection.vendor == 'postgresql':
+        sql = _PG_SEARCH.format(kinds=kind_sql)
+        params = [tsquery(query), user.pk, *kinds, limit]
+    else:
+        return _fallback_search(user, query, kinds, limit)
+    return list(SearchDocument.objects.raw(sql, params))
+
+
+def _fallback_search(user, query, kinds, limit):
+    """전문 색인이 없는 DB: 토큰 문자열 부분 일치 (순위 없음)"""
+    docs = SearchDocument.objects.filter(Q(author=user) | Q(author__isnull=True))
+    if kinds:
+        docs = docs.filter(kind__in=kinds)
+    for tokens, _ in _query_parts(query):
+        phrase = ' '.join(tokens)
+        docs = docs.filter(Q(title_terms__contains=phrase) | Q(body_terms__contains=phrase))
+    return list(docs.annotate(event_title=F('event__title')).order_by('kind', 'id')[:limit])
@@ -0,0 +1,94 @@
+# ==========================================
+# 라이브 큐 진행 (Show Calling)
+# ==========================================
+# - 운영자가 GO / 이전 / 특정 큐로 이동 -> ShowRun 1행 갱신 -> 커밋 후 행사 채널로 'show' 상태 발행
+#   (main/realtime.py: 'show' 는 묶음 대기 없이 즉시 전송 -> 같은 프로세스 안에서는 수 ms 안에 전달)
+# - 상태에는 현재/다음 큐와 '현재 큐 시작 시각'(서버 epoch ms)만 담음
+#   -> 남은 시간은 각 화면이 (내 시계 + 서버 시계 오차) 로 직접 계산하므로 매초 보낼 필요가 없음
+#   -> 시계 오차는 ping/pong 왕복으로 추정 (offset = 서버 시각 - (보낸 시각 + 왕복/2), 왕복이 가장 짧은 표본 사용)
+# - 동시에 두 명이 GO 를 눌러도 행 잠금(select_for_update)으로 한 번씩 순서대로 처리, version 으로 순서 확인
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Cue, ShowRun
+from .realtime import publish_delta
+from .timeline import build_timeline, ordered_cues
+
+ACTIONS = ('start', 'next', 'prev', 'goto', 'stop')
+
+
+def _epoch_ms(value):
+    return int(value.timestamp() * 1000) if value else None
+
+
+def _cue_payload(row):
+    if row is None:
+        return None
+    cue = row['cue']
+    return {
+        'id': cue.id, 'no': row['no'], 'content': cue.content, 'duration': cue.duration,
+        'bgm': cue.bgm, 'action': cue.action, 'planned_start': row['start_label'],
+    }
+
+
+def show_state(run, rows=None):
+    """ShowRun -> 화면에 보낼 상태 dict (rows: build_timeline 결과 행, 없으면 조회)"""
+    if rows is None:
+        rows = build_timeline(ordered_cues(run.event).only('id', 'content', 'duration', 'bgm', 'action'))['rows']
+    index = next((i for i, row in enumerate(rows) if row['cue'].id == run.current_cue_id), None)
+    current = rows[index] if index is not None else None
+    following = rows[index + 1] if index is not None and index + 1 < len(rows) else None
+    if index is None and not run.is_running and rows:
+        following = rows[0]  # 시작 전: 첫 큐가 '다음'
+    return {
+        'running': run.is_running,
+        'version': run.version,
+        'cue': _cue_payload(current),
+        'next': _cue_payload(following),
+        'cue_started_at': _epoch_ms(run.cue_started_at),
+        'total': len(rows),
+    }
+
+
+def get_run(event):
+    run, _ = ShowRun.objects.get_or_create(event=event)
+    return run
+
+
+@transaction.atomic
+def control(event, action, cue_id=None):
+    """운영자 조작 1회 -> 새 상태 dict (커밋 후 모든 화면으로 발행)"""
+    if action not in ACTIONS:
+        raise ValueError(f"알 수 없는 조작: {action}")
+    get_run(event)
+    run = ShowRun.objects.select_for_update().get(pk=event.pk)
+    run.event = event
+    rows = build_timeline(ordered_cues(event).only('id', 'content', 'duration', 'bgm', 'action'))['rows']
+    ids = [row['cue'].id for row in rows]
+    index = ids.index(run.current_cue_id) if run.current_cue_id in ids else None
+
+    if action == 'stop':
+        target, running = None, False
+    elif action == 'goto':
+        if cue_id not in ids:
+            raise Cue.DoesNotExist("이 행사의 큐가 아닙니다.")
+        target, running = ids.index(cue_id), True
+    elif action == 'prev':
+        target, running = max((index or 0) - 1, 0), True
+    elif action == 'start' or index is None:
+        target, running = 0, True
+    else:  # next: 마지막 큐에서 GO -> 종료
+        target, running = (index + 1, True) if index + 1 < len(ids) else (None, False)
+
+    if running and not ids:
+        target, running = None, False  # 큐가 없으면 시작할 수 없음
+    run.current_cue_id = ids[target] if target is not None else None
+    run.is_running = running
+    run.cue_started_at = timezone.now() if running else None
+    run.version += 1
+    run.save()
+
+    state = show_state(run, rows)
+    publish_delta(event.pk, 'show', 'show', immediate=True, state=state)
+    return state
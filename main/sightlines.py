@@ -0,0 +1,162 @@
+# ==========================================
+# 시야(Sightline) / 스크린 가독성 분석
+# ==========================================
+# - 좌석 좌표는 seat_layout (배치도와 같은 순서) / 모든 계산은 좌석 N개 배열 연산 (좌석 단위 반복 없음)
+# - 무대: 무대 앞 끝 중앙(높이 = stage_height + 발표자 상반신 FOCUS_ABOVE_STAGE)을 바라볼 때
+#   거리 / 정면에서 벗어난 각도 / 앞줄 머리 위 여유(C값)
+#   C값 = (초점 높이 - 눈높이) × 앞줄 간격 / 시선 거리  (평면 바닥: 모든 좌석 눈높이 동일)
+#   0.12m 이상 = 앞사람 머리 위로 보임, 0.06m = 앞사람 머리 사이로 보임(지그재그 배치), 0 이하 = 가림
+# - 스크린(has_screen): 측면 공간이 있으면 무대 양옆 2면, 없으면 무대 뒤 중앙 1면 (16:9)
+#   4-6-8 규칙: 화면 높이의 4배 이내 = 세부 판독, 6배 = 일반 문서, 8배 = 영상 시청 한계
+#   수평 각도 45° / 화면 윗단 올려보는 각도 35° 를 넘으면 감점
+# - 점수(0~100) = 무대 시야 + 머리 위 여유 + 스크린 가독성 가중합 (스크린이 없으면 앞의 둘만)
+
+import math
+
+import numpy as np
+
+from .calculators import seat_layout
+from .instrumentation import timed
+
+EYE_HEIGHT = 1.15           # 앉은 눈높이 (m)
+FOCUS_ABOVE_STAGE = 1.0     # 무대 바닥에서 초점(발표자 상반신)까지
+C_GOOD, C_MIN = 0.12, 0.06
+STAGE_DISTANCE_GOOD, STAGE_DISTANCE_MAX = 20.0, 35.0  # 표정 인식 / 한계 거리
+SIDE_SCREEN_SPACE = 2.5     # calculate_space 의 '200인치 가능' 기준과 같음
+GOOD_SCORE, POOR_SCORE = 70, 40
+
+WEIGHTS = {'stage': 0.35, 'clearance': 0.25, 'screen': 0.4}
+WEIGHTS_NO_SCREEN = {'stage': 0.6, 'clearance': 0.4}
+
+
+def _screen(x, y, diag_inch, bottom, ceiling):
+    """16:9 화면 1면 - 천장에 닿으면 높이에 맞춰 줄임"""
+    width = diag_inch * 0.0254 * 16 / math.hypot(16, 9)
+    height = width * 9 / 16
+    shrunk = bottom + height > ceiling - 0.3
+    if shrunk:
+        height = max(ceiling - 0.3 - bottom, 0.5)
+        width = height * 16 / 9
+    return {
+        'x': x, 'y': y, 'width': round(width, 2), 'height': round(height, 2), 'bottom': bottom,
+        'diag': round(width / 0.0254 * math.hypot(16, 9) / 16), 'shrunk': shrunk,
+    }
+
+
+def screen_positions(event, layout=None):
+    """스크린 목록 [{x, y, width, height, bottom, diag}] (영상 미사용이면 빈 목록)"""
+    if not event.has_screen:
+        return []
+    layout = layout or seat_layout(event)
+    stage_x, stage_y, s_w, s_d = layout['stage']
+    side = (event.venue_width - s_w) / 2
+    ceiling = event.venue_height
+    if side >= 1.0:
+        diag = 200 if side >= SIDE_SCREEN_SPACE else 120
+        bottom = max(2.0, event.stage_height + 1.0)
+        return [_screen(x, stage_y, diag, bottom, ceiling) for x in (side / 2, event.venue_width - side / 2)]
+    # 측면이 좁으면 무대 뒤 중앙 (발표자 머리 위)
+    return [_screen(event.venue_width / 2, stage_y + s_d, 200 if s_w >= 6 else 150, event.stage_height + 2.0, ceiling)]
+
+
+def _seat_centres(layout):
+    if layout['shape'] == 'rect':
+        return layout['x'] + layout['unit_w'] / 2, layout['y'] + layout['unit_d'] / 2, layout['unit_d'] + layout['gap_d']
+    return layout['x'], layout['y'], layout['gap_d']
+
+
+def _clearance(focus_h, distance, cos_angle, pitch, front_row):
+    """앞줄 머리 위 여유(C값) - 앞줄이 없으면 inf"""
+    along = pitch / np.maximum(cos_angle, 0.5)  # 비스듬히 볼수록 시선 방향 앞사람까지 멀어짐
+    c = (focus_h - EYE_HEIGHT) * along / np.maximum(distance, 0.1)
+    return np.where(front_row, np.inf, c)
+
+
+def _clearance_factor(c):
+    return np.interp(np.minimum(c, 1.0), [0.0, C_MIN, C_GOOD], [0.0, 0.6, 1.0])
+
+
+@timed('calc')
+def analyze_sightlines(event, layout=None):
+    """좌석별 무대 거리·각도 / C값 / 스크린 거리 배수 / 점수 -> dict (배열은 seat_layout 순서)"""
+    layout = layout or seat_layout(event)
+    stage_x, stage_y, s_w, s_d = layout['stage']
+    ex, ey, pitch = _seat_centres(layout)
+    front_row = ey >= ey.max() - 1e-6 if len(ey) else np.zeros(0, dtype=bool)
+    report = {'seats': len(ex), 'warnings': [], 'infos': []}
+
+    # 1) 무대
+    dx, dy = ex - event.venue_width / 2, np.maximum(stage_y - ey, 0.1)
+    distance = np.hypot(dx, dy)
+    angle = np.degrees(np.arctan2(np.abs(dx), dy))
+    focus_h = event.stage_height + FOCUS_ABOVE_STAGE
+    clearance = _clearance(focus_h, distance, dy / distance, pitch, front_row)
+    stage_view = (np.interp(distance, [STAGE_DISTANCE_GOOD, STAGE_DISTANCE_MAX], [1.0, 0.0])
+                  * np.interp(angle, [30, 60], [1.0, 0.0]))
+    parts = {'stage': stage_view, 'clearance': _clearance_factor(clearance)}
+
+    # 2) 스크린 (좌석 N × 스크린 S 배열 -> 가장 잘 보이는 화면 기준)
+    screens = screen_positions(event, layout)
+    screen_ratio = np.full(len(ex), np.nan)
+    if screens and len(ex):
+        sx = np.array([s['x'] for s in screens])[None, :]
+        sy = np.array([s['y'] for s in screens])[None, :]
+        height = np.array([s['height'] for s in screens])[None, :]
+        bottom = np.array([s['bottom'] for s in screens])[None, :]
+        sdx, sdy = sx - ex[:, None], np.maximum(sy - ey[:, None], 0.1)
+        sdist = np.hypot(sdx, sdy)
+        ratio = sdist / height
+        h_angle = np.degrees(np.arctan2(np.abs(sdx), sdy))
+        v_angle = np.degrees(np.arctan2(bottom + height - EYE_HEIGHT, sdist))
+        score = (np.interp(ratio, [4, 6, 8, 10], [1.0, 0.8, 0.5, 0.0])
+                 * np.interp(h_angle, [30, 45, 60], [1.0, 0.7, 0.0])
+                 * np.interp(v_angle, [35, 50], [1.0, 0.3])
+                 * _clearance_factor(_clearance(bottom, sdist, sdy / sdist, pitch, front_row[:, None])))
+        best = score.argmax(axis=1)
+        rows = np.arange(len(ex))
+        parts['screen'] = score[rows, best]
+        screen_ratio = ratio[rows, best]
+
+    weights = WEIGHTS if screens else WEIGHTS_NO_SCREEN
+    total = 100 * sum(weights[name] * parts[name] for name in weights) if len(ex) else np.zeros(0)
+
+    report.update({
+        'score': np.round(total, 1),
+        'distance': distance,
+        'angle': angle,
+        'clearance': clearance,
+        'screen_ratio': screen_ratio,
+        'screens': screens,
+    })
+    if not len(ex):
+        return report
+
+    good = total >= GOOD_SCORE
+    poor = total < POOR_SCORE
+    blocked = clearance < C_MIN
+    report.update({
+        'avg_score': round(float(total.mean()), 1),
+        'good_pct': round(float(good.mean()) * 100, 1),
+        'poor': int(poor.sum()),
+        'blocked': int(blocked.sum()),
+        'max_distance': round(float(distance.max()), 1),
+    })
+
+    if screens:
+        s = screens[0]
+        report['infos'].append(
+            f"✅ 스크린 {s['diag']}인치 × {len(screens)} ({s['width']}×{s['height']}m) - 글자 판독 {s['height'] * 6:.0f}m 이내"
+        )
+        illegible = int(np.sum(screen_ratio > 8))
+        if illegible:
+            report['warnings'].append(f"화면 높이의 8배보다 먼 좌석 {illegible}석 - 글자 판독 어려움 (중계 스크린 추가 권장)")
+        if any(s['shrunk'] for s in screens):
+            report['warnings'].append(f"천고({event.venue_height}m)가 낮아 스크린 크기 축소")
+    if report['blocked']:
+        report['warnings'].append(
+            f"앞줄에 가려 무대가 잘 안 보이는 좌석 {report['blocked']}석 (C값 {C_MIN}m 미만) - 무대 높이 상향 / 지그재그 배치 권장"
+        )
+    wide = int(np.sum(angle > 60))
+    if wide:
+        report['warnings'].append(f"무대 정면에서 60° 이상 벗어난 좌석 {wide}석")
+    return report
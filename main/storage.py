@@ -0,0 +1,195 @@
+# ==========================================
+# 내용 주소 기반(Content-Addressed) 파일 저장소
+# ==========================================
+# - 업로드를 64KB 조각으로 읽으면서 SHA-256 계산 (전체를 메모리에 올리지 않음)
+# - 같은 내용의 파일은 blobs/ab/<해시>.pdf 하나만 저장하고 FileBlob.ref_count 로 참조 수 관리
+# - 다운로드: ETag(=해시) 캐시 검증, Range 요청(206), X-Accel-Redirect/X-Sendfile 위임 지원
+
+import hashlib
+import os
+import re
+import tempfile
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.deconstruct import deconstructible
+from django.utils.http import content_disposition_header
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _blob_model():
+    # models.py 가 이 모듈을 import 하므로 순환 참조를 피하기 위해 지연 조회
+    return apps.get_model('main', 'FileBlob')
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    prefix = 'blobs'
+
+    def _hash_path(self, path):
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+                sha.update(block)
+        return sha.hexdigest()
+
+    def _spool(self, content):
+        """업로드 내용을 저장소 안 임시 파일로 옮기면서 해시 계산 -> (해시, 크기, 임시 경로)"""
+        tmp_dir = self.path(os.path.join(self.prefix, 'tmp'))
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        if hasattr(content, 'temporary_file_path'):
+            # 디스크에 이미 있는 업로드(TemporaryUploadedFile): 읽기만 하고 파일은 이동 (복사 없음)
+            src = content.temporary_file_path()
+            digest = self._hash_path(src)
+            size = os.path.getsize(src)
+            fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+            os.close(fd)
+            file_move_safe(src, tmp_path, allow_overwrite=True)
+            return digest, size, tmp_path
+
+        sha = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        with os.fdopen(fd, 'wb') as out:
+            for block in content.chunks(CHUNK_SIZE):
+                sha.update(block)
+                out.write(block)
+                size += len(block)
+        return sha.hexdigest(), size, tmp_path
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower()[:10]
+        digest, size, tmp_path = self._spool(content)
+        # 💡 [수정] 해시 행을 잠근 채로 파일 존재 확인 + 이동 + 참조 수 증가 (release 의 파일 삭제와 겹치지 않음)
+        #    같은 내용이 다른 확장자로 들어와도 이미 등록된 이름(FileBlob.name)을 그대로 사용
+        with transaction.atomic():
+            blob = self._lock_blob(digest, f"{self.prefix}/{digest[:2]}/{digest}{ext}", size)
+            full_path = self.path(blob.name)
+            if os.path.exists(full_path):
+                os.remove(tmp_path)  # 이미 같은 내용이 있음 -> 새로 저장하지 않음
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.replace(tmp_path, full_path)
+            _blob_model().objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+        return blob.name
+
+    def get_available_name(self, name, max_length=None):
+        # 실제 파일명은 내용 해시로 정해지므로 중복 이름 회피가 필요 없음
+        return name
+
+    # --- 참조 수 관리 ---
+
+    def _lock_blob(self, digest, name, size):
+        """해시 행을 select_for_update 로 잠금 (없으면 생성 - 동시 생성은 unique 충돌 후 다시 잠금)"""
+        FileBlob = _blob_model()
+        blob = FileBlob.objects.select_for_update().filter(digest=digest).first()
+        if blob is None:
+            try:
+                with transaction.atomic():
+                    blob = FileBlob.objects.create(digest=digest, name=name, size=size, ref_count=0)
+            except IntegrityError:
+                blob = FileBlob.objects.select_for_update().get(digest=digest)
+        return blob
+
+    @transaction.atomic
+    def release(self, name):
+        """참조 1개 해제 - 마지막 참조였으면 커밋 후 파일 삭제"""
+        FileBlob = _blob_model()
+        blob = FileBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None or blob.ref_count == 0:
+            return
+        FileBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') - 1)
+        if blob.ref_count == 1:
+            transaction.on_commit(lambda: self._purge(name))
+
+    @transaction.atomic
+    def _purge(self, name):
+        """참조 0 인 행을 다시 잠그고 확인한 뒤에만 파일 + 행 삭제 (그 사이 새 업로드가 다시 참조했으면 그대로 둠)"""
+        FileBlob = _blob_model()
+        blob = FileBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None or blob.ref_count > 0:
+            return
+        super().delete(name)
+        blob.delete()
+
+
+def quotation_storage():
+    return ContentAddressedStorage(location=settings.QUOTATION_STORAGE_ROOT)
+
+
+# ------------------------------------------
+# 다운로드 응답 (Range / ETag / sendfile)
+# ------------------------------------------
+
+def _range_stream(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(CHUNK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+def blob_response(request, field_file, filename):
+    storage = field_file.storage
+    name = field_file.name
+    path = storage.path(name)
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        # 💡 [수정] 저장소에 파일이 없으면 500 대신 404
+        return HttpResponse("파일을 찾을 수 없습니다.", status=404)
+    etag = f'"{os.path.splitext(os.path.basename(name))[0]}"'  # 파일명 = 내용 해시 -> 그대로 ETag
+
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+        response['ETag'] = etag
+        return response
+
+    # 웹서버(nginx X-Accel-Redirect / Apache X-Sendfile)가 있으면 전송은 웹서버에 위임 (zero-copy + Range 처리)
+    sendfile_header = getattr(settings, 'SENDFILE_HEADER', None)
+    if sendfile_header:
+        response = HttpResponse(content_type='application/octet-stream')
+        response[sendfile_header] = settings.SENDFILE_URL_PREFIX.rstrip('/') + '/' + name
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+        response['ETag'] = etag
+        return response
+
+    match = RANGE_RE.match(request.headers.get('Range', ''))
+    if match and any(match.groups()):
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:  # bytes=-500 (마지막 500바이트)
+            start = max(size - int(last), 0)
+            end = size - 1
+        if start > end or start >= size:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        response = StreamingHttpResponse(_range_stream(path, start, end - start + 1), status=206,
+                                         content_type='application/octet-stream')
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+    else:
+        # 전체 파일: FileResponse 는 wsgi.file_wrapper(sendfile) 로 전송됨
+        response = FileResponse(open(path, 'rb'), as_attachment=True, filename=filename)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, max-age=86400'
+    return response
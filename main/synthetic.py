@@ -0,0 +1,228 @@
+# ==========================================
+# 합성 데이터 생성기 (운영 규모 재현 / 벤치마크용)
+# ==========================================
+# - 사용자 -> 행사(모든 event_type) -> Task 트리(depth 단계) / 큐시트 -> 견적 / 발주서 까지 한 번에 생성
+# - 전부 bulk_create (Task 는 트리 단계별로 1회씩) -> 시그널이 없으므로 끝에 파생 데이터를 직접 갱신
+#   (재무 롤업, 장비 예약, 검색 색인)
+# - 같은 seed 면 같은 데이터 (사용자명/사업자번호는 prefix 로 구분해 --clear 로 지울 수 있음)
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .analytics import rebuild_rollups
+from .inventory import rebuild_reservations
+from .models import (
+    PHASE_CHOICES, PRIORITY_CHOICES, SEATING_CHOICES, STATUS_CHOICES, TYPE_CHOICES_EVENT,
+    Cue, Event, PurchaseOrder, Quotation, Task, Vendor,
+)
+from .search import index_objects
+from .timeline import ORDER_GAP
+
+DEFAULT_PREFIX = 'synth'
+BATCH_SIZE = 500
+
+CLIENTS = ['삼성전자', 'LG전자', '현대자동차', 'SK텔레콤', '네이버', '카카오', '서울시', '부산시', '한국관광공사', 'CJ ENM']
+VENUES = ['코엑스 그랜드볼룸', '킨텍스 제1전시장', '벡스코 오디토리움', '세종문화회관', '롯데호텔 크리스탈볼룸',
+          '올림픽공원 핸드볼경기장', 'DDP 알림터', '여의도 한강공원', '수원컨벤션센터', '제주 ICC']
+TITLES = ['신제품 런칭', '연례 시상식', '파트너 컨퍼런스', '브랜드 페스티벌', '채용 박람회', '기술 세미나',
+          '송년의 밤', '창립 기념식', '팝업 스토어', '지역 축제']
+TASK_WORDS = ['무대 설계', '조명 플랜', '음향 세팅', 'LED 월 시공', '케이터링', '셔틀 운영', '현수막 제작',
+              '등록 데스크', '리허설', '안전 점검', '인허가 신고', '출연진 섭외', '영상 제작', '정산 서류']
+CUE_WORDS = ['오프닝 영상', '사회자 인사', '내빈 소개', '축사', '시상', '공연', '휴식', '경품 추첨', '클로징']
+VENDOR_KINDS = ['무대', '조명', '음향', '영상', '케이터링', '인쇄', '렌탈', '인력']
+
+
+@dataclass
+class SyntheticSize:
+    users: int = 1000
+    events_per_user: int = 5
+    tasks_per_event: int = 40
+    depth: int = 3           # Task 트리 단계 수 (1 이면 전부 최상위)
+    cues_per_event: int = 30
+    vendors: int = 200
+    quotes_per_task: int = 3  # 외주 Task 당 견적 수
+
+
+def _batched(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class SyntheticGenerator:
+    def __init__(self, size, seed=0, prefix=DEFAULT_PREFIX, today=None):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.today = today or date.today()
+
+    # ------------------------------------------
+    # 단계별 생성
+    # ------------------------------------------
+
+    def users(self):
+        password = make_password(None)  # 로그인 불가 (해시 계산 1회로 전부 공유)
+        start = User.objects.filter(username__startswith=f'{self.prefix}-').count()
+        users = [
+            User(username=f'{self.prefix}-{start + i:06d}', password=password)
+            for i in range(self.size.users)
+        ]
+        return User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+
+    def vendors(self):
+        rng = self.rng
+        start = Vendor.objects.filter(business_number__startswith=f'{self.prefix[:3].upper()}-').count()
+        vendors = [
+            Vendor(
+                name=f'{rng.choice(VENDOR_KINDS)}{rng.choice(["프로", "테크", "플러스", "코리아", "웍스"])} {start + i}',
+                business_number=f'{self.prefix[:3].upper()}-{start + i:08d}',
+                contact_person=rng.choice(['김', '이', '박', '최', '정']) + rng.choice(['민수', '지영', '현우', '수진', '도윤']),
+                phone_number=f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+            )
+            for i in range(self.size.vendors)
+        ]
+        return Vendor.objects.bulk_create(vendors, batch_size=BATCH_SIZE)
+
+    def events(self, users):
+        rng = self.rng
+        types = [code for code, _ in TYPE_CHOICES_EVENT]
+        events = []
+        for user in users:
+            for i in range(self.size.events_per_user):
+                venue_w = rng.choice([15.0, 20.0, 30.0, 40.0])
+                events.append(Event(
+                    author=user,
+                    title=f'{rng.choice(CLIENTS)} {rng.choice(TITLES)} {self.today.year + rng.randint(-1, 1)}',
+                    client_name=rng.choice(CLIENTS),
+                    venue_name=rng.choice(VENUES),
+                    budget=rng.randint(10, 500) * 1_000_000,
+                    status=rng.choice(STATUS_CHOICES)[0],
+                    date=self.today + timedelta(days=rng.randint(-180, 365)),
+                    event_type=types[len(events) % len(types)],  # 모든 유형이 고르게
+                    venue_width=venue_w,
+                    venue_depth=venue_w * rng.choice([1.5, 2.0]),
+                    venue_height=rng.choice([4.0, 5.0, 8.0, 12.0]),
+                    stage_width=rng.choice([7.2, 9.6, 12.0, 14.4]),
+                    stage_depth=rng.choice([3.6, 4.8, 6.0]),
+                    seating_type=rng.choice(SEATING_CHOICES)[0],
+                    has_virgin_road=i % 10 == 0,
+                    has_booth=i % 6 == 0,
+                ))
+        return Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+    def tasks(self, events):
+        """Task 트리: 단계별로 모든 행사의 Task 를 한 번에 bulk_create (부모 id 가 먼저 필요)"""
+        rng = self.rng
+        depth = max(1, self.size.depth)
+        phases = [code for code, _ in PHASE_CHOICES]
+        priorities = [code for code, _ in PRIORITY_CHOICES]
+        # 단계별 개수: 위로 갈수록 적게 (예: 40개, 3단계 -> 6 / 13 / 21)
+        weights = [level + 1 for level in range(depth)]
+        per_level = [self.size.tasks_per_event * w // sum(weights) for w in weights]
+        per_level[-1] += self.size.tasks_per_event - sum(per_level)
+
+        created = []
+        parents = {event.pk: [] for event in events}
+        for count in per_level:
+            level = []
+            for event in events:
+                for _ in range(count):
+                    external = rng.random() < 0.25
+                    level.append(Task(
+                        event=event,
+                        parent=rng.choice(parents[event.pk]) if parents[event.pk] else None,
+                        content=f'{rng.choice(TASK_WORDS)} #{rng.randint(1, 999)}',
+                        deadline=event.date - timedelta(days=rng.randint(-10, 60)),
+                        is_done=rng.random() < 0.3,
+                        task_category=rng.choice(phases),
+                        task_type='PROCUREMENT' if external else 'GENERAL',
+                        priority=rng.choice(priorities),
+                        planned_budget=rng.randint(0, 50) * 100_000,
+                        actual_cost=rng.randint(0, 40) * 100_000 if rng.random() < 0.4 else 0,
+                        is_external=external,
+                        po_status='contracted' if external and rng.random() < 0.3 else 'ready',
+                        duration_days=rng.randint(1, 5),
+                    ))
+            level = Task.objects.bulk_create(level, batch_size=BATCH_SIZE)
+            parents = {event.pk: [] for event in events}
+            for task in level:
+                parents[task.event_id].append(task)
+            created.extend(level)
+        return created
+
+    def cues(self, events):
+        rng = self.rng
+        cues = [
+            Cue(
+                event=event, order=(i + 1) * ORDER_GAP,
+                content=f'{rng.choice(CUE_WORDS)} {i + 1}', duration=rng.choice([30, 60, 120, 300, 600]),
+                bgm=rng.choice(['', '', 'Opening Theme', 'Fanfare', 'Lounge BGM']),
+            )
+            for event in events for i in range(self.size.cues_per_event)
+        ]
+        return Cue.objects.bulk_create(cues, batch_size=BATCH_SIZE)
+
+    def procurement(self, tasks, vendors):
+        """외주 Task: 견적 여러 건 (최저가 선정) + 계약 완료 Task 는 발주서"""
+        rng = self.rng
+        quotes, orders, assigned = [], [], []
+        for task in tasks:
+            if not task.is_external or not vendors:
+                continue
+            bidders = rng.sample(vendors, min(self.size.quotes_per_task, len(vendors)))
+            amounts = [max(100_000, task.planned_budget + rng.randint(-20, 20) * 100_000) for _ in bidders]
+            best = min(range(len(bidders)), key=amounts.__getitem__)
+            for i, (vendor, amount) in enumerate(zip(bidders, amounts)):
+                quotes.append(Quotation(task=task, vendor=vendor, quoted_amount=amount, is_selected=i == best))
+            task.vendor = bidders[best]
+            assigned.append(task)
+            if task.po_status == 'contracted':
+                orders.append(PurchaseOrder(task=task, vendor=bidders[best], contract_amount=amounts[best]))
+        Quotation.objects.bulk_create(quotes, batch_size=BATCH_SIZE)
+        PurchaseOrder.objects.bulk_create(orders, batch_size=BATCH_SIZE)
+        Task.objects.bulk_update(assigned, ['vendor'], batch_size=BATCH_SIZE)
+        return len(quotes), len(orders)
+
+    # ------------------------------------------
+    # 전체 실행
+    # ------------------------------------------
+
+    @transaction.atomic
+    def run(self):
+        """생성 -> 건수 dict (만든 객체는 self.created 에 보관)"""
+        users = self.users()
+        vendors = self.vendors()
+        events = self.events(users)
+        tasks = self.tasks(events)
+        cues = self.cues(events)
+        quotes, orders = self.procurement(tasks, vendors)
+
+        # bulk_create 는 시그널이 없으므로 파생 데이터를 직접 갱신
+        event_ids = [event.pk for event in events]
+        rebuild_rollups(event_ids)
+        rebuild_reservations(event_ids)
+        for kind, objs in (('event', events), ('task', tasks), ('cue', cues), ('vendor', vendors)):
+            for batch in _batched(objs, 5000):
+                index_objects(kind, batch)
+
+        self.created = {'users': users, 'events': events, 'tasks': tasks, 'vendors': vendors}
+        return {
+            'users': len(users), 'vendors': len(vendors), 'events': len(events), 'tasks': len(tasks),
+            'cues': len(cues), 'quotations': quotes, 'purchase_orders': orders,
+        }
+
+
+@transaction.atomic
+def clear_synthetic(prefix=DEFAULT_PREFIX):
+    """prefix 로 만든 사용자(행사/Task/큐/견적/발주서 CASCADE)와 업체 삭제 -> (사용자 수, 업체 수)"""
+    users = User.objects.filter(username__startswith=f'{prefix}-')
+    user_count = users.count()
+    users.delete()
+    vendors = Vendor.objects.filter(business_number__startswith=f'{prefix[:3].upper()}-')
+    # 다른 사용자의 발주서가 참조하는 업체(RESTRICT)는 남김
+    vendor_count, _ = vendors.exclude(purchaseorder__isnull=False).delete()
+    return user_count, vendor_count
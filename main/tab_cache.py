@@ -0,0 +1,47 @@
+# ==========================================
+# 상세 페이지 탭 캐시 - 데이터 소스 버전 관리
+# ==========================================
+# 탭 캐시 키는 (탭 이름 + 탭이 읽는 Event 필드 값 + 관련 데이터 소스 버전)으로 구성됩니다.
+# Task/Cue 처럼 별도 테이블에서 오는 데이터는 '소스 버전 토큰'을 바꿔주면
+# 해당 소스에 의존하는 탭만 다시 계산됩니다. (models.py 시그널에서 호출)
+
+import uuid
+
+from django.core.cache import cache
+
+# 데이터 소스 이름 (탭 레지스트리의 'sources'와 동일한 이름 사용)
+SOURCE_TASKS = 'tasks'
+SOURCE_CUES = 'cues'
+SOURCE_VENUE = 'venue'  # 공간 도면 (Venue / VenueFeature)
+
+
+def _source_key(event_id, source):
+    return f'eos:tab-src:{event_id}:{source}'
+
+
+def source_version(event_id, source):
+    """소스 버전 토큰 조회 (없으면 새 토큰 발급)"""
+    # 💡 카운터 대신 랜덤 토큰 사용: 캐시에서 밀려나도 과거 키와 절대 겹치지 않음
+    return cache.get_or_set(_source_key(event_id, source), uuid.uuid4().hex, None)
+
+
+def touch_sources(event_id, *sources):
+    """소스 데이터가 바뀌었을 때 호출 -> 해당 소스에 의존하는 탭 캐시 무효화"""
+    cache.set_many({_source_key(event_id, source): uuid.uuid4().hex for source in sources}, None)
+
+
+# ------------------------------------------
+# 포트폴리오 재무 분석 캐시 (작성자 단위)
+# ------------------------------------------
+# 💡 행사 1건의 롤업이 바뀌면 그 작성자의 분석 결과 캐시 전체를 토큰 교체로 무효화
+
+def _portfolio_key(author_id):
+    return f'eos:portfolio:{author_id}'
+
+
+def portfolio_version(author_id):
+    return cache.get_or_set(_portfolio_key(author_id), uuid.uuid4().hex, None)
+
+
+def touch_portfolio(author_id):
+    cache.set(_portfolio_key(author_id), uuid.uuid4().hex, None)
@@ -0,0 +1,200 @@
+# ==========================================
+# 상세 페이지(detail) 탭 단위 렌더링 엔진
+# ==========================================
+# 각 탭(개요/공간/음향/조명/일정/큐시트)은 자기 데이터만 계산하고,
+# 계산 결과는 캐시에 따로 저장됩니다. 큐 하나를 저장해도 큐시트 탭만 다시 계산되고
+# matplotlib 렌더링(공간/음향/조명)은 설계값이 바뀔 때만 다시 실행됩니다.
+
+import hashlib
+from datetime import date
+
+from django.core.cache import cache
+from django.db.models import Sum
+from django.http import Http404
+from django.template.loader import render_to_string
+
+from .calculators import calculate_space, calculate_audio, LightingEngine, draw_space, draw_audio, draw_light, draw_sightlines, seat_layout
+from .egress import analyze_egress
+from .illuminance import stage_illuminance
+from .rigging import rigging_loads
+from .sightlines import analyze_sightlines
+from .tab_cache import SOURCE_TASKS, SOURCE_CUES, SOURCE_VENUE, source_version
+from .timeline import build_timeline, ordered_cues
+
+TAB_CACHE_TIMEOUT = 60 * 60 * 24  # 24시간 (설계값이 같으면 결과도 같으므로 길게 유지)
+
+
+# ------------------------------------------
+# 1. 탭별 데이터 계산 함수
+# ------------------------------------------
+
+def _overview_data(event):
+    today = date.today()
+    d_day = (event.date - today).days
+
+    total_tasks = event.tasks.count()
+    done_tasks = event.tasks.filter(is_done=True).count()
+    progress = int((done_tasks / total_tasks) * 100) if total_tasks > 0 else 0
+
+    total_task_budget = event.tasks.aggregate(total=Sum('planned_budget'))['total'] or 0
+    budget = event.budget if event.budget is not None else 0
+    cost = total_task_budget
+    profit = budget - cost
+
+    try:
+        profit_rate = round((profit / budget) * 100, 1) if budget > 0 else 0.0
+    except (TypeError, ZeroDivisionError):
+        profit_rate = 0.0
+
+    return {
+        'd_day': d_day,
+        'progress': progress,
+        'fmt_budget': f"{budget:,}",
+        'fmt_cost': f"{cost:,}",
+        'fmt_profit': f"{profit:,}",
+        'profit_rate': profit_rate,
+        'profit_raw': profit,
+    }
+
+
+def _space_data(event):
+    # 💡 [신규] 피난 분석 결과(위반 좌석 / 비상구)를 배치도에 함께 표시
+    layout = seat_layout(event)
+    egress = analyze_egress(event, layout)
+    # 💡 [신규] 좌석별 시야 / 스크린 가독성 점수 히트맵
+    sightlines = analyze_sightlines(event, layout)
+    return {
+        'space': calculate_space(event),
+        'egress': egress,
+        'graph_space': draw_space(event, egress),
+        'sightlines': sightlines,
+        'graph_sightline': draw_sightlines(event, sightlines),
+    }
+
+
+def _audio_data(event):
+    audio_report = calculate_audio(event)
+    return {
+        'audio': audio_report,
+        'graph_audio': draw_audio(event, audio_report['specs']),
+    }
+
+
+def _lighting_data(event):
+    l_engine = LightingEngine(event)
+    light_patch, light_power, light_layout, gen_info = l_engine.get_patch_data()
+    # 💡 [신규] 무대 조도 분포 (등조도선을 조명 플롯 위에 겹쳐 그림)
+    illuminance = stage_illuminance(event, light_layout)
+    # 💡 [신규] 트러스 / 리깅 포인트 하중 (조명 + 라인어레이)
+    rigging = rigging_loads(event, light_layout)
+    return {
+        'light_patch': light_patch,
+        'light_power': light_power,
+        'gen_info': gen_info,
+        'illuminance': {k: v for k, v in illuminance.items() if k not in ('xs', 'ys', 'lux')},
+        'rigging': rigging,
+        'graph_light': draw_light(event, light_layout, illuminance, rigging),
+    }
+
+
+def _tasks_data(event):
+    # 정렬: 단계 순서(phase_rank) -> 마감일(deadline)
+    # 💡 phase_rank 는 저장 시점에 계산되어 (event, phase_rank, deadline) 인덱스 순서로 바로 읽힘
+    tasks = event.tasks.select_related('vendor').order_by('phase_rank', 'deadline')
+    return {'tasks': list(tasks), 'today': date.today()}
+
+
+def _cues_data(event):
+    return {'timeline': build_timeline(ordered_cues(event))}
+
+
+# ------------------------------------------
+# 2. 탭 레지스트리
+# ------------------------------------------
+# fields  : 탭 결과에 영향을 주는 Event 필드 (값이 같으면 캐시 재사용)
+# sources : 탭이 읽는 하위 테이블 (tab_cache.touch_sources 로 무효화)
+# daily   : 오늘 날짜에 따라 결과가 바뀌는 탭 (D-Day, 마감 지연 표시)
+
+TABS = {
+    'overview': {
+        'template': 'main/tabs/overview.html',
+        'builder': _overview_data,
+        'fields': ('date', 'budget'),
+        'sources': (SOURCE_TASKS,),
+        'daily': True,
+    },
+    'space': {
+        'template': 'main/tabs/space.html',
+        'builder': _space_data,
+        'fields': ('venue_width', 'venue_depth', 'stage_width', 'stage_depth',
+                   'seating_type', 'table_gap', 'has_virgin_road', 'has_foh', 'exits',
+                   'venue_height', 'stage_height', 'has_screen', 'venue_id', 'has_booth'),
+        'sources': (SOURCE_VENUE,),
+        'daily': False,
+    },
+    'audio': {
+        'template': 'main/tabs/audio.html',
+        'builder': _audio_data,
+        'fields': ('venue_width', 'venue_depth', 'stage_width', 'stage_depth', 'event_type'),
+        'sources': (),
+        'daily': False,
+    },
+    'lighting': {
+        'template': 'main/tabs/lighting.html',
+        'builder': _lighting_data,
+        'fields': ('stage_width', 'stage_depth', 'event_type', 'venue_height', 'stage_height',
+                   'venue_width', 'venue_depth', 'venue_id'),
+        'sources': (SOURCE_VENUE,),
+        'daily': False,
+    },
+    'tasks': {
+        'template': 'main/tabs/tasks.html',
+        'builder': _tasks_data,
+        'fields': (),
+        'sources': (SOURCE_TASKS,),
+        'daily': True,
+    },
+    'cues': {
+        'template': 'main/tabs/cues.html',
+        'builder': _cues_data,
+        'fields': (),
+        'sources': (SOURCE_CUES,),
+        'daily': False,
+    },
+}
+
+
+# ------------------------------------------
+# 3. 캐시 & 렌더링
+# ------------------------------------------
+
+def _cache_key(event, tab, spec):
+    parts = [repr(getattr(event, f)) for f in spec['fields']]
+    parts += [source_version(event.id, s) for s in spec['sources']]
+    if spec['daily']:
+        parts.append(date.today().isoformat())
+    digest = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+    return f'eos:tab:{event.id}:{tab}:{digest}'
+
+
+def get_tab_data(event, tab):
+    """탭 데이터 조회 (캐시 우선, 없으면 해당 탭만 계산)"""
+    spec = TABS.get(tab)
+    if spec is None:
+        raise Http404("존재하지 않는 탭입니다.")
+
+    key = _cache_key(event, tab, spec)
+    data = cache.get(key)
+    if data is None:
+        data = spec['builder'](event)
+        cache.set(key, data, TAB_CACHE_TIMEOUT)
+    return data
+
+
+def render_tab(request, event, tab, extra_context=None):
+    """탭 HTML 조각 렌더링 (폼/CSRF 토큰은 캐시하지 않고 요청마다 새로 생성)"""
+    context = {'event': event}
+    context.update(get_tab_data(event, tab))
+    if extra_context:
+        context.update(extra_context)
+    return render_to_string(TABS[tab]['template'], context, request=request)
@@ -1,3 +1,1442 @@
-from django.test import TestCase
+import asyncio
+import importlib
+import io
+import json
+from collections import defaultdict
+import os
+import re
+import smtplib
+import tempfile
+import time
+import zipfile
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.apps import apps as django_apps
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, Sum
+from django.core.files.base import ContentFile
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .analytics import portfolio_summary
+from .booths import MODULE, pack_booths
+from .benchmarks import compare, run_size
+from .cloning import clone_event
+from .deadlines import deadline_board, open_tasks, send_digests
+from .calculators import seat_layout
+from .egress import CELL, analyze_egress, grid_distance
+from .forms import EventSpaceForm
+from .illuminance import PHOTOMETRY, _rig_key, lux_grid, stage_illuminance, trim_height
+from .instrumentation import percentile, stats as perf_stats
+from .inventory import equipment_requirements, reservation_period, shortfall_report, sweep_shortfalls
+from .sightlines import analyze_sightlines, screen_positions
+from .search import fts5_query, rebuild_index, search_documents, search_terms
+from .schedule import ScheduleCycleError, add_dependency, compute_schedule, critical_chain, reschedule, shift_deadlines
+from .models import TYPE_CHOICES_EVENT, Venue, VenueFeature, Exhibitor, Event, EventFinance, DeadlineDigest, Equipment, SearchDocument, ShowRun, Cue, Task, TaskDependency, Vendor, Quotation, PurchaseOrder, FileBlob, PHASE_RANK_OTHER
+from .rigging import HOIST_KG, TRUSS_KG_PER_M, build_rig, rigging_loads, solve_beam
+from .procurement import bid_summary, vendor_win_rates, select_bid
+from .purchase_orders import generate_purchase_orders, stream_zip
+from .realtime import CLOSE_FORBIDDEN, _sender, channel_name, coalesce, get_broker, websocket_app
+from .showcall import control as show_control
+from .synthetic import SyntheticGenerator, SyntheticSize, clear_synthetic
+from .storage import ContentAddressedStorage, blob_response
+from .venues import GridIndex
+from .tab_cache import SOURCE_TASKS, touch_sources
+from .tabs import TABS, get_tab_data
+from .timeline import ORDER_GAP, build_timeline, insert_cue, insert_cues, move_cue, ordered_cues, reorder
+
+# 행 수가 계속 늘어나는 테이블 - 이 테이블들은 전체 스캔(SCAN)이 나오면 안 됨
+# (Vendor 처럼 드롭다운용으로 전체를 읽는 작은 테이블은 제외)
+LARGE_TABLES = ('main_event', 'main_task', 'main_cue', 'main_quotation', 'main_purchaseorder')
+FULL_SCAN_RE = re.compile(r'\bSCAN (%s)\b' % '|'.join(LARGE_TABLES))
+
+
+def explain(sql, params=()):
+    """SQLite EXPLAIN QUERY PLAN 결과를 문자열 목록으로 반환"""
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """발송 실패(0건)를 돌려주는 메일 백엔드"""
+
+    def send_messages(self, email_messages):
+        return 0
+
+
+class RejectingEmailBackend(LocmemEmailBackend):
+    """bad@ 주소는 SMTP 예외, 나머지는 정상 발송 (mail.outbox)"""
+
+    def send_messages(self, email_messages):
+        for message in email_messages:
+            if any(to.startswith('bad@') for to in message.to):
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b'rejected')})
+        return super().send_messages(email_messages)
+
+
+class QueryPlanTests(TestCase):
+    """뷰에서 실행되는 쿼리가 인덱스를 타는지 EXPLAIN 으로 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('planner', password='pw')
+        cls.event = Event.objects.create(
+            author=cls.user, title='플랜 점검', date=date.today() + timedelta(days=30), event_type='festival'
+        )
+        Cue.objects.bulk_create(
+            Cue(event=cls.event, order=i, content=f'큐 {i}', duration=60) for i in range(1, 6)
+        )
+
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN 형식은 SQLite 기준')
+        self.client.force_login(self.user)
+
+    def assertNoFullScans(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        with connection.cursor() as cursor:
+            for query in ctx.captured_queries:
+                sql = query['sql']
+                if not sql.lstrip().upper().startswith('SELECT'):
+                    continue
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+                plan = [row[-1] for row in cursor.fetchall()]
+                scans = [line for line in plan if FULL_SCAN_RE.search(line)]
+                self.assertFalse(scans, f"{url} 전체 스캔 발생:\n{sql}\n{plan}")
+
+    def test_index_page_uses_indexes(self):
+        self.assertNoFullScans('/')
+
+    def test_detail_tabs_use_indexes(self):
+        self.assertNoFullScans(f'/event/{self.event.id}/')
+        for tab in ('overview', 'tasks', 'cues'):
+            self.assertNoFullScans(f'/event/{self.event.id}/tab/{tab}/')
+
+    def test_sorted_lists_are_index_ordered(self):
+        # 정렬을 인덱스 순서로 읽으면 임시 B-TREE 정렬이 필요 없음
+        querysets = [
+            Event.objects.filter(author=self.user).order_by('-created_at'),
+            ordered_cues(self.event),
+            self.event.tasks.order_by('phase_rank', 'deadline'),
+            open_tasks(before=date.today()).order_by('deadline', 'id'),
+        ]
+        for qs in querysets:
+            sql, params = qs.query.sql_with_params()
+            plan = explain(sql, params)
+            self.assertFalse([line for line in plan if 'TEMP B-TREE' in line], f"{sql}\n{plan}")
+
+
+class TaskPhaseRankTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('phase', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='단계', date=date.today(), event_type='promotion')
+
+    def test_save_normalizes_legacy_category(self):
+        task = Task.objects.create(event=self.event, content='정산', deadline=date.today(), task_category='settlement')
+        task.refresh_from_db()
+        self.assertEqual((task.task_category, task.phase_rank), ('CLOSING', 4))
+
+    def test_update_fields_keeps_rank_in_sync(self):
+        task = Task.objects.create(event=self.event, content='디자인', deadline=date.today(), task_category='PLANNING')
+        task.task_category = 'DESIGN'
+        task.save(update_fields=['task_category'])
+        task.refresh_from_db()
+        self.assertEqual(task.phase_rank, 1)
+
+    def test_bulk_create_sets_rank(self):
+        Task.objects.bulk_create([
+            Task(event=self.event, content='A', deadline=date.today(), task_category='execution'),
+            Task(event=self.event, content='B', deadline=date.today(), task_category='UNKNOWN'),
+        ])
+        ranks = dict(self.event.tasks.filter(content__in=['A', 'B']).values_list('content', 'phase_rank'))
+        self.assertEqual(ranks, {'A': 3, 'B': PHASE_RANK_OTHER})
+
+
+class CueTimelineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('cue', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='큐', date=date.today(), event_type='ceremony')
+
+    def contents(self):
+        return [cue.content for cue in ordered_cues(self.event)]
+
+    def test_running_times(self):
+        insert_cues(self.event, [Cue(content=c, duration=d) for c, d in [('개회', 90), ('축사', 300), ('폐회', 45)]])
+        timeline = build_timeline(ordered_cues(self.event))
+        self.assertEqual([row['start'] for row in timeline['rows']], [0, 90, 390])
+        self.assertEqual(timeline['total_label'], '0:07:15')
+
+    def test_insert_in_middle_touches_one_row(self):
+        insert_cues(self.event, [Cue(content=c) for c in 'ABC'])
+        with CaptureQueriesContext(connection) as ctx:
+            insert_cue(self.event, Cue(content='X'), position=2)
+        writes = [q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(writes, [])
+        self.assertEqual(self.contents(), ['A', 'X', 'B', 'C'])
+
+    def test_legacy_dense_orders_are_renumbered(self):
+        Cue.objects.bulk_create(Cue(event=self.event, order=i, content=c) for i, c in enumerate('ABC', start=1))
+        insert_cue(self.event, Cue(content='X'), position=2)
+        self.assertEqual(self.contents(), ['A', 'X', 'B', 'C'])
+        orders = list(ordered_cues(self.event).values_list('order', flat=True))
+        self.assertEqual(orders[0], ORDER_GAP)
+
+    def test_move_and_reorder(self):
+        a, b, c = insert_cues(self.event, [Cue(content=x) for x in 'ABC'])
+        move_cue(c, 1)
+        self.assertEqual(self.contents(), ['C', 'A', 'B'])
+        reorder(self.event, [b.id, a.id])
+        self.assertEqual(self.contents(), ['B', 'A', 'C'])
+
+
+class ProcurementTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('buyer', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='조달', date=date.today(), event_type='festival')
+        cls.task = cls.event.tasks.filter(is_external=True).first()
+        cls.vendors = [
+            Vendor.objects.create(name=f'업체{i}', business_number=f'000-00-{i:05d}', contact_person='담당', phone_number='010')
+            for i in range(4)
+        ]
+        cls.quotes = [
+            Quotation.objects.create(task=cls.task, vendor=v, quoted_amount=amount)
+            for v, amount in zip(cls.vendors, [1000, 1100, 1200, 3000])
+        ]
+
+    def test_bid_summary_in_one_query(self):
+        with self.assertNumQueries(1):
+            summary = bid_summary(self.event)[self.task.id]
+        self.assertEqual((summary['lowest'], summary['median'], summary['spread']), (1000, 1150, 2000))
+        self.assertEqual([b['is_outlier'] for b in summary['bids']], [False, False, False, True])
+
+    def test_select_bid_updates_task_and_unselects_competitors(self):
+        select_bid(self.quotes[1])
+        select_bid(self.quotes[0])
+        self.assertEqual(list(Quotation.objects.filter(is_selected=True)), [self.quotes[0]])
+        task = Task.objects.get(pk=self.task.pk)
+        self.assertEqual((task.vendor, task.actual_cost, task.po_status), (self.vendors[0], 1000, 'contracted'))
+        self.assertEqual(vendor_win_rates(self.event)[self.vendors[0].id]['win_rate'], 100.0)
+
+
+class PurchaseOrderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('po', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='발주', date=date.today(), event_type='festival')
+        cls.vendor = Vendor.objects.create(name='무대', business_number='111-11-11111', contact_person='담당', phone_number='010')
+
+    def test_generate_only_contracted_tasks_once(self):
+        external = list(self.event.tasks.filter(is_external=True))
+        Task.objects.filter(pk=external[0].pk).update(po_status='contracted', vendor=self.vendor, actual_cost=5000)
+        Task.objects.filter(pk=external[1].pk).update(po_status='bidding', vendor=self.vendor)
+
+        orders = generate_purchase_orders(self.event)
+        self.assertEqual([(po.task_id, po.contract_amount) for po in orders], [(external[0].pk, 5000)])
+        self.assertEqual(Task.objects.get(pk=external[0].pk).po_status, 'po_issued')
+        self.assertEqual(generate_purchase_orders(self.event), [])
+        self.assertEqual(PurchaseOrder.objects.count(), 1)
+
+    def test_stream_zip_is_valid_archive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            entries = []
+            for i in range(3):
+                path = os.path.join(tmp, f'{i}.pdf')
+                with open(path, 'wb') as f:
+                    f.write(os.urandom(100_000))
+                entries.append((f'PO-{i}.pdf', path))
+
+            chunks = list(stream_zip(entries))
+            self.assertGreater(len(chunks), 3)
+            archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+            self.assertIsNone(archive.testzip())
+            with open(entries[1][1], 'rb') as f:
+                self.assertEqual(archive.read('PO-1.pdf'), f.read())
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.storage = ContentAddressedStorage(location=self.tmp.name)
+
+    def test_same_content_is_stored_once(self):
+        first = self.storage.save('a.pdf', ContentFile(b'%PDF-same'))
+        second = self.storage.save('b.pdf', ContentFile(b'%PDF-same'))
+        self.assertEqual(first, second)
+        self.assertEqual(FileBlob.objects.get(name=first).ref_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.release(first)
+        self.assertTrue(self.storage.exists(first))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.release(first)
+        self.assertFalse(self.storage.exists(first))
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_range_request(self):
+        name = self.storage.save('q.pdf', ContentFile(b'0123456789'))
+        field_file = type('F', (), {'storage': self.storage, 'name': name})()
+        request = RequestFactory().get('/', HTTP_RANGE='bytes=2-5')
+        response = blob_response(request, field_file, 'q.pdf')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'2345')
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/10')
+
+        request = RequestFactory().get('/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(blob_response(request, field_file, 'q.pdf').status_code, 304)
+
+    def test_same_content_with_other_extension_shares_blob(self):
+        first = self.storage.save('a.pdf', ContentFile(b'same-bytes'))
+        second = self.storage.save('b.PNG', ContentFile(b'same-bytes'))
+        self.assertEqual(first, second)
+        self.assertEqual(len(os.listdir(os.path.dirname(self.storage.path(first)))), 1)
+        for name in (first, second):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.storage.release(name)
+        self.assertFalse(self.storage.exists(first))
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_reupload_before_purge_keeps_file(self):
+        name = self.storage.save('a.pdf', ContentFile(b'reused'))
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.storage.release(name)
+        self.assertEqual(self.storage.save('b.pdf', ContentFile(b'reused')), name)
+        for callback in callbacks:
+            callback()  # 늦게 실행된 삭제 -> 다시 참조됐으므로 파일 유지
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(FileBlob.objects.get(name=name).ref_count, 1)
+
+    def test_missing_file_is_404(self):
+        field_file = type('F', (), {'storage': self.storage, 'name': 'quotations/old.pdf'})()
+        self.assertEqual(blob_response(RequestFactory().get('/'), field_file, 'old.pdf').status_code, 404)
+
+    def test_legacy_files_are_migrated(self):
+        migration = importlib.import_module('main.migrations.0025_migrate_legacy_quotation_files')
+        user = User.objects.create_user('legacy', password='pw')
+        task = Event.objects.create(author=user, title='이관', date=date.today()).tasks.first()
+        media = os.path.join(self.tmp.name, 'media')
+        os.makedirs(os.path.join(media, 'quotations'))
+        for legacy in ('old.pdf', 'copy.pdf'):
+            with open(os.path.join(media, 'quotations', legacy), 'wb') as f:
+                f.write(b'%PDF-legacy')
+        quotes = [Quotation.objects.create(task=task, quoted_amount=1000, file=f'quotations/{legacy}')
+                  for legacy in ('old.pdf', 'copy.pdf')]
+
+        with override_settings(MEDIA_ROOT=media, QUOTATION_STORAGE_ROOT=self.tmp.name):
+            migration.migrate_legacy_files(django_apps, None)
+
+        names = {q.file.name for q in Quotation.objects.filter(pk__in=[q.pk for q in quotes])}
+        self.assertEqual(len(names), 1)
+        [name] = names
+        self.assertTrue(name.startswith('blobs/'))
+        self.assertEqual(FileBlob.objects.get(name=name).ref_count, 2)
+        self.assertEqual(os.listdir(os.path.join(media, 'quotations')), [])
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b'%PDF-legacy')
+
+
+class PortfolioAnalyticsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('finance', password='pw')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jan = Event.objects.create(author=self.user, title='1월 컨퍼런스', date=date(2026, 1, 20),
+                                            event_type='conference', client_name='A사', budget=10000000)
+            self.feb = Event.objects.create(author=self.user, title='2월 축제', date=date(2026, 2, 5),
+                                            event_type='festival', client_name='B시', budget=50000000)
+
+    def test_rollup_follows_task_and_event_changes(self):
+        planned = Task.objects.filter(event=self.jan).aggregate(s=Sum('planned_budget'))['s']
+        self.assertEqual(self.jan.finance.planned_cost, planned)
+
+        task = self.jan.tasks.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            task.actual_cost = 3000000
+            task.save()
+            self.jan.status = 'closed'
+            self.jan.save()
+        finance = EventFinance.objects.get(pk=self.jan.pk)
+        self.assertEqual((finance.actual_cost, finance.status), (3000000, 'closed'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.feb.delete()
+        self.assertFalse(EventFinance.objects.filter(pk=self.feb.pk).exists())
+
+    def test_grouped_summary_is_cached_until_rollup_changes(self):
+        data = portfolio_summary(self.user.id, ('month', 'event_type'))
+        self.assertEqual([(r['month'], r['event_type']) for r in data['rows']],
+                         [('2026-01', 'conference'), ('2026-02', 'festival')])
+        self.assertEqual(data['totals']['revenue'], 60000000)
+
+        with self.assertNumQueries(0):
+            portfolio_summary(self.user.id, ('month', 'event_type'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.feb.budget = 40000000
+            self.feb.save()
+        self.assertEqual(portfolio_summary(self.user.id, ('month', 'event_type'))['totals']['revenue'], 50000000)
+
+        data = portfolio_summary(self.user.id, ('client_name',), {'start': date(2026, 2, 1)})
+        self.assertEqual([r['client_name'] for r in data['rows']], ['B시'])
+
+    def test_api(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/api/portfolio/?group=status,bogus')
+        self.assertEqual(response.json()['group'], ['status'])
+        self.assertEqual(self.client.get('/portfolio/?group=month,client_name&start=2026-01').status_code, 200)
+
+
+class DeadlineScannerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date(2026, 5, 10)
+        cls.user = User.objects.create_user('pm', password='pw', email='pm@example.com')
+        cls.other = User.objects.create_user('other', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='마감 점검', date=date(2026, 6, 1))
+        cls.other_event = Event.objects.create(author=cls.other, title='다른 행사', date=date(2026, 6, 1))
+        Task.objects.all().delete()
+        Task.objects.bulk_create([
+            Task(event=cls.event, content='지연', deadline=date(2026, 5, 1)),
+            Task(event=cls.event, content='어제 지연', deadline=date(2026, 5, 9)),
+            Task(event=cls.event, content='2년 전 지연', deadline=date(2024, 5, 1)),
+            Task(event=cls.event, content='완료된 지연', deadline=date(2026, 5, 1), is_done=True),
+            Task(event=cls.event, content='오늘', deadline=date(2026, 5, 10)),
+            Task(event=cls.event, content='일주일 뒤', deadline=date(2026, 5, 17)),
+            Task(event=cls.event, content='먼 미래', deadline=date(2026, 5, 30)),
+            Task(event=cls.other_event, content='남의 지연', deadline=date(2026, 5, 2)),
+        ])
+
+    def test_board_per_user_and_shop_wide(self):
+        board = deadline_board(self.user, days=7, today=self.today)
+        # 지연은 최근 마감부터, OVERDUE_DAYS 보다 오래된 건 제외
+        self.assertEqual([t.content for t in board['overdue']], ['어제 지연', '지연'])
+        self.assertEqual([t.content for t in board['upcoming']], ['오늘', '일주일 뒤'])
+
+        board = deadline_board(None, days=7, today=self.today)
+        self.assertEqual(board['overdue_count'], 3)
+
+        self.client.force_login(self.user)
+        response = self.client.get('/deadlines/?days=14&scope=all')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context['shop_wide'])  # staff 가 아니면 내 행사만
+
+    def test_range_scan_uses_deadline_index(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN 형식은 SQLite 기준')
+        sql, params = open_tasks(before=self.today).query.sql_with_params()
+        self.assertTrue(any('task_open_deadline_idx' in line for line in explain(sql, params)))
+
+    def test_digest_is_created_once_per_day(self):
+        created, emailed = send_digests(today=self.today, days=7, batch_size=1, email=True)
+        self.assertEqual((created, emailed), (2, 1))
+        self.assertEqual(len(mail.outbox), 1)
+        digest = DeadlineDigest.objects.get(user=self.user)
+        self.assertEqual((digest.overdue_count, digest.upcoming_count, digest.emailed), (2, 2, True))
+        self.assertNotIn('2년 전 지연', digest.body)
+
+        self.assertEqual(send_digests(today=self.today, days=7, email=True), (0, 0))
+
+    def test_failed_send_is_retried(self):
+        with override_settings(EMAIL_BACKEND='main.tests.FailingEmailBackend'):
+            self.assertEqual(send_digests(today=self.today, days=7, email=True), (2, 0))
+        self.assertFalse(DeadlineDigest.objects.get(user=self.user).emailed)
+
+        self.assertEqual(send_digests(today=self.today, days=7, email=True), (0, 1))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertTrue(DeadlineDigest.objects.get(user=self.user).emailed)
+        self.assertEqual(send_digests(today=self.today, days=7, email=True), (0, 0))
+
+    def test_partial_failure_marks_sent_digests(self):
+        User.objects.filter(pk=self.other.pk).update(email='bad@example.com')
+        with override_settings(EMAIL_BACKEND='main.tests.RejectingEmailBackend'), \
+                self.assertLogs('eos.deadlines', 'ERROR'):
+            self.assertEqual(send_digests(today=self.today, days=7, batch_size=2, email=True), (2, 1))
+        self.assertEqual(dict(DeadlineDigest.objects.values_list('user_id', 'emailed')),
+                         {self.user.pk: True, self.other.pk: False})
+
+        # 다음 실행에서는 실패한 사용자에게만 재발송 (이미 받은 사용자는 중복 발송 없음)
+        self.assertEqual(send_digests(today=self.today, days=7, email=True), (0, 1))
+        self.assertEqual([m.to for m in mail.outbox], [['pm@example.com'], ['bad@example.com']])
+
+
+class CriticalPathTests(TestCase):
+    @staticmethod
+    def graph(durations, edges):
+        succs, preds = defaultdict(list), defaultdict(list)
+        for p, q, lag in edges:
+            succs[p].append((q, lag))
+            preds[q].append((p, lag))
+        return durations, succs, preds
+
+    def test_diamond(self):
+        # 1 -> 2 -> 4, 1 -> 3 -> 4 (3 이 더 길어서 주공정)
+        duration, succs, preds = self.graph({1: 2, 2: 1, 3: 4, 4: 1}, [(1, 2, 0), (1, 3, 0), (2, 4, 0), (3, 4, 0)])
+        order, es, ls, finish = compute_schedule(duration, succs, preds)
+        self.assertEqual(finish, 7)
+        self.assertEqual(es, {1: 0, 2: 2, 3: 2, 4: 6})
+        self.assertEqual(ls[2] - es[2], 3)  # 여유 3일
+        self.assertEqual(critical_chain(order, duration, succs, es, ls), [1, 3, 4])
+
+    def test_cycle_detected(self):
+        duration, succs, preds = self.graph({1: 1, 2: 1, 3: 1}, [(1, 2, 0), (2, 3, 0), (3, 2, 0)])
+        with self.assertRaises(ScheduleCycleError) as ctx:
+            compute_schedule(duration, succs, preds)
+        self.assertEqual(ctx.exception.task_ids, [2, 3])
+
+    def test_two_thousand_tasks(self):
+        # 단계별 50개 x 40층, 층마다 앞 층 2개에 연결 -> V=2000, E≈3900
+        n = 2000
+        edges = [(i - 50, i, 0) for i in range(50, n)] + [(i - 51, i, 1) for i in range(51, n) if i % 50]
+        duration, succs, preds = self.graph({i: 1 + i % 3 for i in range(n)}, edges)
+        order, es, ls, finish = compute_schedule(duration, succs, preds)  # 소요 시간은 bench_suite 의 calc.schedule
+        self.assertEqual(len(order), n)
+        self.assertTrue(all(ls[i] >= es[i] for i in range(n)))
+
+    def test_incremental_matches_full_recompute(self):
+        user = User.objects.create_user('cpm', password='pw')
+        event = Event.objects.create(author=user, title='CPM', date=date(2026, 9, 1), event_type='festival')
+        a, b, c, d = list(event.tasks.order_by('id')[:4])
+        reschedule(event)
+        add_dependency(a, b)
+        add_dependency(b, c, lag_days=2)
+        add_dependency(a, d)
+        with self.assertRaises(ScheduleCycleError):
+            add_dependency(c, a)
+
+        b.duration_days = 5
+        b.save()
+        reschedule(event, [b.id])
+        incremental = list(event.tasks.order_by('id').values_list('early_start', 'late_start', 'is_critical'))
+        Task.objects.filter(event=event).update(early_start=None, late_start=None)
+        reschedule(event)
+        full = list(event.tasks.order_by('id').values_list('early_start', 'late_start', 'is_critical'))
+        self.assertEqual(incremental, full)
+        self.assertEqual(Task.objects.get(pk=c.pk).early_start, 1 + 5 + 2)
+
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(f'/event/{event.id}/schedule/').status_code, 200)
+
+    def test_incremental_longer_project_updates_parallel_tasks(self):
+        # A -> B, C 는 병렬 - B 가 늘어 전체 기간이 바뀌면 C 의 LS 도 다시 계산
+        user = User.objects.create_user('cpm2', password='pw')
+        event = Event.objects.create(author=user, title='CPM', date=date(2026, 9, 1))
+        event.tasks.all().delete()
+        a, b, c = [Task.objects.create(event=event, content=name, deadline=date(2026, 8, 1), duration_days=days)
+                   for name, days in (('A', 1), ('B', 1), ('C', 2))]
+        add_dependency(a, b)
+        reschedule(event)
+        self.assertEqual(Task.objects.get(pk=c.pk).late_start, 0)
+
+        Task.objects.filter(pk=b.pk).update(duration_days=5)
+        reschedule(event, [b.id])
+        c.refresh_from_db()
+        self.assertEqual((c.late_start, c.is_critical), (4, False))
+
+
+class DeadlineShiftTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('shift', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='날짜 변경', date=date(2026, 9, 1), event_type='ceremony')
+
+    def offsets(self):
+        return {t.pk: (self.event.date - t.deadline).days for t in self.event.tasks.all()}
+
+    def test_single_update_preserves_offsets(self):
+        before = self.offsets()
+        with self.assertNumQueries(1):
+            count = shift_deadlines(self.event, timedelta(days=10), include_done=True)
+        self.assertEqual(count, len(before))
+        self.event.date += timedelta(days=10)
+        self.assertEqual(self.offsets(), before)
+
+    def test_overview_save_skips_done_tasks_by_default(self):
+        done = self.event.tasks.first()
+        done.is_done = True
+        done.save()
+        before = {t.pk: t.deadline for t in self.event.tasks.all()}
+
+        self.client.force_login(self.user)
+        response = self.client.post(f'/event/{self.event.id}/', {
+            'update_overview': '1', 'title': '날짜 변경', 'client_name': '', 'venue_name': '',
+            'date': '2026-09-08', 'status': 'inquiry', 'budget': 0, 'expected_cost': 0,
+        })
+        self.assertEqual(response.status_code, 302)
+        for task in self.event.tasks.all():
+            moved = timedelta(0) if task.pk == done.pk else timedelta(days=7)
+            self.assertEqual(task.deadline - before[task.pk], moved)
+
+    def test_failed_shift_rolls_back_date_change(self):
+        before = {t.pk: t.deadline for t in self.event.tasks.all()}
+        self.client.force_login(self.user)
+        with mock.patch('main.views.shift_deadlines', side_effect=RuntimeError), self.assertRaises(RuntimeError):
+            self.client.post(f'/event/{self.event.id}/', {
+                'update_overview': '1', 'title': '날짜 변경', 'client_name': '', 'venue_name': '',
+                'date': '2026-09-08', 'status': 'inquiry', 'budget': 0, 'expected_cost': 0,
+            })
+        # 행사일만 바뀐 채로 남지 않음 -> 다시 저장하면 이동됨
+        self.assertEqual(Event.objects.get(pk=self.event.pk).date, date(2026, 9, 1))
+        self.assertEqual({t.pk: t.deadline for t in self.event.tasks.all()}, before)
+
+
+class EventCloneTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('clone', password='pw')
+        cls.vendor = Vendor.objects.create(name='무대업체', business_number='999-00-00001', contact_person='김', phone_number='010')
+        cls.event = Event.objects.create(author=cls.user, title='연례 행사', date=date(2026, 5, 1), event_type='ceremony')
+        root = cls.event.tasks.order_by('id').first()
+        root.vendor = cls.vendor
+        root.is_done = True
+        root.save()
+        child = Task.objects.create(event=cls.event, parent=root, content='하위', deadline=date(2026, 4, 20))
+        Task.objects.create(event=cls.event, parent=child, content='하위의 하위', deadline=date(2026, 4, 25))
+        TaskDependency.objects.create(predecessor=root, successor=child, lag_days=1)
+        Cue.objects.bulk_create(Cue(event=cls.event, order=i * ORDER_GAP, content=f'큐 {i}') for i in range(1, 4))
+
+    def test_deep_copy(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            clone = clone_event(self.event, date(2027, 5, 1), title='2027 연례 행사')
+
+        self.assertEqual(clone.tasks.count(), self.event.tasks.count())  # 표준 Task 가 추가로 생기지 않음
+        grandchild = clone.tasks.get(content='하위의 하위')
+        self.assertEqual(grandchild.parent.parent.event_id, clone.id)
+        self.assertEqual(grandchild.deadline, date(2027, 4, 25))
+        self.assertFalse(clone.tasks.filter(Q(is_done=True) | Q(vendor__isnull=False)).exists())
+        self.assertEqual(TaskDependency.objects.filter(successor__event=clone).get().lag_days, 1)
+        self.assertEqual(list(clone.cue_set.order_by('order').values_list('content', flat=True)), ['큐 1', '큐 2', '큐 3'])
+        self.assertEqual(clone.finance.revenue, self.event.budget)
+        # 장비 예약도 복제 시점에 생성 (부족 현황에 바로 포함)
+        self.assertEqual(dict(clone.reservations.values_list('equipment__name', 'quantity')),
+                         {name: qty for name, (_, qty) in equipment_requirements(clone).items()})
+        self.assertTrue(clone.reservations.exists())
+
+        vendors = clone_event(self.event, date(2027, 5, 1), include_vendors=True)
+        self.assertTrue(vendors.tasks.filter(vendor=self.vendor).exists())
+
+    def test_cross_event_dependency_is_not_copied(self):
+        other = Event.objects.create(author=self.user, title='다른 행사', date=date(2026, 6, 1))
+        TaskDependency.objects.create(predecessor=other.tasks.first(), successor=self.event.tasks.first())
+        with self.assertRaises(ValueError):
+            add_dependency(other.tasks.first(), self.event.tasks.last())
+
+        clone = clone_event(self.event, date(2027, 5, 1))
+        self.assertEqual(TaskDependency.objects.filter(successor__event=clone).count(), 1)  # 행사 안의 관계만
+
+    def test_large_event_uses_bulk_passes(self):
+        Task.objects.bulk_create(
+            Task(event=self.event, content=f'작업 {i}', deadline=date(2026, 4, 1)) for i in range(1500)
+        )
+        # 소요 시간은 bench_suite 의 clone 으로 측정
+        with CaptureQueriesContext(connection) as ctx:
+            clone = clone_event(self.event, date(2027, 5, 1))
+        self.assertEqual(clone.tasks.count(), self.event.tasks.count())
+        # 행 단위 저장이면 1500회 이상 - SQLite 는 쿼리당 파라미터 수 제한으로 배치가 잘게 나뉨
+        # (Task 복사 + 검색 문서 색인이 각각 수십 회 이내)
+        self.assertLess(len(ctx.captured_queries), 100)
+
+
+class InventoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('inventory', password='pw')
+
+    def make_event(self, day, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Event.objects.create(author=self.user, title=f'행사 {day}', date=day, **fields)
+
+    def test_requirements_follow_engines(self):
+        event = self.make_event(date(2026, 6, 10), has_sound=False)
+        needs = equipment_requirements(event)
+        self.assertTrue(needs)
+        self.assertTrue(all(category == 'lighting' for category, _ in needs.values()))
+
+        # 저장 시 예약이 계산 결과로 교체되고, 등록 안 된 장비는 보유 0 으로 추가됨
+        reserved = dict(event.reservations.values_list('equipment__name', 'quantity'))
+        self.assertEqual(reserved, {name: qty for name, (_, qty) in needs.items()})
+        self.assertEqual(set(event.reservations.values_list('start_date', 'end_date')), {reservation_period(event)})
+        self.assertFalse(Equipment.objects.exclude(owned_qty=0).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event.has_lighting = False
+            event.save()
+        self.assertFalse(event.reservations.exists())
+
+    def test_overlapping_events_short_on_shared_days(self):
+        first = self.make_event(date(2026, 6, 10), has_lighting=False)
+        second = self.make_event(date(2026, 6, 11), has_lighting=False)
+        sub = Equipment.objects.get(name='18 inch Subwoofer')
+        need = first.reservations.get(equipment=sub).quantity
+        Equipment.objects.update(owned_qty=100)
+        sub.owned_qty = need  # 한 행사 분량만 보유
+        sub.save()
+
+        shortfalls = shortfall_report(date(2026, 6, 1), date(2026, 6, 30))
+        # 예약 구간 6/9~6/11, 6/10~6/12 -> 겹치는 6/10, 6/11 만 부족
+        self.assertEqual([s['day'] for s in shortfalls], [date(2026, 6, 10), date(2026, 6, 11)])
+        self.assertEqual({s['equipment_id'] for s in shortfalls}, {sub.id})
+        self.assertEqual(shortfalls[0]['shortage'], need)
+        self.assertEqual(shortfalls[0]['event_ids'], [first.id, second.id])
+
+        self.client.force_login(self.user)
+        response = self.client.get(f'/inventory/?event={first.id}&start=2026-06-01&end=2026-06-30')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['shortfalls']), 2)
+
+    def test_rebuild_covers_events_without_reservations(self):
+        first = self.make_event(date(2026, 6, 10))
+        second = self.make_event(date(2026, 6, 20), has_lighting=False)
+        expected = {e.pk: set(e.reservations.values_list('equipment__name', 'quantity')) for e in (first, second)}
+        first.reservations.all().delete()  # 0019 이전 행사처럼 예약 없음
+        second.reservations.all().delete()
+
+        call_command('rebuild_reservations', '--event', str(first.pk), stdout=io.StringIO())
+        self.assertEqual(set(first.reservations.values_list('equipment__name', 'quantity')), expected[first.pk])
+        self.assertFalse(second.reservations.exists())
+
+        migration = importlib.import_module('main.migrations.0026_backfill_equipment_reservations')
+        migration.backfill_reservations(django_apps, None)
+        for event in (first, second):
+            self.assertEqual(set(event.reservations.values_list('equipment__name', 'quantity')), expected[event.pk])
+
+    def test_sweep_over_thousands_of_reservations(self):
+        rows, rid = [], 0
+        for e in range(500):  # 행사 500건 x 장비 8종
+            start = date(2026, 1, 1) + timedelta(days=e % 200)
+            for item in range(8):
+                rid += 1
+                rows.append((rid, item, 2, start, start + timedelta(days=2)))
+        shortfalls = sweep_shortfalls(rows, {item: 10 for item in range(8)})  # 소요 시간은 bench_suite 의 inventory.shortfalls
+        # 하루 2~3건 시작 x 3일 구간 x 수량 2 -> 보유 10 을 넘는 날이 생김
+        self.assertTrue(shortfalls)
+        self.assertTrue(all(s['demand'] > s['owned'] for s in shortfalls))
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('search', password='pw')
+        cls.other = User.objects.create_user('search-other', password='pw')
+        cls.event = Event.objects.create(
+            author=cls.user, title='신제품 런칭 컨퍼런스', client_name='삼성전자', venue_name='코엑스 그랜드볼룸', date=date(2026, 9, 1),
+        )
+        cls.task = Task.objects.create(event=cls.event, content='LED 월 설치 업체 섭외', deadline=date(2026, 8, 20))
+        cls.vendor = Vendor.objects.create(name='비전LED', business_number='111-22-33333', contact_person='홍길동', phone_number='010')
+        insert_cue(cls.event, Cue(content='오프닝 영상 재생'))
+        Event.objects.create(author=cls.other, title='코엑스 전시회', date=date(2026, 9, 1))
+
+    def titles(self, query, user=None, **kwargs):
+        return [doc.title for doc in search_documents(user or self.user, query, **kwargs)]
+
+    def test_korean_bigrams_and_prefix(self):
+        self.assertEqual(search_terms('코엑스홀 LED-wall'), '코엑 엑스 스홀 led wall')
+        self.assertEqual(fts5_query('코엑스 le'), '"코엑 엑스" "le"*')
+        # 조사가 붙은 단어 중간, 영문 접두어, 여러 단어 AND
+        self.assertEqual(self.titles('그랜드'), ['신제품 런칭 컨퍼런스'])
+        self.assertEqual(self.titles('코엑스 삼성'), ['신제품 런칭 컨퍼런스'])
+        self.assertEqual(self.titles('led', kinds=['task']), ['LED 월 설치 업체 섭외'])
+        self.assertEqual(self.titles('오프닝'), ['오프닝 영상 재생'])
+        self.assertEqual(self.titles('홍길동'), ['비전LED'])
+        self.assertEqual(self.titles('코엑스 없는말'), [])
+
+    def test_title_match_ranks_first_and_other_users_hidden(self):
+        Task.objects.create(event=self.event, content='리허설 진행', deadline=date(2026, 8, 30))
+        # update() 는 시그널이 없으므로 전체 재색인으로 반영
+        Event.objects.filter(pk=self.event.pk).update(venue_name='코엑스 리허설룸')
+        self.assertEqual(self.titles('리허설'), ['리허설 진행'])
+        rebuild_index()
+        # 제목 일치(Task) 가 본문(행사 장소) 일치보다 앞
+        self.assertEqual(self.titles('리허설'), ['리허설 진행', '신제품 런칭 컨퍼런스'])
+        self.assertNotIn('코엑스 전시회', self.titles('코엑스'))
+        self.assertEqual(self.titles('코엑스', user=self.other), ['코엑스 전시회'])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.task.content = '트러스 구조 검토'
+        self.task.save()
+        self.assertEqual(self.titles('led', kinds=['task']), [])
+        self.assertEqual(self.titles('트러스'), ['트러스 구조 검토'])
+
+        clone = clone_event(self.event, date(2027, 9, 1), title='2027 런칭')
+        self.assertEqual(len(self.titles('트러스')), 2)
+        clone.delete()
+        self.task.delete()
+        self.assertEqual(self.titles('트러스'), [])
+        self.assertFalse(SearchDocument.objects.filter(kind='task', object_id=self.task.pk).exists())
+
+        self.client.force_login(self.user)
+        response = self.client.get('/search/?q=코엑스')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '신제품 런칭 컨퍼런스')
+
+    def test_ranked_search_on_large_index(self):
+        # 소요 시간은 bench_suite 의 search 로 측정
+        words = ['무대', '조명', '음향', '영상', '케이터링', '셔틀', '현수막', '등록']
+        SearchDocument.objects.bulk_create([
+            SearchDocument(
+                kind='task', object_id=100000 + i, event=self.event, author=self.user,
+                title=f'{words[i % 8]} {words[i // 8 % 8]} 점검 {i}', title_terms=search_terms(f'{words[i % 8]} {words[i // 8 % 8]} 점검 {i}'),
+            )
+            for i in range(20000)
+        ], batch_size=500)
+        results = search_documents(self.user, '케이터링 셔틀', limit=20)
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all('케이터링' in r.title and '셔틀' in r.title for r in results))
+
+
+@override_settings(PERF_SAMPLE_RATE=1)
+class PerfInstrumentationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('perf', password='pw')
+        cls.event = Event.objects.create(author=cls.user, title='계측', date=date(2026, 5, 1))
+
+    def setUp(self):
+        perf_stats.reset()
+        self.client.force_login(self.user)
+
+    def test_server_timing_breakdown_and_log(self):
+        with self.assertLogs('eos.perf', level='INFO') as logs:
+            response = self.client.get(f'/event/{self.event.id}/tab/space/')
+        header = response['Server-Timing']
+        for metric in ('db;dur=', 'calc;dur=', 'draw;dur=', 'tpl;dur=', 'total;dur='):
+            self.assertIn(metric, header)
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record['view'], 'detail_tab')
+        self.assertGreater(record['queries'], 0)
+        self.assertIn('draw_space', record['calls'])
+        self.assertIn('main/tabs/space.html', record['calls'])
+
+    def test_sampling_off_skips_everything(self):
+        with override_settings(PERF_SAMPLE_RATE=0):
+            response = self.client.get('/')
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(perf_stats.snapshot(), {})
+
+    def test_stats_endpoint_percentiles(self):
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95)
+        with self.assertLogs('eos.perf'):
+            for _ in range(3):
+                self.client.get('/')
+            self.assertEqual(self.client.get('/internal/perf/').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        with self.assertLogs('eos.perf'):
+            data = self.client.get('/internal/perf/').json()
+        index = data['views']['index']
+        self.assertEqual(index['count'], 3)
+        self.assertLessEqual(index['p50'], index['p95'])
+        self.assertLessEqual(index['p95'], index['p99'])
+
+
+class SyntheticBenchmarkTests(TestCase):
+    SIZE = SyntheticSize(users=3, events_per_user=4, tasks_per_event=12, depth=3, cues_per_event=5, vendors=6)
+
+    def test_generator_builds_full_dataset(self):
+        counts = SyntheticGenerator(self.SIZE, seed=1).run()
+        self.assertEqual(counts['events'], 12)
+        self.assertEqual(counts['tasks'], 12 * 12)
+        events = Event.objects.filter(author__username__startswith='synth-')
+        self.assertEqual(set(events.values_list('event_type', flat=True)), {code for code, _ in TYPE_CHOICES_EVENT})
+        # 3단계 트리 (손자 Task 존재) / 외주 Task 는 견적 중 1건만 선정
+        self.assertTrue(Task.objects.filter(event__in=events, parent__parent__isnull=False).exists())
+        selected = Quotation.objects.filter(task__event__in=events, is_selected=True)
+        self.assertEqual(selected.count(), Task.objects.filter(event__in=events, is_external=True).count())
+        # 시그널 없이 만든 데이터도 파생 테이블에 반영
+        self.assertEqual(EventFinance.objects.filter(event__in=events).count(), 12)
+        self.assertEqual(events.filter(reservations__isnull=False).distinct().count(),
+                         events.filter(Q(has_lighting=True) | Q(has_sound=True)).count())
+        self.assertEqual(SearchDocument.objects.filter(kind='task', event__in=events).count(), 12 * 12)
+
+        self.assertEqual(clear_synthetic(), (3, 6))
+        self.assertFalse(Event.objects.filter(author__username__startswith='synth-').exists())
+
+    def test_benchmark_runs_and_rolls_back(self):
+        result = run_size(self.SIZE, repeat=1)
+        self.assertLessEqual({'index', 'detail.tabs_cold', 'task.toggle', 'export_excel', 'draw.space'}, set(result['cases']))
+        self.assertFalse(Event.objects.exists())  # 측정 데이터는 롤백됨
+
+        baseline = {'sizes': {'s': {'cases': {'index': {'p50_ms': 10.0}, 'export_excel': {'p50_ms': 10.0}}}}}
+        current = {'sizes': {'s': {'cases': {'index': {'p50_ms': 11.0}, 'export_excel': {'p50_ms': 20.0}}}}}
+        self.assertEqual([r['case'] for r in compare(current, baseline)], ['export_excel'])
+
+
+class RealtimeSignalTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('live', password='pw')
+        self.event = Event.objects.create(author=self.user, title='라이브', date=date(2026, 9, 1))
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.channel = channel_name(self.event.pk)
+        self.subscription = get_broker().subscribe(self.channel, loop=self.loop)
+        self.addCleanup(get_broker().unsubscribe, self.channel, self.subscription)
+
+    def received(self):
+        self.loop.run_until_complete(asyncio.sleep(0))  # call_soon_threadsafe 로 넘어온 메시지 처리
+        return self.subscription.drain()
+
+    def test_deltas_published_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            task = Task.objects.create(event=self.event, content='무대 설치', deadline=date(2026, 8, 30))
+        self.assertEqual(self.received(), [])  # 커밋 전에는 발행하지 않음
+        for callback in callbacks:
+            callback()
+        self.assertIn(f'task:{task.pk}', [m['key'] for m in self.received()])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.is_done = True
+            task.save(update_fields=['is_done'])
+            cues = insert_cues(self.event, [Cue(content='오프닝'), Cue(content='클로징')])
+            reorder(self.event, [cues[1].pk, cues[0].pk])
+            self.event.expected_cost = 500000
+            self.event.save(update_fields=['expected_cost'])
+            self.event.save(update_fields=['status'])
+        deltas = coalesce(self.received())
+        by_key = {d['key']: d for d in deltas}
+        self.assertTrue(by_key[f'task:{task.pk}']['is_done'])
+        self.assertEqual(by_key['cues']['orders'], [[cues[1].pk, ORDER_GAP], [cues[0].pk, 2 * ORDER_GAP]])
+        self.assertEqual(by_key['budget']['expected_cost'], 500000)
+        self.assertEqual(sum(1 for d in deltas if d['type'] == 'budget'), 1)
+
+    def test_sender_coalesces_burst_into_one_frame(self):
+        frames = []
+
+        async def send(message):
+            frames.append(json.loads(message['text']))
+
+        async def burst():
+            for i in range(20):
+                get_broker().publish(self.channel, {'type': 'task', 'key': 'task:1', 'n': i})
+            get_broker().publish(self.channel, {'type': 'budget', 'key': 'budget'})
+            sender = asyncio.ensure_future(_sender(send, self.subscription, 0.01))
+            await asyncio.sleep(0.05)
+            sender.cancel()
+
+        self.loop.run_until_complete(burst())
+        self.assertEqual(len(frames), 1)
+        self.assertEqual([(d['key'], d.get('n')) for d in frames[0]['deltas']], [('task:1', 19), ('budget', None)])
+
+
+class RealtimeSocketTests(TransactionTestCase):
+    # 인증은 sync_to_async 로 다른 스레드에서 조회하므로 커밋된 데이터가 필요
+    def setUp(self):
+        self.user = User.objects.create_user('socket', password='pw')
+        self.other = User.objects.create_user('socket-other', password='pw')
+        self.event = Event.objects.create(author=self.user, title='소켓', date=date(2026, 9, 1))
+
+    def connect(self, user, *inbound, query=b''):
+        headers = []
+        if user is not None:
+            client = Client()
+            client.force_login(user)
+            headers.append((b'cookie', f'sessionid={client.cookies["sessionid"].value}'.encode()))
+        scope = {'type': 'websocket', 'path': f'/ws/event/{self.event.pk}/', 'query_string': query, 'headers': headers}
+
+        async def scenario():
+            inbox, frames = asyncio.Queue(), []
+            outbox = asyncio.Queue()
+            await inbox.put({'type': 'websocket.connect'})
+            app = asyncio.ensure_future(websocket_app(scope, inbox.get, outbox.put))
+            frames.append(await asyncio.wait_for(outbox.get(), 5))
+            if frames[0]['type'] == 'websocket.accept':
+                frames.append(await asyncio.wait_for(outbox.get(), 5))  # hello
+                channel = channel_name(self.event.pk)
+                get_broker().publish(channel, {'type': 'cue', 'key': 'cue:1', 'order': 1})
+                get_broker().publish(channel, {'type': 'cue', 'key': 'cue:1', 'order': 2})
+                frames.append(await asyncio.wait_for(outbox.get(), 5))
+                for message in inbound:
+                    await inbox.put(message)
+                    frames.append(await asyncio.wait_for(outbox.get(), 5))
+                await inbox.put({'type': 'websocket.disconnect', 'code': 1000})
+            await asyncio.wait_for(app, 5)
+            return frames
+
+        return asyncio.run(scenario())
+
+    def test_author_receives_batches_and_pong(self):
+        frames = self.connect(self.user, {'type': 'websocket.receive', 'text': json.dumps({'type': 'ping', 't0': 7})})
+        accept, hello, batch, pong = frames
+        self.assertEqual(accept['type'], 'websocket.accept')
+        self.assertEqual(json.loads(hello['text'])['event'], self.event.pk)
+        self.assertEqual(json.loads(batch['text'])['deltas'], [{'type': 'cue', 'key': 'cue:1', 'order': 2}])
+        self.assertEqual(json.loads(pong['text'])['t0'], 7)
+        self.assertEqual(get_broker().subscriber_count(channel_name(self.event.pk)), 0)
+
+    def test_other_user_rejected(self):
+        [close] = self.connect(self.other)
+        self.assertEqual(close, {'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+
+    def test_show_viewer_token(self):
+        run = ShowRun.objects.create(event=self.event)
+        accept, hello, batch = self.connect(None, query=f'show={run.viewer_token}'.encode())
+        self.assertEqual(accept['type'], 'websocket.accept')
+        self.assertEqual(json.loads(batch['text'])['deltas'][0]['key'], 'cue:1')
+        [close] = self.connect(None, query=b'show=wrong')
+        self.assertEqual(close['code'], CLOSE_FORBIDDEN)
+
+
+class ShowCallingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('caller', password='pw')
+        self.event = Event.objects.create(author=self.user, title='시상식', date=date(2026, 9, 1))
+        self.cues = insert_cues(self.event, [Cue(content=f'큐 {i}', duration=60) for i in range(3)])
+
+    def test_advance_through_show(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            state = show_control(self.event, 'start')
+        self.assertTrue(state['running'])
+        self.assertEqual((state['cue']['no'], state['next']['no']), (1, 2))
+        self.assertIsNotNone(state['cue_started_at'])
+        self.assertEqual(len(callbacks), 1)  # 커밋 후 'show' 상태 1건 발행
+
+        self.assertEqual(show_control(self.event, 'next')['cue']['id'], self.cues[1].pk)
+        self.assertEqual(show_control(self.event, 'prev')['cue']['id'], self.cues[0].pk)
+        state = show_control(self.event, 'goto', self.cues[2].pk)
+        self.assertEqual((state['cue']['no'], state['next']), (3, None))
+        # 마지막 큐에서 GO -> 종료
+        state = show_control(self.event, 'next')
+        self.assertFalse(state['running'])
+        self.assertEqual(state['version'], 5)
+        self.assertRaises(Cue.DoesNotExist, show_control, self.event, 'goto', 999999)
+
+    def test_immediate_delta_skips_coalesce_window(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        channel = channel_name(self.event.pk)
+        subscription = get_broker().subscribe(channel, loop=loop)
+        self.addCleanup(get_broker().unsubscribe, channel, subscription)
+        with self.captureOnCommitCallbacks(execute=True):
+            show_control(self.event, 'start')
+        sent = []
+
+        async def send(message):
+            sent.append((time.perf_counter(), json.loads(message['text'])))
+
+        async def run():
+            started = time.perf_counter()
+            sender = asyncio.ensure_future(_sender(send, subscription, 1.0))
+            await asyncio.sleep(0.05)
+            sender.cancel()
+            return started
+
+        started = loop.run_until_complete(run())
+        [(at, frame)] = sent
+        self.assertLess(at - started, 0.05)  # 1초 묶음 대기 없이 전송
+        self.assertEqual(frame['deltas'][0]['state']['cue']['id'], self.cues[0].pk)
+
+    def test_views(self):
+        other = User.objects.create_user('caller-other', password='pw')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(f'/event/{self.event.pk}/show/').status_code, 403)
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(f'/event/{self.event.pk}/show/').context['state']['next']['content'], '큐 0')
+        response = self.client.post(f'/event/{self.event.pk}/show/control/', {'action': 'start'})
+        self.assertEqual(response.json()['cue']['id'], self.cues[0].pk)
+        self.assertEqual(self.client.post(f'/event/{self.event.pk}/show/control/', {'action': 'jump'}).status_code, 400)
+
+        self.client.logout()
+        token = ShowRun.objects.get(event=self.event).viewer_token
+        self.assertContains(self.client.get(f'/show/{token}/'), '시상식')
+        self.assertEqual(self.client.get(f'/show/{token}/state/').json()['cue']['no'], 1)
+        self.assertEqual(self.client.get('/show/wrong/').status_code, 404)
+
+
+class EgressTests(TestCase):
+    def test_grid_distance(self):
+        free = np.ones((9, 9), dtype=bool)
+        sources = np.zeros_like(free)
+        sources[0, 0] = True
+        dist = grid_distance(free, sources)
+        self.assertAlmostEqual(float(dist[8, 8]), 8 * np.sqrt(2) * CELL, places=4)
+        self.assertAlmostEqual(float(dist[0, 8]), 8 * CELL, places=4)
+
+        # 가운데 벽(위쪽 1칸만 열림)을 돌아가야 함 / 완전히 막히면 inf
+        free[1:, 4] = False
+        dist = grid_distance(free, sources)
+        self.assertAlmostEqual(float(dist[8, 8]), (8 + 4 * np.sqrt(2)) * CELL, places=4)  # (0,4) 경유
+        free[0, 4] = False
+        self.assertTrue(np.isinf(grid_distance(free, sources)[8, 8]))
+        # limit: 한도 이내 값은 정확, 밖은 한도보다 큼
+        free[:] = True
+        capped = grid_distance(free, sources, limit=1.0)
+        self.assertAlmostEqual(float(capped[0, 4]), 1.0, places=4)
+        self.assertGreater(float(capped[8, 8]), 1.0)
+
+    def test_large_theater(self):
+        # 소요 시간은 bench_suite 의 calc.egress 로 측정
+        event = Event(seating_type='theater', venue_width=33, venue_depth=74, date=date(2026, 9, 1))
+        report = analyze_egress(event)
+        self.assertEqual(report['seats'], 3000)
+        self.assertTrue(report['assumed_exits'])
+        # 후면 출입문만 있으면 앞쪽 좌석은 30m 초과, 30m 넘는 긴 열은 통로 위반
+        self.assertGreater(report['violations']['travel'], 0)
+        self.assertGreater(report['violations']['aisle'], 0)
+        self.assertEqual(report['violations']['blocked'], 0)
+
+        # 앞/중간 좌우 벽에 출구를 추가하면 보행거리 위반이 사라짐
+        event.exits = [{'x': x, 'y': y, 'width': 2.0} for x in (0, 33) for y in (2, 25, 45, 62)]
+        report = analyze_egress(event)
+        self.assertFalse(report['assumed_exits'])
+        self.assertEqual(report['violations']['travel'], 0)
+        self.assertLessEqual(report['max_travel'], 30)
+
+    def test_blocked_exit_and_form(self):
+        event = Event(seating_type='banquet', venue_width=20, venue_depth=40, date=date(2026, 9, 1),
+                      exits=[{'x': 10, 'y': 37, 'width': 1.0}])  # 무대 한가운데
+        report = analyze_egress(event)
+        self.assertEqual(report['violations']['blocked'], report['seats'])
+        self.assertEqual(len(report['flagged']), report['seats'])
+        self.assertTrue(any('1개뿐' in warn for warn in report['warnings']))
+
+        form = EventSpaceForm(instance=event)
+        self.assertIn('10, 37, 1', str(form['exits']))
+        data = {name: getattr(event, name) for name in form.fields if name != 'exits'}
+        form = EventSpaceForm({**data, 'exits': '0, 5, 1.8\n20, 5, 1.8\n'}, instance=event)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['exits'][1], {'x': 20.0, 'y': 5.0, 'width': 1.8})
+        self.assertFalse(EventSpaceForm({**data, 'exits': '0, 5'}, instance=event).is_valid())
+
+
+class SightlineTests(TestCase):
+    def test_scores_follow_distance_and_stage_height(self):
+        event = Event(seating_type='theater', venue_width=33, venue_depth=74, date=date(2026, 9, 1))
+        report = analyze_sightlines(event)
+        self.assertEqual(len(report['score']), report['seats'])
+        # 앞줄은 가리는 사람이 없고, 뒤로 갈수록 멀어지고 가려짐 (seat_layout 은 앞줄부터)
+        self.assertTrue(np.isinf(report['clearance'][0]))
+        centre = np.abs(report['angle']) < 5
+        scores = report['score'][centre]
+        self.assertGreater(scores[0], scores[-1])
+
+        low = report['blocked']
+        event.stage_height = 1.5
+        self.assertLess(analyze_sightlines(event)['blocked'], low)
+
+    def test_screens(self):
+        event = Event(seating_type='theater', has_screen=True, date=date(2026, 9, 1))
+        screens = screen_positions(event)
+        self.assertEqual([s['diag'] for s in screens], [200, 200])  # 측면 2.8m -> 200인치 2면
+        report = analyze_sightlines(event)
+        self.assertEqual(np.isnan(report['screen_ratio']).sum(), 0)
+        self.assertAlmostEqual(report['screen_ratio'].max(), report['distance'].max() / screens[0]['height'], delta=2)
+
+        # 측면이 좁으면 무대 뒤 중앙 1면, 천고가 낮으면 축소
+        event.stage_width, event.venue_height = 19.5, 4.0
+        [screen] = screen_positions(event)
+        self.assertTrue(screen['shrunk'])
+        self.assertTrue(any('천고' in warn for warn in analyze_sightlines(event)['warnings']))
+
+
+class VenueGeometryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('venue', password='pw')
+        self.venue = Venue.objects.create(name='그랜드볼룸', width=33, depth=74, height=8)
+        self.event = Event.objects.create(author=self.user, title='총회', date=date(2026, 9, 1), seating_type='theater',
+                                          venue=self.venue, venue_width=33, venue_depth=74, venue_height=8)
+
+    def test_grid_index_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        def boxes(n, size):
+            corner = rng.uniform(0, 50, (n, 2))
+            return np.hstack([corner, corner + rng.uniform(0.1, size, (n, 2))])
+        stored, queries = boxes(300, 3.0), boxes(2000, 1.0)
+        q, o = GridIndex(stored).pairs(queries)
+        found = {(int(a), int(b)) for a, b in zip(q, o)}
+        overlap = ((queries[:, None, 0] <= stored[None, :, 2]) & (stored[None, :, 0] <= queries[:, None, 2])
+                   & (queries[:, None, 1] <= stored[None, :, 3]) & (stored[None, :, 1] <= queries[:, None, 3]))
+        self.assertTrue({(int(a), int(b)) for a, b in zip(*np.nonzero(overlap))} <= found)
+        self.assertLess(len(found), overlap.size / 50)  # 같은 칸 후보만
+
+    def test_layout_rejects_seats_and_egress_uses_doors(self):
+        base = len(seat_layout(Event(seating_type='theater', venue_width=33, venue_depth=74))['x'])
+        # 기둥 8개 + 뒤쪽 오른편이 잘린 L자 외곽선 + 옆문 2개
+        VenueFeature.objects.bulk_create(
+            [VenueFeature(venue=self.venue, kind='column', shape='circle', x=x, y=y, width=0.8)
+             for x in (8, 25) for y in (15, 30, 45, 60)]
+            + [VenueFeature(venue=self.venue, kind='door', x=x, y=40, width=1.8) for x in (0, 33)]
+            + [VenueFeature(venue=self.venue, kind='rigging', x=16.5, y=65, capacity_kg=500)]
+        )
+        self.venue.outline = [[0, 0], [25, 0], [25, 10], [33, 10], [33, 74], [0, 74]]
+        self.venue.save()
+        event = Event.objects.get(pk=self.event.pk)
+
+        layout = seat_layout(event)  # 소요 시간은 bench_suite 의 calc.venue_seats
+        self.assertEqual(len(layout['x']) + layout['rejected'], base)
+        self.assertGreater(layout['rejected'], 8)
+        hw = layout['unit_w'] / 2
+        cx, cy = layout['x'] + hw, layout['y'] + hw
+        self.assertFalse(np.any((np.hypot(cx - 8, cy - 15) < 0.4 + hw)))         # 기둥
+        self.assertFalse(np.any((layout['x'] + 2 * hw > 25) & (layout['y'] < 10)))  # 잘린 모서리
+        self.assertFalse(np.any(np.hypot(cx - 0, cy - 40) < 1.8))                 # 문 앞 확보 구역
+
+        report = analyze_egress(event)
+        self.assertFalse(report['assumed_exits'])
+        self.assertEqual([(e['x'], e['y']) for e in report['exits']], [(0, 40), (33, 40)])
+        self.assertEqual(report['seats'], len(layout['x']))
+        self.client.force_login(self.user)
+        self.assertContains(self.client.get(f'/event/{event.pk}/tab/space/'), '피난 분석')
+
+    def test_venue_dimensions_follow_venue(self):
+        other = Venue.objects.create(name='소연회장', width=15, depth=20, height=4)
+        form = EventSpaceForm({
+            **{name: getattr(self.event, name) for name in EventSpaceForm.Meta.fields if name not in ('exits', 'venue')},
+            'venue': other.pk, 'venue_width': 99,
+        }, instance=self.event)
+        self.assertTrue(form.is_valid(), form.errors)
+        event = form.save()
+        self.assertEqual((event.venue_width, event.venue_depth, event.venue_height), (15, 20, 4))
+
+        other.depth = 24
+        other.save()
+        event.refresh_from_db()
+        self.assertEqual(event.venue_depth, 24)
+
+
+class BoothPackerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('booth', password='pw')
+        self.event = Event.objects.create(author=self.user, title='전시회', date=date(2026, 9, 1), has_booth=True,
+                                          has_stage=False, venue_width=100, venue_depth=100)
+
+    def _exhibitors(self, types):
+        Exhibitor.objects.bulk_create([
+            Exhibitor(event=self.event, name=f'참가사{i:03d}', booth_type=kind, priority=i)
+            for i, kind in enumerate(types)
+        ])
+        return list(self.event.exhibitors.order_by('priority', 'id'))
+
+    def test_packs_without_overlap_in_priority_order(self):
+        exhibitors = self._exhibitors(['island'] * 4 + ['6x3'] * 80 + ['3x3'] * 300)
+        plan = pack_booths(self.event, exhibitors)  # 소요 시간은 bench_suite 의 calc.booths
+
+        self.assertEqual(plan['assigned'], 384)
+        self.assertFalse(plan['unplaced'])
+        booths = plan['booths']
+        x0 = np.array([b['x'] for b in booths]); y0 = np.array([b['y'] for b in booths])
+        x1 = x0 + [b['w'] for b in booths]; y1 = y0 + [b['d'] for b in booths]
+        overlap = ((x0[:, None] < x1[None, :] - 1e-6) & (x0[None, :] < x1[:, None] - 1e-6)
+                   & (y0[:, None] < y1[None, :] - 1e-6) & (y0[None, :] < y1[:, None] - 1e-6))
+        np.fill_diagonal(overlap, False)
+        self.assertFalse(overlap.any())
+        self.assertTrue((x0 >= 3).all() and (x1 <= 97).all() and (y0 >= 3).all() and (y1 <= 97).all())
+        # 2칸 부스는 통로(모듈 간격이 아닌 틈)를 넘지 않음 / 중앙 주 통로는 비어 있음
+        self.assertFalse(((x0 < 52.5) & (x1 > 47.5)).any())
+        # 입구에 가까운 자리부터 - 우선순위 순으로 입구까지 거리가 멀어짐
+        def distance(b):
+            return min(np.hypot(b['x'] + b['w'] / 2 - e['x'], b['y'] + b['d'] / 2 - e['y']) for e in plan['entrances'])
+        small = [distance(b) for b in booths if b['type'] == '3x3' and b['exhibitor_id']]
+        self.assertEqual(small, sorted(small))
+
+    def test_venue_obstacles_and_unplaced(self):
+        venue = Venue.objects.create(name='전시홀', width=30, depth=20, height=8)
+        VenueFeature.objects.create(venue=venue, kind='column', shape='rect', x=7.5, y=4.5, width=1, depth=1)
+        self.event.venue, self.event.venue_width, self.event.venue_depth = venue, 30, 20
+        self.event.save()
+        event = Event.objects.get(pk=self.event.pk)
+        plan = pack_booths(event, self._exhibitors(['3x3'] * 200))
+        self.assertTrue(plan['unplaced'])
+        self.assertTrue(plan['warnings'])
+        # 기둥에 걸린 모듈에는 부스 없음
+        self.assertFalse(any(b['x'] < 8 < b['x'] + MODULE and b['y'] < 4.5 < b['y'] + MODULE for b in plan['booths']))
+
+    def test_booth_page_adds_exhibitor(self):
+        self.client.force_login(self.user)
+        url = f'/event/{self.event.pk}/booths/'
+        response = self.client.post(url, {'name': '에이사', 'booth_type': '6x3', 'priority': 1})
+        self.assertRedirects(response, url)
+        response = self.client.get(url)
+        self.assertContains(response, '에이사')
+        self.assertNotContains(response, '미배정')
+        other = User.objects.create_user('other', password='pw')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class IlluminanceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('lux', password='pw')
+        self.event = Event.objects.create(author=self.user, title='콘서트', date=date(2026, 9, 1), event_type='concert',
+                                          venue_height=9, stage_height=1.0, stage_width=12, stage_depth=6)
+
+    def test_single_fixture_matches_inverse_square(self):
+        # 무대 중앙 바로 위 워시 1대 -> 바로 아래 E = I / h²
+        xs, ys, lux = lux_grid(self.event, [{'type': 'Wash', 'x': 0.0, 'y': 0.0}])
+        h = trim_height(self.event) - self.event.stage_height
+        i, j = np.abs(ys).argmin(), np.abs(xs).argmin()
+        self.assertAlmostEqual(lux[i, j], PHOTOMETRY['Wash']['candela'] / h ** 2, delta=lux[i, j] * 0.02)
+        self.assertEqual(lux.max(), lux[i, j])
+        self.assertLess(lux[0, 0], lux[i, j] / 2)  # 빔 밖 모서리는 어두움
+        # 이펙트 빔은 무대 조도에 포함하지 않음
+        self.assertFalse(lux_grid(self.event, [{'type': 'Beam', 'x': 0.0, 'y': 0.0}])[2].any())
+
+    def test_large_rig_is_cached_per_geometry(self):
+        rng = np.random.default_rng(1)
+        rig = [{'type': 'Wash' if k % 2 else 'Spot', 'x': float(x), 'y': float(y)}
+               for k, (x, y) in enumerate(zip(rng.uniform(-6, 6, 300), rng.uniform(-6, 3, 300)))]
+        report = stage_illuminance(self.event, rig)  # 소요 시간은 bench_suite 의 calc.illuminance_large
+        self.assertLessEqual(report['min'], report['avg'])
+        self.assertLessEqual(report['avg'], report['max'])
+        self.assertAlmostEqual(report['uniformity'], report['min'] / report['avg'], places=1)
+
+        self.assertEqual(_rig_key(self.event, list(reversed(rig))), _rig_key(self.event, rig))  # 순서만 다른 같은 리그
+        cached = stage_illuminance(self.event, list(reversed(rig)))
+        self.assertTrue(np.array_equal(cached['lux'], report['lux']))
+        self.event.venue_height = 12
+        higher = stage_illuminance(self.event, rig)
+        self.assertLess(higher['max'], report['max'])  # 트러스가 높아지면 다시 계산 (더 어두움)
+
+    def test_lighting_tab_shows_illuminance(self):
+        self.client.force_login(self.user)
+        response = self.client.get(f'/event/{self.event.pk}/tab/lighting/')
+        self.assertContains(response, '무대 조도')
+        self.assertContains(response, ' lx')
+
+
+class RiggingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('rig', password='pw')
+        self.venue = Venue.objects.create(name='공연장', width=30, depth=40, height=12)
+        self.event = Event.objects.create(author=self.user, title='콘서트', date=date(2026, 9, 1), event_type='concert',
+                                          venue=self.venue, venue_width=30, venue_depth=40, venue_height=12,
+                                          stage_width=12, stage_depth=6)
+
+    def test_continuous_beam_matches_textbook(self):
+        # 2경간 연속보 등분포: 반력 3/8, 10/8, 3/8 wL / 중간 지점 모멘트 -wL²/8
+        reactions, moments, peak = solve_beam([0, 5, 10], [], [], 10, 0, 10)
+        np.testing.assert_allclose(reactions, [18.75, 62.5, 18.75])
+        self.assertAlmostEqual(moments[1], -31.25)
+        self.assertAlmostEqual(peak, 31.25, places=1)
+        # 경간 중앙 집중하중: 중간 지점 모멘트 -3PL/32
+        reactions, moments, _ = solve_beam([0, 4, 8], [2], [100], 0, 0, 8)
+        self.assertAlmostEqual(moments[1], -37.5)
+        self.assertAlmostEqual(reactions.sum(), 100)
+        # 단순보 + 양 끝 돌출부
+        reactions, _, peak = solve_beam([1, 9], [0, 5, 10], [10, 100, 10], 0, 0, 10)
+        np.testing.assert_allclose(reactions, [60, 60])
+        self.assertAlmostEqual(peak, 190, places=1)
+
+    def test_large_rig_equilibrium(self):
+        rng = np.random.default_rng(2)
+        x, p = rng.uniform(-20, 20, 500), rng.uniform(5, 30, 500)
+        supports = np.linspace(-19.5, 19.5, 9)
+        reactions, _, _ = solve_beam(supports, x, p, TRUSS_KG_PER_M, -20, 20)  # 소요 시간은 bench_suite 의 calc.rigging_large
+        self.assertAlmostEqual(reactions.sum(), p.sum() + TRUSS_KG_PER_M * 40, places=6)
+
+    def test_venue_points_and_overload(self):
+        # 무대 트러스(업스테이지) 선 아래 리깅 포인트 2개 - 하나는 허용하중이 낮음
+        stage_truss_y = 38.4  # 무대 중심(뒷벽 1m + 깊이 절반 -> y=36) + 업스테이지 트러스(빔/워시 ≈ +2.35)
+        VenueFeature.objects.bulk_create([
+            VenueFeature(venue=self.venue, kind='rigging', x=9, y=stage_truss_y, capacity_kg=1000, label='R1'),
+            VenueFeature(venue=self.venue, kind='rigging', x=21, y=stage_truss_y, capacity_kg=100, label='R2'),
+        ])
+        event = Event.objects.get(pk=self.event.pk)
+        rig = build_rig(event)
+        stage = [t for t in rig['trusses'] if t['name'] != 'FOH 트러스'][0]
+        self.assertEqual([s['label'] for s in stage['supports']], ['R1', 'R2'])
+        self.assertTrue([t for t in rig['trusses'] if t['name'] == 'FOH 트러스'][0]['supports'][0]['assumed'])
+        self.assertEqual(len(rig['hangs']), 2)  # 콘서트 + 깊이 25m 초과 -> 라인어레이
+
+        report = rigging_loads(event)
+        points = {pt['label']: pt for pt in report['points']}
+        self.assertTrue(points['R2']['over'])
+        self.assertFalse(points['R1']['over'])
+        truss = report['trusses'][[t['name'] for t in report['trusses']].index(stage['name'])]
+        fixtures = sum(kg for _, kg in stage['loads'])
+        self.assertAlmostEqual(truss['total_kg'], fixtures + TRUSS_KG_PER_M * truss['length'] + 2 * HOIST_KG, delta=0.5)
+        self.assertTrue(report['warnings'])
+
+        self.client.force_login(self.user)
+        response = self.client.get(f'/event/{event.pk}/tab/lighting/')
+        self.assertContains(response, '리깅 하중')
+        self.assertContains(response, 'R2')
+
+    def test_rigging_grid_rows_merge_into_one_support_per_x(self):
+        # 1m 격자 리깅 포인트: 트러스 선 ± 0.5m 두 줄이 같은 x 에 겹침
+        VenueFeature.objects.bulk_create([
+            VenueFeature(venue=self.venue, kind='rigging', x=x, y=y, capacity_kg=500, label=f'R{x}-{y}')
+            for x in range(5, 26) for y in (37.9, 38.9)
+        ])
+        event = Event.objects.get(pk=self.event.pk)
+        stage = [t for t in build_rig(event)['trusses'] if t['name'] != 'FOH 트러스'][0]
+        xs = [s['x'] for s in stage['supports']]
+        self.assertEqual(len(xs), len(set(xs)))
+        self.assertTrue(all(s['label'].endswith('-37.9') for s in stage['supports']))  # 트러스 선(38.35)에 가까운 줄
+
+        report = rigging_loads(event)
+        loads = [pt['load_kg'] for pt in report['points']]
+        self.assertTrue(np.isfinite(loads).all())
+        self.assertTrue(all(np.isfinite(t['max_moment']) for t in report['trusses']))
+
+    def test_coincident_supports_share_reaction(self):
+        reactions, _, _ = solve_beam([0, 5, 5, 10], [], [], 10, 0, 10)
+        np.testing.assert_allclose(reactions, [18.75, 31.25, 31.25, 18.75])
+
+
+class TabCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('tabs', password='pw')
+        self.event = Event.objects.create(author=self.user, title='캐시', date=date(2026, 9, 1))
+        self.client.force_login(self.user)
+        cache.clear()  # 롤백된 이전 테스트와 행사 id 가 겹치면 캐시가 남아 있음
+        # 탭별 계산 횟수 기록
+        self.builds = defaultdict(int)
+        for name, spec in TABS.items():
+            def counted(event, _name=name, _builder=spec['builder']):
+                self.builds[_name] += 1
+                return _builder(event)
+            self.addCleanup(spec.__setitem__, 'builder', spec['builder'])
+            spec['builder'] = counted
+
+    def tab(self, tab):
+        return self.client.get(f'/event/{self.event.pk}/tab/{tab}/').content.decode()
+
+    def test_task_and_cue_saves_invalidate_only_their_tab(self):
+        for tab in ('tasks', 'cues', 'space'):
+            self.tab(tab)
+        Task.objects.create(event=self.event, content='새 할일', deadline=date(2026, 8, 1))
+        self.assertIn('새 할일', self.tab('tasks'))
+        self.tab('cues')
+        self.tab('space')
+        self.assertEqual(dict(self.builds), {'tasks': 2, 'cues': 1, 'space': 1})
+
+        Cue.objects.create(event=self.event, order=ORDER_GAP, content='오프닝 영상')
+        self.assertIn('오프닝 영상', self.tab('cues'))
+        self.tab('tasks')
+        self.assertEqual(dict(self.builds), {'tasks': 2, 'cues': 2, 'space': 1})
+
+    def test_touch_sources_refreshes_signal_less_updates(self):
+        task = self.event.tasks.order_by('id').first()
+        self.tab('tasks')
+        Task.objects.filter(pk=task.pk).update(content='몰래 바꾼 할일')  # update() 는 시그널 없음
+        self.assertNotIn('몰래 바꾼 할일', self.tab('tasks'))             # 캐시 적중
+        touch_sources(self.event.pk, SOURCE_TASKS)
+        self.assertIn('몰래 바꾼 할일', self.tab('tasks'))
+
+    def test_listed_field_change_rebuilds_unrelated_edit_hits_cache(self):
+        get_tab_data(self.event, 'space')
+        self.event.client_name = '다른 고객사'  # 공간 탭이 읽지 않는 필드
+        self.event.save()
+        get_tab_data(self.event, 'space')
+        self.assertEqual(self.builds['space'], 1)
+
+        self.event.venue_width = self.event.venue_width + 5
+        self.event.save()
+        get_tab_data(self.event, 'space')
+        self.assertEqual(self.builds['space'], 2)
+        get_tab_data(self.event, 'space')
+        self.assertEqual(self.builds['space'], 2)
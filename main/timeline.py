@@ -0,0 +1,159 @@
+# ==========================================
+# 큐시트 타임라인 엔진
+# ==========================================
+# - 누적 시작 시각/총 러닝타임을 한 번의 순회로 계산
+# - Cue.order 는 간격을 둔 정렬 키(1024, 2048, ...)로 관리
+#   -> 중간 삽입/이동은 대부분 1개 행만 수정, 틈이 없을 때만 전체 재번호(bulk_update)
+# 화면과 엑셀의 'No' 는 order 값이 아니라 순번(1, 2, 3...)입니다.
+
+from datetime import datetime, timedelta
+
+from django.db import transaction
+
+from .models import Cue, Event
+from .realtime import cue_delta, cues_reordered
+from .search import index_objects
+from .tab_cache import SOURCE_CUES, touch_sources
+
+ORDER_GAP = 1024  # 재번호 시 키 간격 (연속 삽입 약 10회까지 재번호 없이 처리)
+BULK_BATCH = 500
+
+
+# ------------------------------------------
+# 1. 러닝타임 계산
+# ------------------------------------------
+
+def format_duration(seconds):
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def format_clock(seconds, start_time=None):
+    """start_time(datetime.time)이 있으면 실제 시각, 없으면 시작 기준 경과 시간"""
+    if start_time is None:
+        return format_duration(seconds)
+    return (datetime.combine(datetime.min, start_time) + timedelta(seconds=seconds)).strftime('%H:%M:%S')
+
+
+def build_timeline(cues, start_time=None):
+    """정렬된 큐 목록 -> 순번/시작/종료 시각 (O(N) 1회 순회)"""
+    rows = []
+    elapsed = 0
+    for no, cue in enumerate(cues, start=1):
+        duration = max(cue.duration or 0, 0)
+        rows.append({
+            'no': no,
+            'cue': cue,
+            'start': elapsed,
+            'end': elapsed + duration,
+            'start_label': format_clock(elapsed, start_time),
+        })
+        elapsed += duration
+
+    return {'rows': rows, 'total': elapsed, 'total_label': format_duration(elapsed)}
+
+
+def ordered_cues(event):
+    # (event, order) 인덱스 순서 그대로 읽음 / 같은 order 는 생성 순
+    return event.cue_set.order_by('order', 'id')
+
+
+# ------------------------------------------
+# 2. 정렬 키 관리 (삽입/이동/재번호)
+# ------------------------------------------
+
+def _ordered_keys(event):
+    return list(ordered_cues(event).values_list('id', 'order'))
+
+
+def _slot(keys, position, count):
+    """position(1부터) 자리에 count 개를 넣을 정렬 키 목록 (틈이 부족하면 None)"""
+    index = min(max(position, 1), len(keys) + 1) - 1
+    prev_key = keys[index - 1][1] if index > 0 else 0
+
+    if index == len(keys):  # 맨 뒤 추가
+        return [prev_key + ORDER_GAP * (i + 1) for i in range(count)]
+
+    step = (keys[index][1] - prev_key) / (count + 1)
+    if step < 1:
+        return None
+    return [prev_key + int(step * (i + 1)) for i in range(count)]
+
+
+def _lock_event(event):
+    # PostgreSQL 에서는 같은 행사의 동시 재정렬을 직렬화 (SQLite 는 IMMEDIATE 트랜잭션으로 대체)
+    Event.objects.select_for_update().filter(pk=event.pk).exists()
+
+
+def renumber(event, keys=None):
+    """현재 순서대로 order 를 ORDER_GAP 간격으로 재부여 (bulk_update 1회)"""
+    keys = _ordered_keys(event) if keys is None else keys
+    cues = [Cue(id=cue_id, order=(i + 1) * ORDER_GAP) for i, (cue_id, _) in enumerate(keys)]
+    Cue.objects.bulk_update(cues, ['order'], batch_size=BULK_BATCH)
+    touch_sources(event.id, SOURCE_CUES)
+    orders = [(cue.id, cue.order) for cue in cues]
+    cues_reordered(event.id, orders)  # bulk_update 는 시그널이 없음
+    return orders
+
+
+@transaction.atomic
+def insert_cues(event, cues, position=None):
+    """position 자리(없으면 맨 뒤)에 여러 큐를 연속으로 삽입 (bulk_create 1회)"""
+    cues = list(cues)
+    if not cues:
+        return cues
+    _lock_event(event)
+
+    keys = _ordered_keys(event)
+    if position is None:
+        position = len(keys) + 1
+    slot = _slot(keys, position, len(cues))
+    if slot is None:
+        keys = renumber(event, keys)
+        slot = _slot(keys, position, len(cues))
+
+    for cue, key in zip(cues, slot):
+        cue.event = event
+        cue.order = key
+    Cue.objects.bulk_create(cues, batch_size=BULK_BATCH)
+    index_objects('cue', cues)  # bulk_create 는 시그널이 없음
+    for cue in cues:
+        cue_delta(cue)
+    touch_sources(event.id, SOURCE_CUES)
+    return cues
+
+
+def insert_cue(event, cue, position=None):
+    return insert_cues(event, [cue], position)[0]
+
+
+@transaction.atomic
+def move_cue(cue, position):
+    """큐를 position(1부터) 자리로 이동 - 보통 해당 큐 1개 행만 수정"""
+    event = cue.event
+    _lock_event(event)
+
+    keys = [k for k in _ordered_keys(event) if k[0] != cue.id]
+    slot = _slot(keys, position, 1)
+    if slot is None:
+        keys = renumber(event, keys)
+        slot = _slot(keys, position, 1)
+
+    cue.order = slot[0]
+    Cue.objects.filter(pk=cue.pk).update(order=cue.order)
+    cue_delta(cue)
+    touch_sources(event.id, SOURCE_CUES)
+    return cue
+
+
+@transaction.atomic
+def reorder(event, cue_ids):
+    """전체 순서 지정 (cue_ids 순서대로, 목록에 없는 큐는 기존 순서로 뒤에 붙임)"""
+    _lock_event(event)
+    current = [cue_id for cue_id, _ in _ordered_keys(event)]
+    known = set(current)
+    wanted = [cue_id for cue_id in dict.fromkeys(cue_ids) if cue_id in known]
+    picked = set(wanted)
+    wanted += [cue_id for cue_id in current if cue_id not in picked]
+    return renumber(event, [(cue_id, None) for cue_id in wanted])
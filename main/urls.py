@@ -5,10 +5,14 @@ urlpatterns = [
     path('', views.index, name='index'),
     path('event/new/', views.event_create, name='event_create'),
     path('event/<int:event_id>/', views.detail, name='detail'),
+    # 💡 [신규] 탭 단위 조각 렌더링 (overview / space / audio / lighting / tasks / cues)
+    path('event/<int:event_id>/tab/<str:tab>/', views.detail_tab, name='detail_tab'),
     path('event/<int:event_id>/export/', views.export_excel, name='export_excel'),
     
     # [기존] 프로젝트 삭제 기능 주소
     path('event/<int:event_id>/delete/', views.event_delete, name='event_delete'),
+    # 💡 [신규] 프로젝트 복제
+    path('event/<int:event_id>/clone/', views.event_clone, name='event_clone'),
     
     # ▼▼▼ [E.O.S (Task) 관리 신규 URL 추가] ▼▼▼
     # Task 추가 주소: event_id를 사용하여 해당 이벤트에 Task를 연결
@@ -20,4 +24,47 @@ urlpatterns = [
 
     # ▼▼▼ [신규 추가] Task 수정 전용 URL ▼▼▼
     path('task/<int:task_id>/update/', views.task_update, name='task_update'),
-]
\ No newline at end of file
+
+    # 💡 [신규] 큐시트 순서 이동
+    path('cue/<int:cue_id>/move/', views.cue_move, name='cue_move'),
+
+    # 💡 [신규] 견적 비교 및 선정
+    path('event/<int:event_id>/bids/', views.bid_compare, name='bid_compare'),
+    path('quotation/<int:quotation_id>/select/', views.bid_select, name='bid_select'),
+    path('quotation/<int:quotation_id>/file/', views.quotation_file, name='quotation_file'),
+
+    # 💡 [신규] 발주서 일괄 생성 / PDF / ZIP 다운로드
+    path('event/<int:event_id>/po/generate/', views.po_generate, name='po_generate'),
+    path('event/<int:event_id>/po/zip/', views.po_zip, name='po_zip'),
+    path('po/<int:po_id>/pdf/', views.po_pdf, name='po_pdf'),
+
+    # 💡 [신규] 포트폴리오 재무 분석 (페이지 / JSON API)
+    path('portfolio/', views.portfolio, name='portfolio'),
+    path('api/portfolio/', views.portfolio_api, name='portfolio_api'),
+
+    # 💡 [신규] 마감 스캐너 (내 전체 행사 / 관리자는 전체)
+    path('deadlines/', views.deadlines, name='deadlines'),
+
+    # 💡 [신규] 선후행 일정 (Critical Path)
+    path('event/<int:event_id>/schedule/', views.schedule, name='schedule'),
+    path('dependency/<int:dependency_id>/delete/', views.dependency_delete, name='dependency_delete'),
+
+    # 💡 [신규] 장비 재고 / 예약 부족 현황
+    path('inventory/', views.inventory, name='inventory'),
+
+    # 💡 [신규] 통합 검색
+    path('search/', views.search, name='search'),
+
+    # 💡 [신규] 성능 계측 집계 (관리자 전용 JSON)
+    path('internal/perf/', views.perf_stats_api, name='perf_stats'),
+
+    # 💡 [신규] 라이브 큐 진행 (운영자 / 보기 전용 링크)
+    path('event/<int:event_id>/show/', views.show_caller, name='show_caller'),
+    path('event/<int:event_id>/show/control/', views.show_control, name='show_control'),
+    path('show/<str:token>/', views.show_view, name='show_view'),
+    path('show/<str:token>/state/', views.show_state_api, name='show_state'),
+
+    # 💡 [신규] 전시 부스 배치 / 참가사
+    path('event/<int:event_id>/booths/', views.booths, name='booths'),
+    path('exhibitor/<int:exhibitor_id>/delete/', views.exhibitor_delete, name='exhibitor_delete'),
+]
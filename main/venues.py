@@ -0,0 +1,166 @@
+# ==========================================
+# 공간 도면(Venue) 기하 / 좌석 충돌 검사
+# ==========================================
+# - 행사에 등록 공간(event.venue)이 있으면 외곽선 밖 / 기둥·고정 설치물 / 출입문 앞 확보 구역에 걸린 좌석을 제외
+# - 장애물이 수백 개여도 좌석당 검사량이 거의 일정하도록 격자 해시(GridIndex) 사용
+#   장애물 bbox 가 걸친 칸마다 (칸 키, 장애물 번호) 1행 -> 칸 키로 정렬
+#   좌석 bbox 의 칸 키를 searchsorted 로 찾아 같은 칸의 장애물과만 정밀 검사 (전부 배열 연산)
+# - 장애물 모양: 사각형(축 정렬) / 원형 (출입문은 문 폭 반지름의 원 = 문 앞 확보 구역)
+# - 외곽선은 다각형 (L자형 홀 등) - 좌석 꼭짓점이 모두 안쪽이고 외곽선 꼭짓점이 좌석 안에 없어야 함
+
+import numpy as np
+from matplotlib.path import Path
+
+GRID_CELL = 2.0   # 격자 해시 칸 크기 (m) - 좌석/기둥 크기 수준
+_KEY_OFFSET = 1 << 15
+_KEY_STRIDE = 1 << 16
+
+OBSTACLE_KINDS = ('column', 'fixed', 'door')  # 리깅 포인트는 천장 - 좌석 배치와 무관
+
+
+def venue_geometry(event):
+    """등록 공간의 외곽선 / 장애물 / 출입문 / 리깅 포인트 (공간이 없으면 None, 행사 객체에 1회만 조회)"""
+    if not event.venue_id:
+        return None
+    cached = getattr(event, '_venue_geometry', None)
+    if cached is not None and cached['venue_id'] == event.venue_id:
+        return cached
+    venue = event.venue
+    features = list(venue.features.all())
+    obstacles = [f for f in features if f.kind in OBSTACLE_KINDS]
+    geometry = {
+        'venue_id': venue.pk,
+        'outline': np.array(venue.outline, dtype=float) if len(venue.outline) >= 3 else None,
+        'obstacles': {
+            'kind': [f.kind for f in obstacles],
+            # 출입문: 문 폭을 반지름으로 하는 원 (문 앞 확보 구역)
+            'circle': np.array([f.kind == 'door' or f.shape == 'circle' for f in obstacles], dtype=bool),
+            'x': np.array([f.x for f in obstacles], dtype=float),
+            'y': np.array([f.y for f in obstacles], dtype=float),
+            'w': np.array([f.width * 2 if f.kind == 'door' else f.width for f in obstacles], dtype=float),
+            'd': np.array([f.width * 2 if f.kind == 'door' else (f.width if f.shape == 'circle' else f.depth)
+                           for f in obstacles], dtype=float),
+        },
+        'doors': [{'x': f.x, 'y': f.y, 'width': f.width} for f in features if f.kind == 'door'],
+        'rigging': [{'x': f.x, 'y': f.y, 'capacity_kg': f.capacity_kg, 'label': f.label}
+                    for f in features if f.kind == 'rigging'],
+    }
+    event._venue_geometry = geometry
+    return geometry
+
+
+def obstacle_boxes(obstacles):
+    """장애물 bbox (M, 4) [x0, y0, x1, y1] - x, y 는 중심"""
+    x, y, w, d = obstacles['x'], obstacles['y'], obstacles['w'], obstacles['d']
+    return np.column_stack([x - w / 2, y - d / 2, x + w / 2, y + d / 2])
+
+
+# ------------------------------------------
+# 1. 격자 해시 공간 색인
+# ------------------------------------------
+
+def _box_cells(boxes, cell):
+    """bbox 마다 걸친 칸 -> (bbox 번호, 칸 키) 배열 쌍"""
+    lo = np.floor(boxes[:, :2] / cell).astype(np.int64)
+    hi = np.floor(boxes[:, 2:] / cell).astype(np.int64)
+    ni, nj = hi[:, 1] - lo[:, 1] + 1, hi[:, 0] - lo[:, 0] + 1
+    counts = ni * nj
+    owner = np.repeat(np.arange(len(boxes)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ii = lo[owner, 1] + local // nj[owner]
+    jj = lo[owner, 0] + local % nj[owner]
+    return owner, (ii + _KEY_OFFSET) * _KEY_STRIDE + (jj + _KEY_OFFSET)
+
+
+class GridIndex:
+    """격자 해시 - 축 정렬 bbox 목록을 칸 단위로 등록하고, 질의 bbox 와 같은 칸에 있는 후보 쌍을 돌려줌"""
+
+    def __init__(self, boxes, cell=GRID_CELL):
+        self.cell = cell
+        self.size = len(boxes)
+        owner, keys = _box_cells(np.asarray(boxes, dtype=float).reshape(-1, 4), cell)
+        order = np.argsort(keys, kind='stable')
+        self.keys, self.ids = keys[order], owner[order]
+
+    def pairs(self, boxes):
+        """질의 bbox (N, 4) -> (질의 번호, 등록 번호) 후보 쌍 (중복 제거)"""
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        if not self.size or not len(boxes):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        query, keys = _box_cells(boxes, self.cell)
+        start = np.searchsorted(self.keys, keys, 'left')
+        hits = np.searchsorted(self.keys, keys, 'right') - start
+        local = np.arange(hits.sum()) - np.repeat(np.cumsum(hits) - hits, hits)
+        ids = self.ids[np.repeat(start, hits) + local]
+        codes = np.unique(np.repeat(query, hits) * self.size + ids)
+        return codes // self.size, codes % self.size
+
+
+# ------------------------------------------
+# 2. 좌석 충돌 검사
+# ------------------------------------------
+
+def _seat_shapes(layout):
+    """좌석 중심 / 반 크기 (사각형) 또는 반지름 (원형 테이블은 의자 포함 점유 반지름)"""
+    if layout['shape'] == 'rect':
+        hw, hd = layout['unit_w'] / 2, layout['unit_d'] / 2
+        return layout['x'] + hw, layout['y'] + hd, hw, hd
+    r = layout['occupied_radius']
+    return layout['x'], layout['y'], r, r
+
+
+def _overlaps(layout, seat, obstacles, obs):
+    """후보 쌍마다 정밀 검사 (좌석 사각형/원 x 장애물 사각형/원)"""
+    sx, sy, hw, hd = _seat_shapes(layout)
+    sx, sy = sx[seat], sy[seat]
+    ox, oy = obstacles['x'][obs], obstacles['y'][obs]
+    ow, od = obstacles['w'][obs] / 2, obstacles['d'][obs] / 2
+    circle = obstacles['circle'][obs]
+    gap_x, gap_y = np.abs(sx - ox), np.abs(sy - oy)
+
+    if layout['shape'] == 'rect':
+        # 사각형-사각형: 두 축 모두 겹침 / 사각형-원: 원 중심에서 사각형까지 최단거리 < 반지름
+        box_hit = (gap_x < hw + ow) & (gap_y < hd + od)
+        nx, ny = np.maximum(gap_x - hw, 0), np.maximum(gap_y - hd, 0)
+        circle_hit = nx ** 2 + ny ** 2 < ow ** 2
+    else:
+        # 원-사각형: 좌석 원 중심에서 장애물 사각형까지 / 원-원: 중심 거리 < 반지름 합
+        nx, ny = np.maximum(gap_x - ow, 0), np.maximum(gap_y - od, 0)
+        box_hit = nx ** 2 + ny ** 2 < hw ** 2
+        circle_hit = gap_x ** 2 + gap_y ** 2 < (hw + ow) ** 2
+    return np.where(circle, circle_hit, box_hit)
+
+
+def _inside_outline(layout, outline):
+    """좌석이 외곽선 다각형 안에 완전히 들어가는지"""
+    sx, sy, hw, hd = _seat_shapes(layout)
+    if layout['shape'] == 'rect':
+        ox, oy = np.array([-hw, hw, hw, -hw]), np.array([-hd, -hd, hd, hd])
+    else:
+        angles = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+        ox, oy = hw * np.cos(angles), hw * np.sin(angles)
+    points = np.column_stack([(sx[:, None] + ox).ravel(), (sy[:, None] + oy).ravel()])
+    inside = Path(outline).contains_points(points).reshape(len(sx), -1).all(axis=1)
+    # 오목한 모서리(L자 안쪽 꼭짓점)가 좌석 안으로 들어오는 경우
+    vx, vy = outline[:, 0], outline[:, 1]
+    poke = ((np.abs(vx[None, :] - sx[:, None]) < hw) & (np.abs(vy[None, :] - sy[:, None]) < hd)).any(axis=1)
+    return inside & ~poke
+
+
+def seat_collisions(layout, geometry):
+    """좌석별 배치 불가 여부 (True = 제외) - seat_layout 순서"""
+    n = len(layout['x'])
+    blocked = np.zeros(n, dtype=bool)
+    if not n or geometry is None:
+        return blocked
+    if geometry['outline'] is not None:
+        blocked |= ~_inside_outline(layout, geometry['outline'])
+
+    obstacles = geometry['obstacles']
+    if len(obstacles['x']):
+        sx, sy, hw, hd = _seat_shapes(layout)
+        seat_boxes = np.column_stack([sx - hw, sy - hd, sx + hw, sy + hd])
+        seat, obs = GridIndex(obstacle_boxes(obstacles)).pairs(seat_boxes)
+        hit = _overlaps(layout, seat, obstacles, obs)
+        blocked[seat[hit]] = True
+    return blocked
@@ -1,15 +1,33 @@
 from django.shortcuts import render, get_object_or_404, redirect, resolve_url
-from django.http import HttpResponse
-from .models import Event, Task, Vendor, Quotation, PurchaseOrder
-from .forms import CueForm, EventForm, TaskForm, EventOverviewForm, EventSpaceForm
+from django.http import HttpResponse, FileResponse, JsonResponse, StreamingHttpResponse
+from .models import Event, Cue, Exhibitor, Task, TaskDependency, Vendor, Quotation, PurchaseOrder, Equipment, ShowRun, SEARCH_KINDS
+from .forms import CueForm, EventForm, TaskForm, EventOverviewForm, EventSpaceForm, EventCloneForm, ExhibitorForm
 from django.contrib.auth.forms import UserCreationForm 
 from django.contrib.auth import login 
-from .calculators import calculate_space, calculate_audio, LightingEngine, draw_space, draw_audio, draw_light
+from .tabs import render_tab
+from .timeline import build_timeline, insert_cue, move_cue, ordered_cues
+from .procurement import bid_summary, vendor_win_rates, select_bid
+from .purchase_orders import generate_purchase_orders, ensure_pdfs, po_filename, stream_zip
+from .storage import blob_response
+from .analytics import GROUP_FIELDS, parse_group, portfolio_summary
+from .deadlines import DEFAULT_DAYS, deadline_board
+from .cloning import clone_event
+from .inventory import shortfall_report
+from .search import search_documents
+from .instrumentation import stats as perf_stats
+from .showcall import control as show_control_action, get_run as get_show_run, show_state
+from .booths import pack_booths
+from .calculators import draw_booths
+from .schedule import ScheduleCycleError, add_dependency, event_schedule, remove_dependency, reschedule, shift_deadlines
 from django.contrib.auth.decorators import login_required
-from django.db.models import Sum, Case, When, Value, IntegerField
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
 import pandas as pd
+import os
 import urllib.parse
-from datetime import date 
+import time
+from datetime import date, datetime, timedelta
 
 # 1. 메인 대시보드
 @login_required
@@ -32,6 +50,7 @@ def event_create(request):
     return render(request, 'main/event_form.html', {'form': form})
 
 # 3. 상세 페이지 (통합 상황실 & 솔루션 모드)
+# 💡 [수정] 페이지 껍데기(헤더/탭 메뉴)만 렌더링하고, 탭 내용은 detail_tab 으로 필요할 때 가져옴
 @login_required
 def detail(request, event_id):
     event = get_object_or_404(Event, pk=event_id)
@@ -39,18 +58,29 @@ def detail(request, event_id):
     if event.author != request.user:
         return HttpResponse("이 프로젝트를 볼 권한이 없습니다.", status=403)
     
-    overview_form = EventOverviewForm(instance=event)
-    space_form = EventSpaceForm(instance=event)
-    cue_form = CueForm()
-    task_form = TaskForm() 
+    # 폼 검증 실패 시 오류가 담긴 탭은 바로 렌더링해서 내려줌
+    preloaded = {}
+    active_tab = 'tab1'
 
     if request.method == 'POST':
         # [Tab 1] 개요 저장 -> #tab1 유지
         if 'update_overview' in request.POST:
-            overview_form = EventOverviewForm(request.POST, instance=event)
-            if overview_form.is_valid():
-                overview_form.save()
+            # 💡 [수정] 행사 행을 잠그고 저장 + 마감일 이동을 한 트랜잭션으로
+            #    (이동이 실패하면 행사일도 롤백 / 동시 수정은 잠금 뒤 최신 행사일 기준으로 이동)
+            with transaction.atomic():
+                locked = Event.objects.select_for_update().get(pk=event.pk)
+                old_date = locked.date  # is_valid() 가 instance 값을 바꾸므로 미리 보관
+                overview_form = EventOverviewForm(request.POST, instance=locked)
+                saved = overview_form.is_valid()
+                if saved:
+                    overview_form.save()
+                    # 💡 행사일이 바뀌면 Task 마감일을 같은 일수만큼 일괄 이동 (UPDATE 1회)
+                    if locked.date != old_date:
+                        shift_deadlines(locked, locked.date - old_date,
+                                        include_done=overview_form.cleaned_data['shift_done_tasks'])
+            if saved:
                 return redirect(resolve_url('detail', event_id=event.id) + '#tab1')
+            preloaded['overview'] = render_tab(request, event, 'overview', {'overview_form': overview_form})
         
         # [Tab 2] 공간 설계 저장 -> #tab2 유지
         elif 'update_space' in request.POST:
@@ -58,100 +88,52 @@ def detail(request, event_id):
             if space_form.is_valid():
                 space_form.save()
                 return redirect(resolve_url('detail', event_id=event.id) + '#tab2')
+            preloaded['space'] = render_tab(request, event, 'space', {'space_form': space_form})
+            active_tab = 'tab2'
 
         # [Tab 5] 큐시트 저장 -> #tab5 유지
         elif 'save_cue' in request.POST:
             cue_form = CueForm(request.POST)
             if cue_form.is_valid():
                 cue = cue_form.save(commit=False)
-                cue.event = event
-                cue.save()
+                # 💡 입력한 No. 자리에 끼워 넣기 (뒤따르는 큐 번호를 손으로 고칠 필요 없음)
+                insert_cue(event, cue, position=cue_form.cleaned_data['order'])
                 return redirect(resolve_url('detail', event_id=event.id) + '#tab5')
+            preloaded['cues'] = render_tab(request, event, 'cues', {'form': cue_form})
+            active_tab = 'tab5'
 
-    # --- 대시보드 계산 로직 ---
-    today = date.today()
-    d_day = (event.date - today).days
-    
-    total_tasks = event.tasks.count()
-    done_tasks = event.tasks.filter(is_done=True).count()
-    progress = int((done_tasks / total_tasks) * 100) if total_tasks > 0 else 0
-        
-    total_task_budget = event.tasks.aggregate(total=Sum('planned_budget'))['total'] or 0
-    budget = event.budget if event.budget is not None else 0
-    cost = total_task_budget 
-    profit = budget - cost
-    
-    try:
-        profit_rate = round((profit / budget) * 100, 1) if budget > 0 else 0.0
-    except (TypeError, ZeroDivisionError):
-        profit_rate = 0.0
+    # 기본 탭(상황실)은 캐시된 데이터로 바로 채워서 첫 화면 깜빡임 방지
+    if 'overview' not in preloaded:
+        preloaded['overview'] = render_tab(request, event, 'overview', _tab_forms(event, 'overview'))
 
-    fmt_budget = f"{budget:,}"
-    fmt_cost = f"{cost:,}"
-    fmt_profit = f"{profit:,}"
-
-    # === [데이터 가져오기: 정렬 로직 강화 (구버전 호환)] ===
-    # 💡 과거 데이터(소문자)와 신규 데이터(대문자)를 모두 같은 순위로 묶어줍니다.
-    
-    phase_ordering = Case(
-        # 1. 기획 (PLANNING, planning, admin) -> 0순위
-        When(task_category__in=['PLANNING', 'planning', 'admin'], then=Value(0)),
-        
-        # 2. 디자인 (DESIGN, design) -> 1순위
-        When(task_category__in=['DESIGN', 'design'], then=Value(1)),
-        
-        # 3. 제작/준비 (PREPARATION) -> 2순위
-        When(task_category__in=['PREPARATION', 'preparation'], then=Value(2)),
-        
-        # 4. 실행/현장 (EXECUTION, execution) -> 3순위
-        When(task_category__in=['EXECUTION', 'execution'], then=Value(3)),
-        
-        # 5. 정산/마감 (CLOSING, settlement) -> 4순위
-        When(task_category__in=['CLOSING', 'settlement'], then=Value(4)),
-        
-        default=Value(99), # 기타 -> 맨 뒤
-        output_field=IntegerField(),
-    )
-    
-    # 정렬 적용: 순위(order_rank) -> 마감일(deadline)
-    tasks = event.tasks.all().annotate(order_rank=phase_ordering).order_by('order_rank', 'deadline')
-    
-    cues = event.cue_set.all().order_by('order')
-    
-    # --- 시각화 엔진 ---
-    space_report = calculate_space(event)
-    graph_space = draw_space(event)
-    audio_report = calculate_audio(event)
-    graph_audio = draw_audio(event, audio_report['specs'])
-    l_engine = LightingEngine(event)
-    light_patch, light_power, light_layout, gen_info = l_engine.get_patch_data() 
-    graph_light = draw_light(event, light_layout)
-    
     return render(request, 'main/detail.html', {
-        'event': event, 
-        'd_day': d_day, 
-        'progress': progress,
-        'fmt_budget': fmt_budget, 
-        'fmt_cost': fmt_cost, 
-        'fmt_profit': fmt_profit,
-        'profit_rate': profit_rate, 
-        'profit_raw': profit,
-        'overview_form': overview_form, 
-        'space_form': space_form,
-        'task_form': task_form, 
-        'form': cue_form,
-        'tasks': tasks, 
-        'cues': cues, 
-        'space': space_report, 
-        'audio': audio_report,
-        'light_patch': light_patch, 
-        'light_power': light_power, 
-        'gen_info': gen_info,
-        'graph_space': graph_space, 
-        'graph_audio': graph_audio, 
-        'graph_light': graph_light
+        'event': event,
+        'preloaded': preloaded,
+        'active_tab': active_tab,
     })
 
+# 3-1. 탭 단위 조각(fragment) 렌더링
+def _tab_forms(event, tab):
+    """탭에 들어가는 입력 폼 (폼은 CSRF 토큰 때문에 캐시하지 않음)"""
+    if tab == 'overview':
+        return {'overview_form': EventOverviewForm(instance=event)}
+    if tab == 'space':
+        return {'space_form': EventSpaceForm(instance=event)}
+    if tab == 'tasks':
+        return {'task_form': TaskForm()}
+    if tab == 'cues':
+        return {'form': CueForm()}
+    return {}
+
+@login_required
+def detail_tab(request, event_id, tab):
+    event = get_object_or_404(Event, pk=event_id)
+
+    if event.author != request.user:
+        return HttpResponse("이 프로젝트를 볼 권한이 없습니다.", status=403)
+
+    return HttpResponse(render_tab(request, event, tab, _tab_forms(event, tab)))
+
 # ----------------------------------------------------------------------------------
 # ▼▼▼ Task 관련 함수 (탭 위치 유지: #tab4) ▼▼▼
 # ----------------------------------------------------------------------------------
@@ -170,6 +152,7 @@ def task_add(request, event_id):
         task = form.save(commit=False)
         task.event = event
         task.save()
+        reschedule(event, [task.id])
         
         total_task_budget = event.tasks.aggregate(total=Sum('planned_budget'))['total'] or 0
         event.expected_cost = total_task_budget 
@@ -187,9 +170,13 @@ def task_delete(request, task_id):
         return HttpResponse("권한이 없습니다.", status=403) 
         
     event_id = task.event.id
+    # 💡 선후행으로 연결된 Task 는 삭제 후 일정 재계산 대상
+    neighbors = list(task.successor_links.values_list('successor_id', flat=True)) + \
+        list(task.predecessor_links.values_list('predecessor_id', flat=True))
     task.delete()
     
     event = get_object_or_404(Event, pk=event_id)
+    reschedule(event, neighbors)
     total_task_budget = event.tasks.aggregate(total=Sum('planned_budget'))['total'] or 0
     event.expected_cost = total_task_budget 
     event.save(update_fields=['expected_cost'])
@@ -223,6 +210,8 @@ def task_update(request, task_id):
             task = form.save()
             
             event = task.event
+            if 'duration_days' in form.changed_data:
+                reschedule(event, [task.id])
             total_task_budget = event.tasks.aggregate(total=Sum('planned_budget'))['total'] or 0
             event.expected_cost = total_task_budget 
             event.save(update_fields=['expected_cost']) 
@@ -249,16 +238,42 @@ def event_delete(request, event_id):
         return redirect('index')
     return redirect('index')
 
+# 8-1. 프로젝트 복제 (Task 계층 / 선후행 / 큐시트 포함, 새 날짜 기준으로 마감일 이동)
+@login_required
+def event_clone(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        form = EventCloneForm(request.POST)
+        if form.is_valid():
+            clone = clone_event(
+                event, form.cleaned_data['date'], title=form.cleaned_data['title'],
+                author=request.user, include_vendors=form.cleaned_data['include_vendors'],
+            )
+            return redirect('detail', event_id=clone.id)
+    else:
+        try:
+            next_year = event.date.replace(year=event.date.year + 1)
+        except ValueError:  # 2월 29일
+            next_year = event.date.replace(year=event.date.year + 1, day=28)
+        form = EventCloneForm(initial={'title': f"{event.title} (복제)", 'date': next_year})
+    return render(request, 'main/event_clone.html', {'form': form, 'event': event})
+
 # 9. 엑셀 다운로드
 def export_excel(request, event_id):
     event = get_object_or_404(Event, pk=event_id)
-    cues = event.cue_set.all().order_by('order').values('order', 'content', 'duration', 'bgm', 'action')
+    timeline = build_timeline(ordered_cues(event))
     
-    if not cues:
+    if not timeline['rows']:
         return HttpResponse("저장된 큐시트가 없습니다.", status=400)
 
-    df = pd.DataFrame(list(cues))
-    df.columns = ['No', '진행 내용', '시간(초)', 'BGM', 'Action']
+    df = pd.DataFrame([
+        [row['no'], row['start_label'], row['cue'].content, row['cue'].duration, row['cue'].bgm, row['cue'].action]
+        for row in timeline['rows']
+    ])
+    df.columns = ['No', '시작', '진행 내용', '시간(초)', 'BGM', 'Action']
     
     response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
     filename = f"CueSheet_{event.title}.xlsx"
@@ -268,6 +283,341 @@ def export_excel(request, event_id):
     df.to_excel(response, index=False)
     return response
 
+# 9-1. 큐 순서 이동 (#tab5 유지)
+@login_required
+def cue_move(request, cue_id):
+    cue = get_object_or_404(Cue.objects.select_related('event'), pk=cue_id)
+    if cue.event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        try:
+            position = int(request.POST.get('position', ''))
+        except ValueError:
+            position = None
+        if position is not None:
+            move_cue(cue, position)
+
+    return redirect(resolve_url('detail', event_id=cue.event.id) + '#tab5')
+
+# 9-2. 견적 비교 (조달 상황판)
+@login_required
+def bid_compare(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    summary = bid_summary(event)
+    win_rates = vendor_win_rates(event)
+    for task_summary in summary.values():
+        for bid in task_summary['bids']:
+            bid['win'] = win_rates.get(bid['vendor_id'])
+
+    tasks = event.tasks.filter(pk__in=summary.keys()).select_related('vendor').order_by('phase_rank', 'deadline')
+    orders = PurchaseOrder.objects.filter(task__event=event).select_related('task', 'vendor').order_by('id')
+    return render(request, 'main/bids.html', {
+        'event': event,
+        'rows': [(task, summary[task.id]) for task in tasks],
+        'orders': orders,
+    })
+
+# 9-3. 견적 선정 -> Task 조달 상태/실지출 자동 반영
+@login_required
+def bid_select(request, quotation_id):
+    quotation = get_object_or_404(Quotation.objects.select_related('task__event'), pk=quotation_id)
+    event = quotation.task.event
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        select_bid(quotation)
+    return redirect('bid_compare', event_id=event.id)
+
+# 9-3-1. 견적 첨부파일 다운로드 (Range 요청 / ETag 지원)
+@login_required
+def quotation_file(request, quotation_id):
+    quotation = get_object_or_404(Quotation.objects.select_related('task__event', 'vendor'), pk=quotation_id)
+    if quotation.task.event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+    if not quotation.file:
+        return HttpResponse("첨부된 파일이 없습니다.", status=404)
+
+    ext = os.path.splitext(quotation.file.name)[1]
+    vendor_name = quotation.vendor.name if quotation.vendor else '업체'
+    return blob_response(request, quotation.file, f"견적서_{vendor_name}_{quotation.task.content}{ext}")
+
+# 9-4. 발주서 일괄 생성 (계약 완료된 외주 Task 전체)
+@login_required
+def po_generate(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        generate_purchase_orders(event)
+    return redirect('bid_compare', event_id=event.id)
+
+# 9-5. 발주서 PDF 다운로드 (내용 해시 캐시 -> 재다운로드 시 렌더링 없음)
+@login_required
+def po_pdf(request, po_id):
+    po = get_object_or_404(PurchaseOrder.objects.select_related('task__event', 'vendor'), pk=po_id)
+    if po.task.event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    [(po, path)] = ensure_pdfs([po])
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=po_filename(po), content_type='application/pdf')
+
+# 9-6. 발주서 ZIP 일괄 다운로드 (스트리밍)
+@login_required
+def po_zip(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    orders = PurchaseOrder.objects.filter(task__event=event).select_related('task__event', 'vendor').order_by('id')
+    if not orders:
+        return HttpResponse("생성된 발주서가 없습니다.", status=400)
+
+    entries = [(po_filename(po), path) for po, path in ensure_pdfs(orders)]
+    response = StreamingHttpResponse(stream_zip(entries), content_type='application/zip')
+    quoted_filename = urllib.parse.quote(f"PO_{event.title}.zip".encode('utf-8'))
+    response['Content-Disposition'] = f'attachment; filename*=UTF-8\'\'{quoted_filename}'
+    return response
+
+# 9-7. 포트폴리오 재무 분석 (월 / 유형 / 상태 / 클라이언트별 매출·지출·마진)
+def _portfolio_params(request):
+    def month(value):
+        try:
+            return datetime.strptime(value, '%Y-%m').date()
+        except (TypeError, ValueError):
+            return None
+
+    filters = {
+        'start': month(request.GET.get('start')),
+        'end': month(request.GET.get('end')),
+        'event_type': request.GET.get('event_type', ''),
+        'status': request.GET.get('status', ''),
+        'client_name': request.GET.get('client_name', ''),
+    }
+    return parse_group(request.GET.get('group')), filters
+
+@login_required
+def portfolio(request):
+    group, filters = _portfolio_params(request)
+    return render(request, 'main/portfolio.html', {
+        'data': portfolio_summary(request.user.id, group, filters),
+        'group': group,
+        'group_fields': GROUP_FIELDS,
+        'query': request.GET,
+    })
+
+@login_required
+def portfolio_api(request):
+    group, filters = _portfolio_params(request)
+    return JsonResponse(portfolio_summary(request.user.id, group, filters), json_dumps_params={'ensure_ascii': False})
+
+# 9-8. 마감 스캐너 (전체 행사의 지연 / 임박 Task)
+# 💡 scope=all 은 관리자(staff)만 - 전체 사용자의 Task 를 봄
+@login_required
+def deadlines(request):
+    try:
+        days = min(max(int(request.GET.get('days', DEFAULT_DAYS)), 0), 90)
+    except ValueError:
+        days = DEFAULT_DAYS
+    shop_wide = request.GET.get('scope') == 'all' and request.user.is_staff
+    board = deadline_board(None if shop_wide else request.user, days=days)
+    return render(request, 'main/deadlines.html', {'board': board, 'shop_wide': shop_wide})
+
+# 9-9. 선후행 일정 (Critical Path)
+@login_required
+def schedule(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    error = None
+    if request.method == 'POST':
+        tasks = event.tasks.all()
+        try:
+            predecessor = tasks.get(pk=request.POST.get('predecessor'))
+            successor = tasks.get(pk=request.POST.get('successor'))
+            add_dependency(predecessor, successor, int(request.POST.get('lag_days') or 0))
+            return redirect('schedule', event_id=event.id)
+        except (Task.DoesNotExist, ValueError) as e:
+            # ScheduleCycleError 도 ValueError
+            error = str(e) if isinstance(e, ScheduleCycleError) else "선행/후행 Task 를 다시 확인해 주세요."
+
+    try:
+        plan = event_schedule(event)
+    except ScheduleCycleError as e:
+        plan, error = None, str(e)
+
+    return render(request, 'main/schedule.html', {
+        'event': event,
+        'plan': plan,
+        'error': error,
+        'tasks': event.tasks.order_by('phase_rank', 'deadline'),
+        'dependencies': TaskDependency.objects.filter(successor__event=event).select_related('predecessor', 'successor'),
+    })
+
+@login_required
+def dependency_delete(request, dependency_id):
+    dependency = get_object_or_404(TaskDependency.objects.select_related('successor__event'), pk=dependency_id)
+    event = dependency.successor.event
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        remove_dependency(dependency)
+    return redirect('schedule', event_id=event.id)
+
+# 9-10. 장비 재고 / 예약 부족 현황 (전체 행사 기준 - 창고는 공용)
+@login_required
+def inventory(request):
+    def day(value, default):
+        try:
+            return date.fromisoformat(value)
+        except (TypeError, ValueError):
+            return default
+
+    start = day(request.GET.get('start'), date.today())
+    end = day(request.GET.get('end'), start + timedelta(days=90))
+    event = None
+    if request.GET.get('event'):
+        event = get_object_or_404(Event, pk=request.GET['event'], author=request.user)
+
+    shortfalls = shortfall_report(start, end, event)
+    equipment = {e.id: e for e in Equipment.objects.order_by('category', 'name')}
+    my_events = dict(Event.objects.filter(author=request.user).values_list('id', 'title'))
+    for s in shortfalls:
+        s['equipment'] = equipment[s['equipment_id']]
+        # 다른 사용자의 행사는 제목 대신 건수만 표시
+        s['my_events'] = [(eid, my_events[eid]) for eid in s['event_ids'] if eid in my_events]
+        s['other_count'] = len(s['event_ids']) - len(s['my_events'])
+
+    return render(request, 'main/inventory.html', {
+        'start': start, 'end': end, 'event': event,
+        'equipment': equipment.values(),
+        'shortfalls': shortfalls,
+    })
+
+# 9-11. 통합 검색 (행사 / Task / 업체 / 큐시트)
+# 💡 내 행사와 그 Task·큐, 공용 업체만 검색됨 (전문 색인 순위순)
+@login_required
+def search(request):
+    query = request.GET.get('q', '').strip()
+    kinds = request.GET.getlist('kind')
+    started = time.perf_counter()
+    results = search_documents(request.user, query, kinds) if query else []
+    return render(request, 'main/search.html', {
+        'query': query,
+        'kinds': kinds,
+        'kind_choices': SEARCH_KINDS,
+        'results': results,
+        'elapsed_ms': (time.perf_counter() - started) * 1000,
+    })
+
+# 9-12. 성능 계측 집계 (내부용 - 관리자만)
+# 💡 뷰별 p50/p95/p99 (ms) - 이 워커 프로세스가 계측한 표본 기준
+@login_required
+def perf_stats_api(request):
+    if not request.user.is_staff:
+        return HttpResponse("권한이 없습니다.", status=403)
+    if request.method == 'POST' and 'reset' in request.POST:
+        perf_stats.reset()
+    return JsonResponse({
+        'pid': os.getpid(),
+        'sample_rate': settings.PERF_SAMPLE_RATE,
+        'window': perf_stats.window,
+        'views': perf_stats.snapshot(),
+    }, json_dumps_params={'ensure_ascii': False})
+
+# 9-13. 라이브 큐 진행 (운영자 화면 / 조작)
+# 💡 운영자가 넘긴 큐는 WebSocket 으로 모든 진행 화면에 즉시 전달 (main/showcall.py)
+@login_required
+def show_caller(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    run = get_show_run(event)
+    run.event = event
+    return render(request, 'main/show.html', {
+        'event': event,
+        'run': run,
+        'state': show_state(run),
+        'operator': True,
+        'viewer_url': request.build_absolute_uri(resolve_url('show_view', token=run.viewer_token)),
+    })
+
+@login_required
+def show_control(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+    if request.method != 'POST':
+        return HttpResponse(status=405)
+
+    try:
+        cue_id = int(request.POST['cue']) if request.POST.get('cue') else None
+        state = show_control_action(event, request.POST.get('action', ''), cue_id)
+    except (ValueError, Cue.DoesNotExist) as e:
+        return JsonResponse({'error': str(e)}, status=400, json_dumps_params={'ensure_ascii': False})
+    return JsonResponse(state, json_dumps_params={'ensure_ascii': False})
+
+# 9-14. 라이브 진행 화면 (무대감독 / FOH / 조명 콘솔 - 로그인 없이 링크로 보기 전용)
+def show_view(request, token):
+    run = get_object_or_404(ShowRun.objects.select_related('event'), viewer_token=token)
+    return render(request, 'main/show.html', {
+        'event': run.event,
+        'run': run,
+        'state': show_state(run),
+        'operator': False,
+    })
+
+def show_state_api(request, token):
+    run = get_object_or_404(ShowRun.objects.select_related('event'), viewer_token=token)
+    return JsonResponse(show_state(run), json_dumps_params={'ensure_ascii': False})
+
+# 9-15. 전시 부스 배치 (참가사 등록 -> 우선순위 순 자동 배정 / 배치도)
+@login_required
+def booths(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        form = ExhibitorForm(request.POST)
+        if form.is_valid():
+            exhibitor = form.save(commit=False)
+            exhibitor.event = event
+            exhibitor.save()
+            return redirect('booths', event_id=event.id)
+    else:
+        form = ExhibitorForm()
+
+    exhibitors = list(event.exhibitors.order_by('priority', 'id'))
+    plan = pack_booths(event, exhibitors)
+    assigned = {b['exhibitor_id']: b['no'] for b in plan['booths'] if b['exhibitor_id']}
+    return render(request, 'main/booths.html', {
+        'event': event,
+        'form': form,
+        'plan': plan,
+        'chart': draw_booths(event, plan),
+        'rows': [(exhibitor, assigned.get(exhibitor.id)) for exhibitor in exhibitors],
+    })
+
+@login_required
+def exhibitor_delete(request, exhibitor_id):
+    exhibitor = get_object_or_404(Exhibitor.objects.select_related('event'), pk=exhibitor_id)
+    event = exhibitor.event
+    if event.author != request.user:
+        return HttpResponse("권한이 없습니다.", status=403)
+
+    if request.method == 'POST':
+        exhibitor.delete()
+    return redirect('booths', event_id=event.id)
+
 # 10. 회원가입
 def signup(request):
     if request.method == 'POST':